@@ -0,0 +1,28 @@
+"""index updated_at for incremental influencer index refresh
+
+Revision ID: 5b2e8c1d9f3a
+Revises: add_instagram_fields
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b2e8c1d9f3a'
+down_revision: Union[str, None] = 'add_instagram_fields'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Recommendation index refreshes only read rows changed since its watermark
+    op.create_index(op.f('ix_influencer_profiles_updated_at'), 'influencer_profiles', ['updated_at'], unique=False)
+    op.create_index(op.f('ix_users_updated_at'), 'users', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_users_updated_at'), table_name='users')
+    op.drop_index(op.f('ix_influencer_profiles_updated_at'), table_name='influencer_profiles')
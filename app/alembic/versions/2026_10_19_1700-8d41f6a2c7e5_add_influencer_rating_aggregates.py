@@ -0,0 +1,32 @@
+"""add running rating aggregates to influencer profiles
+
+Revision ID: 8d41f6a2c7e5
+Revises: 5b2e8c1d9f3a
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d41f6a2c7e5'
+down_revision: Union[str, None] = '5b2e8c1d9f3a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('influencer_profiles', sa.Column('rating_sum', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('influencer_profiles', sa.Column('rating_count', sa.Integer(), server_default='0', nullable=False))
+    # Rating-sorted explorer search
+    op.create_index(op.f('ix_influencer_profiles_average_rating'), 'influencer_profiles', ['average_rating'], unique=False)
+    # Existing profiles are backfilled by scripts/reconcile_reputation.py
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_influencer_profiles_average_rating'), table_name='influencer_profiles')
+    op.drop_column('influencer_profiles', 'rating_count')
+    op.drop_column('influencer_profiles', 'rating_sum')
@@ -0,0 +1,68 @@
+"""add insights snapshots and rollups time series
+
+Revision ID: c3a9e7b15d20
+Revises: 8d41f6a2c7e5
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a9e7b15d20'
+down_revision: Union[str, None] = '8d41f6a2c7e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('insight_snapshots',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('profile_id', sa.Integer(), nullable=False),
+    sa.Column('network', sa.String(length=20), nullable=False),
+    sa.Column('captured_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('followers', sa.Integer(), nullable=True),
+    sa.Column('following', sa.Integer(), nullable=True),
+    sa.Column('posts_count', sa.Integer(), nullable=True),
+    sa.Column('total_likes', sa.BigInteger(), nullable=True),
+    sa.Column('avg_views', sa.Integer(), nullable=True),
+    sa.Column('avg_likes', sa.Integer(), nullable=True),
+    sa.Column('avg_comments', sa.Integer(), nullable=True),
+    sa.Column('avg_shares', sa.Integer(), nullable=True),
+    sa.Column('engagement_rate', sa.Float(), nullable=True),
+    sa.Column('profile_views', sa.Integer(), nullable=True),
+    sa.Column('reach', sa.Integer(), nullable=True),
+    sa.Column('impressions', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['profile_id'], ['influencer_profiles.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('profile_id', 'network', 'captured_at', name='uq_insight_snapshots_key')
+    )
+    op.create_index(op.f('ix_insight_snapshots_captured_at'), 'insight_snapshots', ['captured_at'], unique=False)
+    op.create_table('insight_rollups',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('profile_id', sa.Integer(), nullable=False),
+    sa.Column('network', sa.String(length=20), nullable=False),
+    sa.Column('granularity', sa.String(length=10), nullable=False),
+    sa.Column('bucket_start', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('samples', sa.Integer(), nullable=False),
+    sa.Column('followers_min', sa.Integer(), nullable=True),
+    sa.Column('followers_max', sa.Integer(), nullable=True),
+    sa.Column('engagement_rate_avg', sa.Float(), nullable=True),
+    sa.Column('avg_views_avg', sa.Float(), nullable=True),
+    sa.Column('avg_likes_avg', sa.Float(), nullable=True),
+    sa.Column('avg_comments_avg', sa.Float(), nullable=True),
+    sa.ForeignKeyConstraint(['profile_id'], ['influencer_profiles.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('profile_id', 'network', 'granularity', 'bucket_start', name='uq_insight_rollups_key')
+    )
+    op.create_index(op.f('ix_insight_rollups_bucket_start'), 'insight_rollups', ['bucket_start'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_insight_rollups_bucket_start'), table_name='insight_rollups')
+    op.drop_table('insight_rollups')
+    op.drop_index(op.f('ix_insight_snapshots_captured_at'), table_name='insight_snapshots')
+    op.drop_table('insight_snapshots')
@@ -0,0 +1,28 @@
+"""add digest coalescing to notifications
+
+Revision ID: e61b4d8a2f97
+Revises: c3a9e7b15d20
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e61b4d8a2f97'
+down_revision: Union[str, None] = 'c3a9e7b15d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('notifications', sa.Column('digest_count', sa.Integer(), server_default='1', nullable=False))
+    op.create_index('ix_notifications_digest', 'notifications', ['user_id', 'notification_type', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notifications_digest', table_name='notifications')
+    op.drop_column('notifications', 'digest_count')
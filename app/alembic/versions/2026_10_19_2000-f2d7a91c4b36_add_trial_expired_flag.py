@@ -0,0 +1,37 @@
+"""add precomputed trial_expired flag to users
+
+Revision ID: f2d7a91c4b36
+Revises: e61b4d8a2f97
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2d7a91c4b36'
+down_revision: Union[str, None] = 'e61b4d8a2f97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('trial_expired', sa.Boolean(), server_default=sa.false(), nullable=False))
+    # Trials that ended before this release are flagged here, so the sweeper
+    # does not notify every historical account on its first pass
+    users = sa.table('users', sa.column('trial_expired', sa.Boolean()), sa.column('trial_start_time', sa.DateTime(timezone=True)))
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=settings.TRIAL_DURATION_HOURS)
+    op.execute(users.update().where(users.c.trial_start_time < cutoff).values(trial_expired=True))
+    # Sweeper lookups of lapsed subscriptions
+    op.create_index('ix_subscriptions_status_period_end', 'subscriptions', ['status', 'current_period_end'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_subscriptions_status_period_end', table_name='subscriptions')
+    op.drop_column('users', 'trial_expired')
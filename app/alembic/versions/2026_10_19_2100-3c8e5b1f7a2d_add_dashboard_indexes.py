@@ -0,0 +1,38 @@
+"""add composite indexes for dashboard aggregates
+
+Revision ID: 3c8e5b1f7a2d
+Revises: f2d7a91c4b36
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c8e5b1f7a2d'
+down_revision: Union[str, None] = 'f2d7a91c4b36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The composite indexes lead with the foreign key columns, so they
+    # replace the single-column ones (created first: MySQL needs an index
+    # backing each foreign key at all times)
+    op.create_index('ix_campaigns_empresa_status', 'campaigns', ['empresa_id', 'status'], unique=False)
+    op.create_index('ix_campaigns_influencer_status', 'campaigns', ['influencer_id', 'status'], unique=False)
+    op.create_index('ix_messages_receiver_unread', 'messages', ['receiver_id', 'is_read'], unique=False)
+    op.drop_index('ix_campaigns_empresa_id', table_name='campaigns')
+    op.drop_index('ix_campaigns_influencer_id', table_name='campaigns')
+    op.drop_index('ix_messages_receiver_id', table_name='messages')
+
+
+def downgrade() -> None:
+    op.create_index('ix_messages_receiver_id', 'messages', ['receiver_id'], unique=False)
+    op.create_index('ix_campaigns_influencer_id', 'campaigns', ['influencer_id'], unique=False)
+    op.create_index('ix_campaigns_empresa_id', 'campaigns', ['empresa_id'], unique=False)
+    op.drop_index('ix_messages_receiver_unread', table_name='messages')
+    op.drop_index('ix_campaigns_influencer_status', table_name='campaigns')
+    op.drop_index('ix_campaigns_empresa_status', table_name='campaigns')
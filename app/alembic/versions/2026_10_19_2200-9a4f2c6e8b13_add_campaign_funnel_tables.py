@@ -0,0 +1,52 @@
+"""add campaign status events and daily funnel rollup
+
+Revision ID: 9a4f2c6e8b13
+Revises: 3c8e5b1f7a2d
+Create Date: 2026-10-19 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4f2c6e8b13'
+down_revision: Union[str, None] = '3c8e5b1f7a2d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('campaign_status_events',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('campaign_id', sa.Integer(), nullable=False),
+    sa.Column('from_status', sa.String(length=20), nullable=True),
+    sa.Column('to_status', sa.String(length=20), nullable=False),
+    sa.Column('occurred_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('seconds_since_proposal', sa.Float(), nullable=True),
+    sa.Column('latency_bucket', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['campaign_id'], ['campaigns.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_campaign_status_events_campaign_id'), 'campaign_status_events', ['campaign_id'], unique=False)
+    op.create_index(op.f('ix_campaign_status_events_occurred_at'), 'campaign_status_events', ['occurred_at'], unique=False)
+    op.create_table('campaign_funnel_daily',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('to_status', sa.String(length=20), nullable=False),
+    sa.Column('latency_bucket', sa.Integer(), nullable=True),
+    sa.Column('transitions', sa.Integer(), nullable=False),
+    sa.Column('seconds_sum', sa.Float(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_campaign_funnel_daily_day_status', 'campaign_funnel_daily', ['day', 'to_status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_campaign_funnel_daily_day_status', table_name='campaign_funnel_daily')
+    op.drop_table('campaign_funnel_daily')
+    op.drop_index(op.f('ix_campaign_status_events_occurred_at'), table_name='campaign_status_events')
+    op.drop_index(op.f('ix_campaign_status_events_campaign_id'), table_name='campaign_status_events')
+    op.drop_table('campaign_status_events')
@@ -0,0 +1,35 @@
+"""add hourly profile view counters
+
+Revision ID: b7d3e9f15c42
+Revises: 9a4f2c6e8b13
+Create Date: 2026-10-19 23:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d3e9f15c42'
+down_revision: Union[str, None] = '9a4f2c6e8b13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('profile_view_counters',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('profile_id', sa.Integer(), nullable=False),
+    sa.Column('hour', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('viewer_role', sa.String(length=20), nullable=False),
+    sa.Column('views', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['profile_id'], ['influencer_profiles.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('profile_id', 'hour', 'viewer_role', name='uq_profile_view_counters_key')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('profile_view_counters')
@@ -0,0 +1,28 @@
+"""persist digest email due time on notifications
+
+Revision ID: d4f8a2c61e07
+Revises: b7d3e9f15c42
+Create Date: 2026-10-20 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f8a2c61e07'
+down_revision: Union[str, None] = 'b7d3e9f15c42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('notifications', sa.Column('email_due_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index('ix_notifications_email_due_at', 'notifications', ['email_due_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notifications_email_due_at', table_name='notifications')
+    op.drop_column('notifications', 'email_due_at')
@@ -0,0 +1,35 @@
+"""index influencer profiles in rating sort order
+
+Revision ID: 6c1e9b4d7a28
+Revises: d4f8a2c61e07
+Create Date: 2026-10-20 09:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c1e9b4d7a28'
+down_revision: Union[str, None] = 'd4f8a2c61e07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ORDER BY average_rating DESC NULLS LAST, id DESC reads this index in order;
+    # the plain average_rating index could not serve it
+    op.create_index(
+        'ix_influencer_profiles_rating_order',
+        'influencer_profiles',
+        ['average_rating', 'id'],
+        unique=False,
+        postgresql_ops={'average_rating': 'DESC NULLS LAST', 'id': 'DESC'}
+    )
+    op.drop_index('ix_influencer_profiles_average_rating', table_name='influencer_profiles')
+
+
+def downgrade() -> None:
+    op.create_index('ix_influencer_profiles_average_rating', 'influencer_profiles', ['average_rating'], unique=False)
+    op.drop_index('ix_influencer_profiles_rating_order', table_name='influencer_profiles')
@@ -1,15 +1,24 @@
 """
 Authentication router for user registration and login.
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Response, Cookie
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response, Cookie
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.config import settings
+from app.core.rate_limit import RateLimiter, check_rate_limit, client_ip
 from app.schemas.user_schemas import UserCreate, UserLogin, UserResponse, Token
 from app.services.auth_service import AuthService
 
-router = APIRouter(prefix="/auth", tags=["Authentication"])
+router = APIRouter(
+    prefix="/auth",
+    tags=["Authentication"],
+    dependencies=[Depends(RateLimiter(
+        "auth",
+        settings.RATE_LIMIT_AUTH_PER_MINUTE,
+        settings.RATE_LIMIT_AUTH_BURST
+    ))]
+)
 
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
@@ -38,6 +47,7 @@ async def login_options():
 @router.post("/login", response_model=Token)
 async def login(
     login_data: UserLogin,
+    request: Request,
     response: Response,
     db: AsyncSession = Depends(get_db)
 ):
@@ -45,7 +55,24 @@ async def login(
     Login with email and password.
     
     Sets httpOnly cookie with JWT token and returns token in response.
+    Attempts are also throttled before the password is hashed: tightly per
+    account and client IP, and more loosely per account alone so guessing
+    one password from many IPs is still bounded.
     """
+    email = login_data.email.lower()
+    await check_rate_limit(
+        "login_account",
+        f"{email}:{client_ip(request)}",
+        settings.RATE_LIMIT_LOGIN_ACCOUNT_PER_MINUTE,
+        settings.RATE_LIMIT_LOGIN_ACCOUNT_BURST
+    )
+    await check_rate_limit(
+        "login_email",
+        email,
+        settings.RATE_LIMIT_LOGIN_EMAIL_PER_MINUTE,
+        settings.RATE_LIMIT_LOGIN_EMAIL_BURST
+    )
+    
     auth_service = AuthService(db)
     
     user = await auth_service.authenticate_user(login_data)
@@ -1,31 +1,81 @@
 """
 Campaigns router for managing collaboration proposals.
 """
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.rate_limit import RateLimiter
 from app.models.user import User
 from app.schemas.campaign_schemas import (
     CampaignCreate,
     CampaignUpdate,
     CampaignResponse,
-    CampaignActionRequest
+    CampaignActionRequest,
+    CampaignRatingRequest
 )
 from app.services.campaign_service import CampaignService
 from app.api.dependencies import (
     get_current_user,
     get_current_empresa_user,
-    get_current_influencer_user
+    get_current_influencer_user,
+    get_user_loader
 )
+from app.api.sparse_fields import SparseFields, sparse_response
+from app.repositories.user_loader import UserLoader
 
-router = APIRouter(prefix="/campaigns", tags=["Campaigns"])
+router = APIRouter(
+    prefix="/campaigns",
+    tags=["Campaigns"],
+    dependencies=[Depends(RateLimiter(
+        "campaigns",
+        settings.RATE_LIMIT_CAMPAIGNS_PER_MINUTE,
+        settings.RATE_LIMIT_CAMPAIGNS_BURST
+    ))]
+)
+
+campaign_fields = SparseFields(CampaignResponse)
+
+# Response fields resolved through a related user: name -> id attribute
+PARTY_ATTRIBUTES = {"empresa_name": "empresa_id", "influencer_name": "influencer_id"}
+
+
+async def campaigns_with_parties(
+    campaigns: list,
+    users: UserLoader,
+    fields: Optional[list[str]] = None
+) -> list[dict]:
+    """Build CampaignResponse payloads (only `fields` if given), loading party names in one query."""
+    names = fields or list(CampaignResponse.model_fields)
+    id_attributes = [PARTY_ATTRIBUTES[name] for name in names if name in PARTY_ATTRIBUTES]
+    parties = await users.load_many(
+        getattr(campaign, attribute) for campaign in campaigns for attribute in id_attributes
+    )
+    
+    payloads = []
+    for campaign in campaigns:
+        payload = {}
+        for name in names:
+            if name in PARTY_ATTRIBUTES:
+                party = parties.get(getattr(campaign, PARTY_ATTRIBUTES[name]))
+                payload[name] = party.full_name if party else None
+            else:
+                payload[name] = getattr(campaign, name)
+        payloads.append(payload)
+    return payloads
+
+
+async def campaign_with_parties(campaign, users: UserLoader) -> dict:
+    return (await campaigns_with_parties([campaign], users))[0]
 
 
 @router.post("/", response_model=CampaignResponse, status_code=status.HTTP_201_CREATED)
 async def create_campaign(
     campaign_data: CampaignCreate,
     current_user: User = Depends(get_current_empresa_user),
+    users: UserLoader = Depends(get_user_loader),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -36,14 +86,16 @@ async def create_campaign(
     campaign_service = CampaignService(db)
     campaign = await campaign_service.create_campaign(current_user, campaign_data)
     
-    return campaign
+    return await campaign_with_parties(campaign, users)
 
 
 @router.get("/", response_model=list[CampaignResponse])
 async def list_my_campaigns(
     skip: int = 0,
     limit: int = 100,
+    fields: Optional[list[str]] = Depends(campaign_fields),
     current_user: User = Depends(get_current_user),
+    users: UserLoader = Depends(get_user_loader),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -60,24 +112,28 @@ async def list_my_campaigns(
     
     if current_user.role == UserRole.EMPRESA:
         campaigns = await campaign_repo.get_by_empresa(
-            current_user.id, skip=skip, limit=limit
+            current_user.id, skip=skip, limit=limit, fields=fields
         )
     elif current_user.role == UserRole.INFLUENCER:
         campaigns = await campaign_repo.get_by_influencer(
-            current_user.id, skip=skip, limit=limit
+            current_user.id, skip=skip, limit=limit, fields=fields
         )
     else:  # ADMIN
         campaigns = await campaign_repo.get_by_user(
-            current_user.id, skip=skip, limit=limit
+            current_user.id, skip=skip, limit=limit, fields=fields
         )
     
-    return campaigns
+    # Read-model rows are serialized directly, without per-row validation
+    result = await campaigns_with_parties(campaigns, users, fields)
+    return sparse_response(result, fields or list(CampaignResponse.model_fields))
 
 
 @router.get("/{campaign_id}", response_model=CampaignResponse)
 async def get_campaign(
     campaign_id: int,
+    fields: Optional[list[str]] = Depends(campaign_fields),
     current_user: User = Depends(get_current_user),
+    users: UserLoader = Depends(get_user_loader),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -86,15 +142,20 @@ async def get_campaign(
     Only accessible by involved parties (empresa, influencer) or admin.
     """
     campaign_service = CampaignService(db)
-    campaign = await campaign_service.get_campaign(campaign_id, current_user)
+    campaign = await campaign_service.get_campaign(campaign_id, current_user, fields=fields)
+    result = (await campaigns_with_parties([campaign], users, fields))[0]
     
-    return campaign
+    if fields:
+        return sparse_response(result, fields)
+    
+    return result
 
 
 @router.post("/{campaign_id}/accept", response_model=CampaignResponse)
 async def accept_campaign(
     campaign_id: int,
     current_user: User = Depends(get_current_influencer_user),
+    users: UserLoader = Depends(get_user_loader),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -105,7 +166,7 @@ async def accept_campaign(
     campaign_service = CampaignService(db)
     campaign = await campaign_service.accept_campaign(campaign_id, current_user)
     
-    return campaign
+    return await campaign_with_parties(campaign, users)
 
 
 @router.post("/{campaign_id}/reject", response_model=CampaignResponse)
@@ -113,6 +174,7 @@ async def reject_campaign(
     campaign_id: int,
     action_data: CampaignActionRequest,
     current_user: User = Depends(get_current_influencer_user),
+    users: UserLoader = Depends(get_user_loader),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -125,7 +187,7 @@ async def reject_campaign(
         action_data.message
     )
     
-    return campaign
+    return await campaign_with_parties(campaign, users)
 
 
 @router.post("/{campaign_id}/negotiate", response_model=CampaignResponse)
@@ -133,6 +195,7 @@ async def negotiate_campaign(
     campaign_id: int,
     action_data: CampaignActionRequest,
     current_user: User = Depends(get_current_influencer_user),
+    users: UserLoader = Depends(get_user_loader),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -154,13 +217,14 @@ async def negotiate_campaign(
         action_data.message
     )
     
-    return campaign
+    return await campaign_with_parties(campaign, users)
 
 
 @router.post("/{campaign_id}/complete", response_model=CampaignResponse)
 async def complete_campaign(
     campaign_id: int,
     current_user: User = Depends(get_current_user),
+    users: UserLoader = Depends(get_user_loader),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -171,4 +235,28 @@ async def complete_campaign(
     campaign_service = CampaignService(db)
     campaign = await campaign_service.complete_campaign(campaign_id, current_user)
     
-    return campaign
+    return await campaign_with_parties(campaign, users)
+
+
+@router.post("/{campaign_id}/rate", response_model=CampaignResponse)
+async def rate_campaign(
+    campaign_id: int,
+    rating_data: CampaignRatingRequest,
+    current_user: User = Depends(get_current_user),
+    users: UserLoader = Depends(get_user_loader),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Rate a completed campaign (Empresa or Influencer of the campaign).
+    
+    The empresa's rating updates the influencer's average rating.
+    """
+    campaign_service = CampaignService(db)
+    campaign = await campaign_service.rate_campaign(
+        campaign_id,
+        current_user,
+        rating_data.rating,
+        rating_data.review
+    )
+    
+    return await campaign_with_parties(campaign, users)
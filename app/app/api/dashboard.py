@@ -0,0 +1,89 @@
+"""
+Role dashboard endpoints.
+"""
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.models.user import User
+from app.api.dependencies import (
+    get_current_admin_user,
+    get_current_empresa_user,
+    get_current_influencer_user,
+)
+from app.schemas.dashboard_schemas import AdminDashboard, EmpresaDashboard, InfluencerDashboard
+from app.schemas.funnel_schemas import CampaignFunnel
+from app.services.dashboard_service import DashboardService
+from app.services.funnel_service import FunnelService
+
+router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
+
+
+@router.get("/empresa", response_model=EmpresaDashboard)
+async def get_empresa_dashboard(
+    months: int = Query(12, ge=1, le=36, description="Months of spend history"),
+    current_user: User = Depends(get_current_empresa_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Campaign counts per status, pending proposals, committed and final
+    budgets, monthly spend and unread counts of the current empresa.
+    """
+    service = DashboardService(db)
+    return await service.empresa_dashboard(current_user, months)
+
+
+@router.get("/influencer", response_model=InfluencerDashboard)
+async def get_influencer_dashboard(
+    months: int = Query(12, ge=1, le=36, description="Months of earnings history"),
+    current_user: User = Depends(get_current_influencer_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Campaign counts per status, pending proposals, committed and final
+    budgets, monthly earnings and unread counts of the current influencer.
+    """
+    service = DashboardService(db)
+    return await service.influencer_dashboard(current_user, months)
+
+
+@router.get("/admin", response_model=AdminDashboard)
+async def get_admin_dashboard(
+    months: int = Query(12, ge=1, le=36, description="Months of revenue history"),
+    current_user: User = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Users per role, pending approvals, campaigns and transactions per
+    status and monthly revenue (admin only).
+    """
+    service = DashboardService(db)
+    return await service.admin_dashboard(months)
+
+
+@router.get("/admin/funnel", response_model=CampaignFunnel)
+async def get_campaign_funnel(
+    start: Optional[date] = Query(None, description="First day (default: 90 days ago)"),
+    end: Optional[date] = Query(None, description="Last day, inclusive (default: today)"),
+    current_user: User = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Proposal -> negotiation -> acceptance -> completion conversion and the
+    time-to-accept distribution of a period (admin only).
+    
+    Served from the daily funnel rollup; **refreshed_through** is the last
+    day it covers (see scripts/refresh_campaign_funnel.py).
+    """
+    end = end or datetime.now(timezone.utc).date()
+    start = start or end - timedelta(days=89)
+    if start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start must not be after end"
+        )
+    
+    service = FunnelService(db)
+    return await service.get_funnel(start, end)
@@ -9,8 +9,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
 from app.core.security import decode_access_token
 from app.models.user import User, UserRole
+from app.repositories.user_loader import UserLoader
 from app.services.auth_service import AuthService
 from app.services.trial_service import TrialService
+from app.services.entitlement_service import EntitlementService
 
 # Security scheme (for Swagger UI)
 security = HTTPBearer(auto_error=False)
@@ -134,8 +136,9 @@ async def check_trial_access(
     if current_user.role != UserRole.EMPRESA:
         return current_user
     
-    # Users with subscription have full access
-    if current_user.has_active_subscription:
+    # Users with subscription have full access (cached entitlements)
+    entitlements = await EntitlementService(db).get(current_user)
+    if entitlements.has_subscription:
         return current_user
     
     # Check trial access
@@ -159,3 +162,13 @@ async def check_trial_access(
         await trial_service.record_profile_view(current_user, profile_id)
     
     return current_user
+
+
+def get_user_loader(db: AsyncSession = Depends(get_db)) -> UserLoader:
+    """
+    Request-scoped user loader.
+    
+    FastAPI caches dependencies per request, so every dependant of the same
+    request shares one loader and its memoized users.
+    """
+    return UserLoader(db)
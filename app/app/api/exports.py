@@ -0,0 +1,88 @@
+"""
+Admin export endpoints (streamed CSV / NDJSON).
+"""
+from datetime import datetime, timezone
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+
+from app.models.user import User, UserRole
+from app.models.campaign import CampaignStatus
+from app.models.transaction import TransactionStatus
+from app.api.dependencies import get_current_admin_user
+from app.services.export_service import (
+    MEDIA_TYPES,
+    ExportFormat,
+    ExportService,
+    campaigns_export,
+    profiles_export,
+    transactions_export,
+    users_export,
+)
+
+router = APIRouter(prefix="/exports", tags=["Exports"])
+
+
+def export_response(name: str, query: Select, export_format: ExportFormat) -> StreamingResponse:
+    """Stream query rows as a downloadable file."""
+    extension = "csv" if export_format == "csv" else "ndjson"
+    filename = f"{name}-{datetime.now(timezone.utc):%Y%m%d-%H%M%S}.{extension}"
+    return StreamingResponse(
+        ExportService().stream(query, export_format),
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Cache-Control": "no-store",
+            "X-Accel-Buffering": "no",  # Don't let a proxy buffer the stream
+        }
+    )
+
+
+@router.get("/transactions")
+async def export_transactions(
+    format: ExportFormat = Query("csv"),
+    status: Optional[TransactionStatus] = None,
+    current_user: User = Depends(get_current_admin_user)
+):
+    """
+    Export all transactions (Admin only).
+    """
+    return export_response("transactions", transactions_export(status), format)
+
+
+@router.get("/users")
+async def export_users(
+    format: ExportFormat = Query("csv"),
+    role: Optional[UserRole] = None,
+    is_approved: Optional[bool] = None,
+    current_user: User = Depends(get_current_admin_user)
+):
+    """
+    Export all users (Admin only). Password hashes are never exported.
+    """
+    return export_response("users", users_export(role, is_approved), format)
+
+
+@router.get("/campaigns")
+async def export_campaigns(
+    format: ExportFormat = Query("csv"),
+    status: Optional[CampaignStatus] = None,
+    current_user: User = Depends(get_current_admin_user)
+):
+    """
+    Export all campaigns (Admin only).
+    """
+    return export_response("campaigns", campaigns_export(status), format)
+
+
+@router.get("/profiles")
+async def export_profiles(
+    format: ExportFormat = Query("csv"),
+    is_approved: Optional[bool] = None,
+    current_user: User = Depends(get_current_admin_user)
+):
+    """
+    Export all influencer profiles (Admin only).
+    """
+    return export_response("profiles", profiles_export(is_approved), format)
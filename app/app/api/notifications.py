@@ -9,6 +9,7 @@ from app.models.user import User
 from app.schemas.notification_schemas import NotificationResponse
 from app.services.notification_service import NotificationService
 from app.api.dependencies import get_current_user
+from app.api.sparse_fields import sparse_response
 
 router = APIRouter(prefix="/notifications", tags=["Notifications"])
 
@@ -24,7 +25,8 @@ async def list_my_notifications(
     """
     List notifications for current user.
     
-    Optional filter by read status.
+    Optional filter by read status. Rows are serialized directly (no ORM
+    instances or Pydantic validation per row).
     """
     notification_service = NotificationService(db)
     notifications = await notification_service.get_user_notifications(
@@ -34,7 +36,7 @@ async def list_my_notifications(
         limit=limit
     )
     
-    return notifications
+    return sparse_response(notifications, list(NotificationResponse.model_fields))
 
 
 @router.patch("/{notification_id}/read", response_model=NotificationResponse)
@@ -1,28 +1,135 @@
 """
 Influencer profiles router with trial access control.
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Cookie, Request
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status, Cookie, Request
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 import json
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, get_db
+from app.core.rate_limit import RateLimiter
+from app.core.singleflight import SingleFlight
 from app.models.user import User, UserRole
 from app.schemas.profile_schemas import (
     InfluencerProfileCreate,
     InfluencerProfileUpdate,
-    InfluencerProfileResponse
+    InfluencerProfileResponse,
+    InfluencerProfileSummary,
+    InfluencerRecommendation,
+    ProfileViewStats
+)
+from app.schemas.insight_schemas import (
+    InsightSnapshotCreate,
+    InsightPoint,
+    InsightHistoryResponse,
+    InsightNetwork,
+    InsightResolution
 )
 from app.repositories.profile_repository import ProfileRepository
 from app.models.profile import InfluencerProfile
+from app.services.explorer_cache import explorer_cache
+from app.services.influencer_index import influencer_index
+from app.services.insights_service import InsightsService, snapshot_point
+from app.services.profile_cache import (
+    CachedProfile,
+    cache_profile,
+    get_cached_profile,
+    invalidate_profile,
+    profile_cache,
+)
+from app.services.profile_views import ProfileViewService, profile_view_buffer
 from app.api.dependencies import (
     get_current_user,
     get_current_influencer_user,
-    check_trial_access
+    check_trial_access,
+    get_user_loader
 )
+from app.api.sparse_fields import SparseFields, sparse_response
+from app.repositories.user_loader import UserLoader
 import logging
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/profiles", tags=["Influencer Profiles"])
+router = APIRouter(
+    prefix="/profiles",
+    tags=["Influencer Profiles"],
+    dependencies=[Depends(RateLimiter(
+        "profiles",
+        settings.RATE_LIMIT_PROFILES_PER_MINUTE,
+        settings.RATE_LIMIT_PROFILES_BURST
+    ))]
+)
+
+profile_fields = SparseFields(InfluencerProfileResponse)
+summary_fields = SparseFields(InfluencerProfileSummary)
+
+# Concurrent identical reads share one query; keyed ("profile", id),
+# ("user", user_id) and ("explorer", ...)
+read_flights = SingleFlight()
+
+
+async def profile_with_owner(
+    profile: InfluencerProfile,
+    users: UserLoader,
+    fields: Optional[list[str]] = None
+) -> dict:
+    """Build an InfluencerProfileResponse payload (only `fields` if given) with the owner's name."""
+    names = fields or list(InfluencerProfileResponse.model_fields)
+    payload = {name: getattr(profile, name) for name in names if name != "full_name"}
+    if "full_name" in names:
+        owner = await users.load(profile.user_id)
+        payload["full_name"] = owner.full_name if owner else None
+    return payload
+
+
+async def load_profile(profile_id: Optional[int] = None, user_id: Optional[int] = None) -> Optional[CachedProfile]:
+    """
+    Cached profile by profile id or owner id, or None if there is none.
+    
+    Misses are loaded once for all concurrent requests, on a session of
+    their own, and cached.
+    """
+    entry = get_cached_profile(profile_id=profile_id, user_id=user_id)
+    if entry is not None:
+        return entry
+    key = ("profile", profile_id) if profile_id is not None else ("user", user_id)
+    return await read_flights.do(key, lambda: _load_profile(profile_id, user_id))
+
+
+async def _load_profile(profile_id: Optional[int], user_id: Optional[int]) -> Optional[CachedProfile]:
+    generation = profile_cache.generation
+    async with AsyncSessionLocal() as db:
+        profile_repo = ProfileRepository(db)
+        if profile_id is not None:
+            profile = await profile_repo.get_by_id(profile_id)
+        else:
+            profile = await profile_repo.get_by_user_id(user_id)
+        if not profile:
+            return None
+        payload = await profile_with_owner(profile, UserLoader(db))
+    return cache_profile(payload, generation)
+
+
+async def _load_explorer_page(skip: int, limit: int, fields: Optional[list[str]], sort_by_rating: bool) -> bytes:
+    async with AsyncSessionLocal() as db:
+        profiles = await ProfileRepository(db).get_all_summaries(
+            skip=skip,
+            limit=limit,
+            fields=fields,
+            sort_by_rating=sort_by_rating
+        )
+    # Projected rows are serialized directly, without per-row validation
+    return sparse_response(profiles, fields or list(InfluencerProfileSummary.model_fields)).body
+
+
+def cached_profile_response(entry: CachedProfile, fields: Optional[list[str]] = None) -> Response:
+    """Serve a cached profile: the stored JSON, or the requested fields of it."""
+    if fields:
+        return sparse_response(entry.payload, fields)
+    return Response(content=entry.body, media_type="application/json")
 
 
 async def fix_categories_in_request(request: Request) -> dict:
@@ -52,6 +159,7 @@ async def fix_categories_in_request(request: Request) -> dict:
 async def create_profile(
     request: Request,
     current_user: User = Depends(get_current_influencer_user),
+    users: UserLoader = Depends(get_user_loader),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -89,27 +197,86 @@ async def create_profile(
         **profile_data.model_dump()
     )
     
+    # Published when the profile commits; marks explorer pages stale
+    invalidate_profile(user_id=current_user.id, db=db)
     profile = await profile_repo.create(profile)
+    influencer_index.mark_stale()
     
-    return profile
+    users.prime(current_user)
+    return await profile_with_owner(profile, users)
 
 
-@router.get("/", response_model=list[InfluencerProfileResponse])
+@router.get("/", response_model=list[InfluencerProfileSummary])
 async def list_profiles(
     skip: int = 0,
     limit: int = 100,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    sort: Optional[Literal["rating"]] = None,
+    fields: Optional[list[str]] = Depends(summary_fields),
+    current_user: User = Depends(get_current_user)
 ):
     """
     List all influencer profiles (Explorer/Search).
     
+    Returns lightweight cards; bio, portfolio and insights are only
+    available through the detail endpoint. sort=rating orders by the
+    stored average rating, best first.
+    
+    The first pages are served from the explorer cache, possibly up to a
+    soft TTL stale while a background task refreshes them; deeper pages
+    requested concurrently share one query.
+    
     For EMPRESA users in trial: Shows list but blocks detailed view.
     """
+    # Same page whatever the order of ?fields= (cards use schema order)
+    if fields is not None:
+        fields = [name for name in InfluencerProfileSummary.model_fields if name in fields]
+        if len(fields) == len(InfluencerProfileSummary.model_fields):
+            fields = None
+    
+    key = ("explorer", skip, limit, tuple(fields) if fields else None, sort)
+    load = partial(_load_explorer_page, skip, limit, fields, sort == "rating")
+    
+    if skip + limit <= settings.EXPLORER_CACHE_MAX_ROWS:
+        body = await explorer_cache.get(key, load)
+    else:
+        body = await read_flights.do(key, load)
+    return Response(content=body, media_type="application/json")
+
+
+@router.get("/recommendations", response_model=list[InfluencerRecommendation])
+async def recommend_profiles(
+    budget: Optional[float] = Query(None, gt=0, description="Budget per deliverable"),
+    categories: Optional[str] = Query(None, description="Comma-separated categories"),
+    network: Optional[Literal["instagram", "tiktok", "youtube"]] = None,
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Recommend influencers for a campaign brief.
+    
+    Every approved profile is scored on reach, engagement, price fit against
+    the budget, category overlap and rating using the in-memory influencer
+    index; only the winning cards are read from the database.
+    """
+    await influencer_index.refresh(db)
+    
+    category_list = [c for c in categories.split(",") if c.strip()] if categories else None
+    ranked = influencer_index.recommend(
+        budget=budget,
+        categories=category_list,
+        network=network,
+        limit=limit
+    )
+    
     profile_repo = ProfileRepository(db)
-    profiles = await profile_repo.get_all(skip=skip, limit=limit)
+    cards = await profile_repo.get_summaries_by_ids([profile_id for profile_id, _ in ranked])
     
-    return profiles
+    return [
+        {**cards[profile_id], "score": round(score, 4)}
+        for profile_id, score in ranked
+        if profile_id in cards
+    ]
 
 
 @router.get("/test")
@@ -120,14 +287,16 @@ async def test_endpoint():
 
 @router.get("/me", response_model=InfluencerProfileResponse)
 async def get_my_profile(
+    fields: Optional[list[str]] = Depends(profile_fields),
     current_user: User = Depends(get_current_influencer_user),
+    users: UserLoader = Depends(get_user_loader),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Get own influencer profile (Influencer only).
     """
     profile_repo = ProfileRepository(db)
-    profile = await profile_repo.get_by_user_id(current_user.id)
+    profile = await profile_repo.get_by_user_id(current_user.id, fields=fields)
     
     if not profile:
         raise HTTPException(
@@ -135,13 +304,19 @@ async def get_my_profile(
             detail="Profile not found. Create one first."
         )
     
-    return profile
+    users.prime(current_user)
+    result = await profile_with_owner(profile, users, fields)
+    
+    if fields:
+        return sparse_response(result, fields)
+    
+    return result
 
 
 @router.get("/{profile_id}", response_model=InfluencerProfileResponse)
 async def get_profile(
     profile_id: int,
-    db: AsyncSession = Depends(get_db),
+    fields: Optional[list[str]] = Depends(profile_fields),
     current_user: User = Depends(check_trial_access)
 ):
     """
@@ -154,44 +329,157 @@ async def get_profile(
     - Second profile view during trial: BLOCKED (403)
     - After trial expiration: BLOCKED (402)
     - With subscription: ALLOWED
+    
+    Popular profiles are served from the profile cache without a query.
     """
-    profile_repo = ProfileRepository(db)
-    profile = await profile_repo.get_by_id(profile_id)
+    entry = await load_profile(profile_id=profile_id)
+    if entry is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
+        )
+    
+    # Buffered in memory; the owner's own views don't count
+    if entry.payload["user_id"] != current_user.id:
+        profile_view_buffer.record(profile_id, current_user.role)
     
+    return cached_profile_response(entry, fields)
+
+
+@router.get("/{profile_id}/views", response_model=ProfileViewStats)
+async def get_profile_views(
+    profile_id: int,
+    days: int = Query(30, ge=1, le=365),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get view counts of a profile per day and viewer role.
+    
+    Only the profile owner and admins can see them.
+    """
+    profile_repo = ProfileRepository(db)
+    profile = await profile_repo.get_by_id(profile_id, fields=["id"])
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Profile not found"
         )
     
-    return profile
+    if current_user.role != UserRole.ADMIN and profile.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to view these statistics"
+        )
+    
+    view_service = ProfileViewService(db)
+    return await view_service.get_stats(profile_id, days)
 
 
-@router.get("/user/{user_id}", response_model=InfluencerProfileResponse)
-async def get_profile_by_user(
-    user_id: int,
+@router.get("/{profile_id}/similar", response_model=list[InfluencerRecommendation])
+async def get_similar_profiles(
+    profile_id: int,
+    limit: int = Query(10, ge=1, le=50),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
-    Get influencer profile by user ID.
+    Get the influencers most similar to a profile.
+    
+    Similarity (returned as score) is the cosine between precomputed
+    embeddings of follower mix, audience size, engagement, price tier and
+    categories held by the in-memory influencer index.
     """
+    await influencer_index.refresh(db)
+    
+    ranked = influencer_index.similar(profile_id, limit=limit)
+    if ranked is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
+        )
+    
     profile_repo = ProfileRepository(db)
-    profile = await profile_repo.get_by_user_id(user_id)
+    cards = await profile_repo.get_summaries_by_ids([similar_id for similar_id, _ in ranked])
     
-    if not profile:
+    return [
+        {**cards[similar_id], "score": round(score, 4)}
+        for similar_id, score in ranked
+        if similar_id in cards
+    ]
+
+
+@router.get("/{profile_id}/insights", response_model=InsightHistoryResponse)
+async def get_insights_history(
+    profile_id: int,
+    network: InsightNetwork,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    resolution: Optional[InsightResolution] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(check_trial_access)
+):
+    """
+    Get insights history for growth charts.
+    
+    Defaults to the last 30 days. Without a resolution, short ranges return
+    raw snapshots and longer ones daily or weekly rollups. Subject to the
+    same trial rules as the profile detail.
+    """
+    end = end or datetime.now(timezone.utc)
+    start = start or end - timedelta(days=30)
+    if start >= end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start must be before end"
+        )
+    
+    profile_repo = ProfileRepository(db)
+    if not await profile_repo.get_by_id(profile_id, fields=["id"]):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
+        )
+    
+    insights_service = InsightsService(db)
+    resolution, points = await insights_service.get_history(
+        profile_id, network, start, end, resolution
+    )
+    
+    return InsightHistoryResponse(
+        profile_id=profile_id,
+        network=network,
+        resolution=resolution,
+        start=start,
+        end=end,
+        points=points
+    )
+
+
+@router.get("/user/{user_id}", response_model=InfluencerProfileResponse)
+async def get_profile_by_user(
+    user_id: int,
+    fields: Optional[list[str]] = Depends(profile_fields),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get influencer profile by user ID (served from the profile cache when possible).
+    """
+    entry = await load_profile(user_id=user_id)
+    if entry is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Profile not found for this user"
         )
     
-    return profile
+    return cached_profile_response(entry, fields)
 
 
 @router.put("/me", response_model=InfluencerProfileResponse)
 async def update_my_profile(
     request: Request,
     current_user: User = Depends(get_current_influencer_user),
+    users: UserLoader = Depends(get_user_loader),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -226,5 +514,37 @@ async def update_my_profile(
         setattr(profile, field, value)
     
     profile = await profile_repo.update(profile)
+    influencer_index.mark_stale()
+    invalidate_profile(profile.id, current_user.id, db=db)
+    
+    users.prime(current_user)
+    return await profile_with_owner(profile, users)
+
+
+@router.post("/me/insights", response_model=InsightPoint, status_code=status.HTTP_201_CREATED)
+async def record_my_insights(
+    snapshot_data: InsightSnapshotCreate,
+    current_user: User = Depends(get_current_influencer_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Record an insights snapshot for own profile (Influencer only).
+    """
+    profile_repo = ProfileRepository(db)
+    profile = await profile_repo.get_by_user_id(current_user.id, fields=["id"])
+    
+    if not profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found. Create one first."
+        )
+    
+    insights_service = InsightsService(db)
+    snapshot = await insights_service.record_snapshot(
+        profile.id,
+        snapshot_data.network,
+        snapshot_data.model_dump(exclude={"network", "captured_at"}, exclude_none=True),
+        snapshot_data.captured_at
+    )
     
-    return profile
+    return snapshot_point(snapshot)
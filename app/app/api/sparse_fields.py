@@ -0,0 +1,67 @@
+"""
+Sparse fieldsets support (``?fields=id,title,status``).
+
+Clients ask only for the attributes a screen renders. The requested names are
+validated against the response schema, translated into column-restricted
+loads (see app.repositories.fields) and used to trim the serialized payload.
+"""
+from typing import Any, Optional
+from fastapi import HTTPException, Query, status
+from fastapi.responses import Response
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+
+class SparseFields:
+    """
+    Dependency that parses the ``fields`` query parameter for a response schema.
+
+    Resolves to None when the parameter is absent (full response), otherwise
+    to the ordered list of requested fields plus the always-included ones.
+    """
+
+    def __init__(self, schema: type[BaseModel], always: tuple[str, ...] = ("id",)):
+        self.schema = schema
+        self.always = always
+
+    def __call__(
+        self,
+        fields: Optional[str] = Query(
+            None,
+            description="Comma-separated list of fields to return (default: all)"
+        )
+    ) -> Optional[list[str]]:
+        if not fields:
+            return None
+
+        requested = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = [name for name in requested if name not in self.schema.model_fields]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(unknown)}"
+            )
+
+        return list(dict.fromkeys([*self.always, *requested]))
+
+
+def sparse_response(items: Any, fields: list[str]) -> Response:
+    """
+    Serialize only the requested fields of ORM objects, rows or dicts.
+
+    Attributes that were not requested are never touched, so columns deferred
+    by load_only() are not lazily loaded during serialization. Values are
+    encoded by pydantic-core (same output as response_model serialization),
+    which also makes this the fast path for read-model list endpoints.
+    """
+    def pick(item: Any) -> dict:
+        if isinstance(item, dict):
+            return {name: item.get(name) for name in fields}
+        return {name: getattr(item, name) for name in fields}
+
+    if isinstance(items, list):
+        content = [pick(item) for item in items]
+    else:
+        content = pick(items)
+
+    return Response(content=to_json(content), media_type="application/json")
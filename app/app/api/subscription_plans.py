@@ -2,6 +2,7 @@
 Subscription Plans router for managing pricing plans.
 """
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
@@ -14,41 +15,36 @@ from app.schemas.subscription_schemas import (
     SubscriptionPlanResponse
 )
 from app.repositories.subscription_plan_repository import SubscriptionPlanRepository
+from app.services import plan_cache
 from app.api.dependencies import get_current_user, get_current_admin_user
 
 router = APIRouter(prefix="/subscription-plans", tags=["Subscription Plans"])
 
 
 @router.get("/", response_model=List[SubscriptionPlanResponse])
-async def list_plans(
-    active_only: bool = True,
-    db: AsyncSession = Depends(get_db)
-):
+async def list_plans(active_only: bool = True):
     """
     List all subscription plans.
     Public endpoint - anyone can view available plans.
+    
+    Served from the plan cache; concurrent misses share one query.
     """
-    repo = SubscriptionPlanRepository(db)
-    plans = await repo.get_all(active_only=active_only)
-    return plans
+    body = await plan_cache.get_plan_list(active_only)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/{plan_id}", response_model=SubscriptionPlanResponse)
-async def get_plan(
-    plan_id: int,
-    db: AsyncSession = Depends(get_db)
-):
+async def get_plan(plan_id: int):
     """Get a specific subscription plan by ID."""
-    repo = SubscriptionPlanRepository(db)
-    plan = await repo.get_by_id(plan_id)
+    body = await plan_cache.get_plan(plan_id)
     
-    if not plan:
+    if body is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Subscription plan not found"
         )
     
-    return plan
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/", response_model=SubscriptionPlanResponse, status_code=status.HTTP_201_CREATED)
@@ -75,6 +71,7 @@ async def create_plan(
     )
     
     plan = await repo.create(plan)
+    plan_cache.invalidate_plans(db, plan.id)
     return plan
 
 
@@ -103,6 +100,7 @@ async def update_plan(
         setattr(plan, field, value)
     
     plan = await repo.update(plan)
+    plan_cache.invalidate_plans(db, plan.id)
     return plan
 
 
@@ -125,4 +123,5 @@ async def delete_plan(
         )
     
     await repo.delete(plan)
+    plan_cache.invalidate_plans(db, plan_id)
     return None
@@ -8,8 +8,10 @@ from typing import List, Optional
 from app.core.database import get_db
 from app.models.user import User, UserRole
 from app.models.transaction import TransactionStatus
-from app.api.dependencies import get_current_user, get_current_admin_user
+from app.api.dependencies import get_current_user, get_current_admin_user, get_user_loader
+from app.api.sparse_fields import SparseFields, sparse_response
 from app.repositories.transaction_repository import TransactionRepository
+from app.repositories.user_loader import UserLoader
 from app.schemas.transaction_schemas import (
     TransactionCreate,
     TransactionUpdate,
@@ -20,6 +22,35 @@ from app.schemas.transaction_schemas import (
 
 router = APIRouter(prefix="/transactions", tags=["transactions"])
 
+transaction_fields = SparseFields(TransactionWithUserResponse)
+
+# Response fields resolved through the related user
+USER_ATTRIBUTES = {"user_name": "full_name", "user_email": "email"}
+
+
+async def transactions_with_user(
+    transactions: list,
+    users: UserLoader,
+    fields: Optional[List[str]] = None
+) -> List[dict]:
+    """Build TransactionWithUserResponse payloads (only `fields` if given), loading users in one query."""
+    names = fields or list(TransactionWithUserResponse.model_fields)
+    owners = {}
+    if any(name in USER_ATTRIBUTES for name in names):
+        owners = await users.load_many(transaction.user_id for transaction in transactions)
+    
+    payloads = []
+    for transaction in transactions:
+        payload = {}
+        for name in names:
+            if name in USER_ATTRIBUTES:
+                owner = owners.get(transaction.user_id)
+                payload[name] = getattr(owner, USER_ATTRIBUTES[name]) if owner else None
+            else:
+                payload[name] = getattr(transaction, name)
+        payloads.append(payload)
+    return payloads
+
 
 @router.get("/stats", response_model=TransactionStats)
 async def get_transaction_stats(
@@ -39,7 +70,9 @@ async def list_transactions(
     skip: int = 0,
     limit: int = 100,
     status: Optional[TransactionStatus] = None,
+    fields: Optional[List[str]] = Depends(transaction_fields),
     current_user: User = Depends(get_current_user),
+    users: UserLoader = Depends(get_user_loader),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -51,37 +84,22 @@ async def list_transactions(
     
     if current_user.role == UserRole.ADMIN:
         # Admin can see all transactions
-        transactions = await transaction_repo.get_all(skip=skip, limit=limit, status=status)
+        transactions = await transaction_repo.get_all(
+            skip=skip, limit=limit, status=status, fields=fields
+        )
     else:
         # Users can only see their own transactions
         transactions = await transaction_repo.get_by_user_id(
             user_id=current_user.id,
             skip=skip,
-            limit=limit
+            limit=limit,
+            status=status,
+            fields=fields
         )
-        if status:
-            transactions = [t for t in transactions if t.status == status]
     
-    # Convert to response with user info
-    result = []
-    for transaction in transactions:
-        transaction_dict = {
-            "id": transaction.id,
-            "user_id": transaction.user_id,
-            "amount": transaction.amount,
-            "type": transaction.type,
-            "status": transaction.status,
-            "description": transaction.description,
-            "payment_method": transaction.payment_method,
-            "transaction_reference": transaction.transaction_reference,
-            "created_at": transaction.created_at,
-            "updated_at": transaction.updated_at,
-            "user_name": transaction.user.full_name,
-            "user_email": transaction.user.email,
-        }
-        result.append(transaction_dict)
-    
-    return result
+    # Read-model rows with user info, serialized without per-row validation
+    result = await transactions_with_user(transactions, users, fields)
+    return sparse_response(result, fields or list(TransactionWithUserResponse.model_fields))
 
 
 @router.get("/me", response_model=List[TransactionResponse])
@@ -100,13 +118,15 @@ async def get_my_transactions(
         skip=skip,
         limit=limit
     )
-    return transactions
+    return sparse_response(transactions, list(TransactionResponse.model_fields))
 
 
 @router.get("/{transaction_id}", response_model=TransactionWithUserResponse)
 async def get_transaction(
     transaction_id: int,
+    fields: Optional[List[str]] = Depends(transaction_fields),
     current_user: User = Depends(get_current_user),
+    users: UserLoader = Depends(get_user_loader),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -115,7 +135,7 @@ async def get_transaction(
     - Other users: Can only see their own transactions
     """
     transaction_repo = TransactionRepository(db)
-    transaction = await transaction_repo.get_by_id(transaction_id)
+    transaction = await transaction_repo.get_by_id(transaction_id, fields=fields)
     
     if not transaction:
         raise HTTPException(
@@ -130,20 +150,12 @@ async def get_transaction(
             detail="Not authorized to view this transaction"
         )
     
-    return {
-        "id": transaction.id,
-        "user_id": transaction.user_id,
-        "amount": transaction.amount,
-        "type": transaction.type,
-        "status": transaction.status,
-        "description": transaction.description,
-        "payment_method": transaction.payment_method,
-        "transaction_reference": transaction.transaction_reference,
-        "created_at": transaction.created_at,
-        "updated_at": transaction.updated_at,
-        "user_name": transaction.user.full_name,
-        "user_email": transaction.user.email,
-    }
+    result = (await transactions_with_user([transaction], users, fields))[0]
+    
+    if fields:
+        return sparse_response(result, fields)
+    
+    return result
 
 
 @router.post("/", response_model=TransactionResponse, status_code=status.HTTP_201_CREATED)
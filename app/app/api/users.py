@@ -1,17 +1,28 @@
 """
 Users router for user management.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+import io
+from typing import Optional
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.database import get_db
 from app.models.user import User, UserRole
-from app.schemas.user_schemas import UserResponse
+from app.schemas.user_schemas import UserResponse, UserBulkSelection, UserBulkActionResult
+from app.schemas.import_schemas import ImportReport
 from app.repositories.user_repository import UserRepository
 from app.api.dependencies import get_current_user, get_current_admin_user
+from app.services.influencer_index import influencer_index
+from app.services.import_service import ImportFormat, InfluencerImporter, iter_records
+from app.services.moderation_service import UserModerationService
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
+# One HTTP import at a time per worker
+import_lock = asyncio.Lock()
+
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
@@ -67,6 +78,112 @@ async def list_users(
     return users
 
 
+@router.post("/import", response_model=ImportReport)
+async def import_influencers(
+    file: UploadFile = File(...),
+    format: Optional[ImportFormat] = Query(None, description="csv or ndjson (default: from the file extension)"),
+    approve: bool = False,
+    current_user: User = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Bulk import influencer accounts and profiles (Admin only).
+    
+    Each CSV column / NDJSON key is a field of InfluencerImportRow (email,
+    password, full_name plus the profile fields; CSV categories as
+    "Moda|Belleza"). Invalid rows are skipped and reported by line number.
+    
+    Runs within the request, so it only accepts files up to
+    IMPORT_HTTP_MAX_BYTES and IMPORT_HTTP_MAX_ROWS records (413 otherwise);
+    larger rosters are loaded with scripts/import_influencers.py.
+    
+    - **approve**: Approve the imported influencers right away
+    """
+    if format is None:
+        filename = (file.filename or "").lower()
+        if filename.endswith(".csv"):
+            format = "csv"
+        elif filename.endswith((".ndjson", ".jsonl")):
+            format = "ndjson"
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cannot infer the file format, pass ?format=csv or ?format=ndjson"
+            )
+    
+    too_large = HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=(
+            f"Imports over {settings.IMPORT_HTTP_MAX_ROWS} rows or "
+            f"{settings.IMPORT_HTTP_MAX_BYTES} bytes must be loaded with "
+            "scripts/import_influencers.py"
+        )
+    )
+    
+    # Read off the event loop (UploadFile runs file I/O in a thread)
+    content = await file.read(settings.IMPORT_HTTP_MAX_BYTES + 1)
+    if len(content) > settings.IMPORT_HTTP_MAX_BYTES:
+        raise too_large
+    try:
+        lines = io.StringIO(content.decode("utf-8-sig"), newline="")
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Import file must be UTF-8 encoded"
+        )
+    
+    if sum(1 for _ in iter_records(lines, format)) > settings.IMPORT_HTTP_MAX_ROWS:
+        raise too_large
+    lines.seek(0)
+    
+    if import_lock.locked():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Another import is running, try again when it finishes"
+        )
+    async with import_lock:
+        return await InfluencerImporter(db, approve=approve).run(lines, format)
+
+
+@router.post("/bulk/approve", response_model=UserBulkActionResult)
+async def bulk_approve_users(
+    selection: UserBulkSelection,
+    current_user: User = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Approve many users at once (Admin only).
+    
+    Select users by **user_ids** and/or filters (**role**, **is_approved**,
+    **created_after**, **created_before**). Returns the ids that changed.
+    """
+    return await UserModerationService(db).apply("approve", selection, current_user)
+
+
+@router.post("/bulk/deactivate", response_model=UserBulkActionResult)
+async def bulk_deactivate_users(
+    selection: UserBulkSelection,
+    current_user: User = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Deactivate many users at once (Admin only). The caller is never included.
+    """
+    return await UserModerationService(db).apply("deactivate", selection, current_user)
+
+
+@router.post("/bulk/reactivate", response_model=UserBulkActionResult)
+async def bulk_reactivate_users(
+    selection: UserBulkSelection,
+    current_user: User = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Reactivate many users at once (Admin only).
+    """
+    return await UserModerationService(db).apply("reactivate", selection, current_user)
+
+
 @router.patch("/{user_id}/approve")
 async def approve_user(
     user_id: int,
@@ -89,6 +206,7 @@ async def approve_user(
     
     user.is_approved = True
     await user_repo.update(user)
+    influencer_index.mark_stale()
     
     return {"message": "User approved successfully", "user_id": user_id}
 
@@ -113,5 +231,6 @@ async def deactivate_user(
     
     user.is_active = False
     await user_repo.update(user)
+    influencer_index.mark_stale()
     
     return {"message": "User deactivated successfully", "user_id": user_id}
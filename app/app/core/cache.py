@@ -0,0 +1,60 @@
+"""
+In-process caches.
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Bounded LRU cache whose entries expire individually.
+    
+    Each entry carries its own wall-clock expiry (default now + ttl), so
+    values can live exactly until a known deadline such as the end of a
+    billing period. Not shared between processes.
+    
+    generation changes on every invalidate() and clear(): a loader that
+    reads it before querying and finds it changed afterwards knows its
+    result may predate a write and should not store it.
+    """
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.generation = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.time():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: Any, expires_at: Optional[float] = None) -> None:
+        """Store value until expires_at (epoch seconds), capped at now + ttl."""
+        deadline = time.time() + self.ttl
+        if expires_at is not None:
+            deadline = min(deadline, expires_at)
+        self._data[key] = (deadline, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def invalidate(self, key: Hashable) -> None:
+        self.generation += 1
+        self._data.pop(key, None)
+    
+    def clear(self) -> None:
+        self.generation += 1
+        self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
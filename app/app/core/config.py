@@ -23,19 +23,115 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 480  # 8 hours
     
+    # Rate limiting (token buckets: sustained requests per minute + burst)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"  # "memory" or "redis"
+    REDIS_URL: Optional[str] = None
+    # Reverse proxies in front of the app that append to X-Forwarded-For
+    # (0: use the socket address). The client is the entry appended by the
+    # outermost of them; entries to its left are client-supplied and ignored
+    RATE_LIMIT_TRUSTED_PROXY_HOPS: int = 0
+    RATE_LIMIT_AUTH_PER_MINUTE: int = 30
+    RATE_LIMIT_AUTH_BURST: int = 20
+    RATE_LIMIT_LOGIN_ACCOUNT_PER_MINUTE: int = 5
+    RATE_LIMIT_LOGIN_ACCOUNT_BURST: int = 5
+    # Per account across all IPs, looser so shared offices aren't locked out
+    RATE_LIMIT_LOGIN_EMAIL_PER_MINUTE: int = 20
+    RATE_LIMIT_LOGIN_EMAIL_BURST: int = 30
+    RATE_LIMIT_CAMPAIGNS_PER_MINUTE: int = 120
+    RATE_LIMIT_CAMPAIGNS_BURST: int = 60
+    RATE_LIMIT_PROFILES_PER_MINUTE: int = 300
+    RATE_LIMIT_PROFILES_BURST: int = 100
+    
+    # Admin exports
+    EXPORT_CHUNK_SIZE: int = 1000  # Rows fetched per server-side cursor round trip
+    
+    # Bulk import (users + profiles per batch stay below the bind-parameter limits)
+    IMPORT_BATCH_SIZE: int = 1000
+    IMPORT_HASH_WORKERS: Optional[int] = None  # Password hashing processes shared by all imports (default: CPU count)
+    # POST /users/import is for small files; larger ones go through
+    # scripts/import_influencers.py
+    IMPORT_HTTP_MAX_BYTES: int = 1048576
+    IMPORT_HTTP_MAX_ROWS: int = 500
+    IMPORT_MAX_REPORTED_ERRORS: int = 1000
+    
     # Trial Configuration
     TRIAL_DURATION_HOURS: int = 24
     
+    # Cross-worker invalidation of in-process caches: "auto" uses
+    # LISTEN/NOTIFY on PostgreSQL and local-only eviction otherwise
+    CACHE_INVALIDATION_BACKEND: str = "auto"  # auto | postgresql | memory
+    
+    # Entitlements cache (per-user access derived from subscriptions)
+    ENTITLEMENTS_CACHE_SIZE: int = 10000
+    ENTITLEMENTS_CACHE_TTL_SECONDS: int = 300
+    
+    # Profile detail cache (serialized responses; the TTL bounds staleness
+    # from writes made by other processes)
+    PROFILE_CACHE_SIZE: int = 5000
+    PROFILE_CACHE_TTL_SECONDS: int = 300
+    
+    # Subscription plan list/detail cache (cleared on every plan write)
+    PLAN_CACHE_TTL_SECONDS: int = 600
+    
+    # Explorer first pages (GET /profiles/ with skip + limit up to
+    # EXPLORER_CACHE_MAX_ROWS): served stale after the soft TTL while a
+    # background task recomputes them, dropped after the max age
+    EXPLORER_CACHE_MAX_ROWS: int = 200
+    EXPLORER_CACHE_SOFT_TTL_SECONDS: int = 30
+    EXPLORER_CACHE_MAX_AGE_SECONDS: int = 600
+    EXPLORER_CACHE_SIZE: int = 500
+    
+    # Expiry sweeper (trials and lapsed subscriptions)
+    EXPIRY_SWEEP_ENABLED: bool = True
+    EXPIRY_SWEEP_INTERVAL_SECONDS: int = 300
+    EXPIRY_SWEEP_BATCH_SIZE: int = 500
+    
+    # Recommendations (in-memory influencer index)
+    RECOMMENDATION_REFRESH_SECONDS: int = 30
+    
+    # Profile view counters (buffered in memory, flushed as bulk upserts;
+    # a crash loses at most one flush interval of views)
+    PROFILE_VIEWS_ENABLED: bool = True
+    PROFILE_VIEWS_FLUSH_SECONDS: int = 30
+    PROFILE_VIEWS_MAX_KEYS: int = 10000  # Buffered counters that force an early flush
+    
+    # Insights history retention (weekly rollups are kept indefinitely)
+    INSIGHTS_RAW_RETENTION_DAYS: int = 35
+    INSIGHTS_DAILY_RETENTION_DAYS: int = 400
+    
+    # Notifications of the same type to a user within this window are
+    # coalesced into one feed entry; the first event is emailed at once and
+    # later ones in one digest email when the window closes (0 disables)
+    NOTIFICATION_DIGEST_WINDOW_MINUTES: int = 60
+    
     # Email (Optional for MVP)
     SMTP_HOST: Optional[str] = None
     SMTP_PORT: Optional[int] = None
     SMTP_USER: Optional[str] = None
     SMTP_PASSWORD: Optional[str] = None
     EMAIL_FROM: Optional[str] = None
+    SMTP_START_TLS: bool = True
+    EMAIL_POOL_SIZE: int = 4  # Persistent SMTP connections
+    EMAIL_BATCH_SIZE: int = 50  # Messages sent per connection checkout
+    EMAIL_QUEUE_SIZE: int = 10000
+    EMAIL_MAX_RETRIES: int = 3
+    EMAIL_DUE_POLL_SECONDS: int = 30  # How often due digest emails are picked up
     
     # Social Media APIs (TikTok only)
     TIKTOK_CLIENT_KEY: Optional[str] = None
     TIKTOK_CLIENT_SECRET: Optional[str] = None
+    TIKTOK_API_BASE_URL: str = "https://open.tiktokapis.com"
+    TIKTOK_RATE_LIMIT_PER_SECOND: float = 5.0  # Keep below the app's API quota
+    TIKTOK_RATE_LIMIT_BURST: int = 10
+    TIKTOK_MAX_CONCURRENCY: int = 8
+    TIKTOK_MAX_RETRIES: int = 4
+    TIKTOK_REQUEST_TIMEOUT_SECONDS: float = 10.0
+    
+    # TikTok insights refresher (background worker)
+    TIKTOK_REFRESH_ENABLED: bool = False
+    TIKTOK_REFRESH_INTERVAL_HOURS: int = 24
+    TIKTOK_REFRESH_BATCH_SIZE: int = 200
     
     # CORS
     ALLOWED_ORIGINS: str
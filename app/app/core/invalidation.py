@@ -0,0 +1,248 @@
+"""
+Cross-worker cache invalidation bus.
+
+In-process caches (entitlements, profile detail, ...) subscribe to an
+entity name and evict the ids published for it. A publish evicts the local
+entries at once and, with the PostgreSQL backend, is forwarded to every
+other worker with NOTIFY on a dedicated LISTEN connection, so each worker
+drops its own copy. Writes made inside a request use
+invalidate_after_commit(), which publishes only once the session commits
+(nothing is published on rollback).
+
+The memory backend (single process, tests, MySQL) only evicts locally. If
+the LISTEN connection drops, notifications may have been missed: every
+subscribed cache is cleared and the connection is re-established.
+"""
+import asyncio
+import json
+import logging
+import uuid
+from collections import defaultdict
+from typing import Callable, Hashable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import database_url, db_type
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "cache_invalidation"
+
+# NOTIFY payloads must stay below 8000 bytes
+MAX_IDS_PER_MESSAGE = 500
+
+# Session.info key of the invalidations waiting for commit
+PENDING_KEY = "pending_invalidations"
+
+# Called with the evicted ids, or None to drop every entry
+Handler = Callable[[Optional[list]], None]
+
+
+class MemoryInvalidationBackend:
+    """Single-process backend: there are no other workers to notify."""
+    
+    async def start(self, deliver: Callable[[str], None], reset: Callable[[], None]) -> None:
+        pass
+    
+    async def send(self, payload: str) -> None:
+        pass
+    
+    async def stop(self) -> None:
+        pass
+
+
+class PostgresInvalidationBackend:
+    """LISTEN/NOTIFY over one dedicated asyncpg connection per worker."""
+    
+    def __init__(self, dsn: str, max_backoff: float = 30.0):
+        self.dsn = dsn
+        self.max_backoff = max_backoff
+        self._connection = None
+        self._lock = asyncio.Lock()
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._stopping = False
+    
+    async def start(self, deliver: Callable[[str], None], reset: Callable[[], None]) -> None:
+        self._deliver = deliver
+        self._reset = reset
+        await self._connect()
+    
+    async def _connect(self) -> None:
+        import asyncpg
+        
+        connection = await asyncpg.connect(self.dsn)
+        await connection.add_listener(CHANNEL, self._on_notify)
+        connection.add_termination_listener(self._on_terminated)
+        self._connection = connection
+    
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        self._deliver(payload)
+    
+    def _on_terminated(self, connection) -> None:
+        self._connection = None
+        if self._stopping:
+            return
+        logger.warning("⚠️  Cache invalidation listener lost its connection; clearing caches")
+        self._reset()
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.create_task(self._reconnect())
+    
+    async def _reconnect(self) -> None:
+        delay = 1.0
+        while not self._stopping:
+            await asyncio.sleep(delay)
+            try:
+                await self._connect()
+            except Exception as e:
+                logger.error(f"❌ Cache invalidation reconnect failed: {e}")
+                delay = min(delay * 2, self.max_backoff)
+                continue
+            # Drop whatever was published while we were not listening
+            self._reset()
+            return
+    
+    async def send(self, payload: str) -> None:
+        async with self._lock:
+            if self._connection is None:
+                raise ConnectionError("Invalidation listener is not connected")
+            await self._connection.execute("SELECT pg_notify($1, $2)", CHANNEL, payload)
+    
+    async def stop(self) -> None:
+        self._stopping = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
+
+
+class InvalidationBus:
+    """Fan-out of (entity, ids) evictions to local caches and other workers."""
+    
+    def __init__(self):
+        self.origin = uuid.uuid4().hex
+        self._handlers: dict[str, list[Handler]] = defaultdict(list)
+        self._backend = None
+        self._outbox: Optional[asyncio.Queue] = None
+        self._sender: Optional[asyncio.Task] = None
+    
+    def subscribe(self, entity: str, handler: Handler) -> None:
+        """Call handler with the ids evicted for entity (None: everything)."""
+        self._handlers[entity].append(handler)
+    
+    def _evict(self, entity: str, ids: Optional[list]) -> None:
+        for handler in self._handlers.get(entity, ()):
+            try:
+                handler(ids)
+            except Exception as e:
+                logger.error(f"❌ Cache invalidation of {entity} failed: {e}")
+    
+    def reset(self) -> None:
+        """Clear every subscribed cache of this worker."""
+        for entity in list(self._handlers):
+            self._evict(entity, None)
+    
+    def publish(self, entity: str, *ids: Hashable) -> None:
+        """Evict ids here now and on the other workers as soon as possible."""
+        ids = [item for item in ids if item is not None]
+        if not ids:
+            return
+        self._evict(entity, ids)
+        if self._outbox is not None:
+            for start in range(0, len(ids), MAX_IDS_PER_MESSAGE):
+                self._outbox.put_nowait(json.dumps({
+                    "origin": self.origin,
+                    "entity": entity,
+                    "ids": ids[start:start + MAX_IDS_PER_MESSAGE],
+                }))
+    
+    def _deliver(self, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            logger.warning(f"Ignoring malformed invalidation: {payload[:100]}")
+            return
+        # Our own publishes were applied locally already
+        if message.get("origin") != self.origin:
+            self._evict(message["entity"], message["ids"])
+    
+    async def _send_forever(self) -> None:
+        while True:
+            payload = await self._outbox.get()
+            try:
+                await self._backend.send(payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Other workers keep the entry until its TTL expires
+                logger.error(f"❌ Cache invalidation publish failed: {e}")
+    
+    async def start(self) -> None:
+        """Connect the backend chosen by CACHE_INVALIDATION_BACKEND."""
+        if self._backend is not None:
+            return
+        backend_name = settings.CACHE_INVALIDATION_BACKEND
+        if backend_name == "auto":
+            backend_name = "postgresql" if db_type == "postgresql" else "memory"
+        
+        backend = MemoryInvalidationBackend()
+        if backend_name == "postgresql":
+            dsn = database_url.replace("postgresql+asyncpg://", "postgresql://", 1)
+            try:
+                postgres_backend = PostgresInvalidationBackend(dsn)
+                await postgres_backend.start(self._deliver, self.reset)
+                backend = postgres_backend
+            except Exception as e:
+                logger.error(f"❌ Cache invalidation over LISTEN/NOTIFY unavailable, using local only: {e}")
+        
+        self._backend = backend
+        if isinstance(backend, PostgresInvalidationBackend):
+            self._outbox = asyncio.Queue()
+            self._sender = asyncio.create_task(self._send_forever())
+    
+    async def stop(self) -> None:
+        """Stop forwarding invalidations and close the backend."""
+        if self._sender is not None:
+            self._sender.cancel()
+            try:
+                await self._sender
+            except asyncio.CancelledError:
+                pass
+            self._sender = None
+        self._outbox = None
+        if self._backend is not None:
+            await self._backend.stop()
+            self._backend = None
+
+
+# Process-wide bus started from app startup
+invalidation_bus = InvalidationBus()
+
+
+def invalidate_after_commit(db: AsyncSession, entity: str, *ids: Hashable) -> None:
+    """
+    Publish an invalidation once db commits; dropped if it rolls back.
+    
+    Without an open transaction there is nothing left to commit, so it is
+    published right away.
+    """
+    if not db.sync_session.in_transaction():
+        invalidation_bus.publish(entity, *ids)
+        return
+    db.sync_session.info.setdefault(PENDING_KEY, []).append((entity, ids))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending(session: Session) -> None:
+    for entity, ids in session.info.pop(PENDING_KEY, ()):
+        invalidation_bus.publish(entity, *ids)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending(session: Session, previous_transaction) -> None:
+    # Savepoint rollbacks keep the outer transaction's invalidations
+    if previous_transaction.parent is None:
+        session.info.pop(PENDING_KEY, None)
@@ -0,0 +1,46 @@
+"""
+Cross-node advisory locks for background jobs.
+
+Lets periodic jobs (sweepers, refreshers) run on every instance while only
+one of them does the work at a time. The lock lives on a dedicated
+connection held for the duration of the job, so it survives the job's own
+per-batch commits and is released if the process dies.
+"""
+import zlib
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy import text
+
+from app.core.database import engine, db_type
+
+
+@asynccontextmanager
+async def advisory_lock(name: str) -> AsyncIterator[bool]:
+    """
+    Try to take a named lock without waiting.
+    
+    Yields True if this node holds the lock (and should do the work),
+    False if another node does.
+    """
+    async with engine.connect() as conn:
+        if db_type == "postgresql":
+            # pg advisory locks are keyed by bigint
+            key = zlib.crc32(name.encode())
+            acquired = (await conn.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": key}
+            )).scalar()
+            release = text("SELECT pg_advisory_unlock(:key)"), {"key": key}
+        else:
+            acquired = (await conn.execute(
+                text("SELECT GET_LOCK(:name, 0)"), {"name": name}
+            )).scalar() == 1
+            release = text("SELECT RELEASE_LOCK(:name)"), {"name": name}
+        await conn.commit()
+        
+        try:
+            yield bool(acquired)
+        finally:
+            if acquired:
+                await conn.execute(*release)
+                await conn.commit()
@@ -0,0 +1,193 @@
+"""
+Rate limiting primitives.
+
+TokenBucket paces outgoing calls (waits for tokens). RateLimiter and
+check_rate_limit protect incoming requests (reject with 429) using a
+pluggable backend: in-process memory by default, Redis for state shared
+across workers.
+"""
+import asyncio
+import math
+import time
+from collections import OrderedDict
+
+from fastapi import HTTPException, Request, status
+
+from app.core.config import settings
+
+
+class TokenBucket:
+    """
+    Async token bucket.
+    
+    Tokens refill continuously at `rate` per second up to `capacity`
+    (the allowed burst). acquire() waits until enough tokens are available,
+    so callers are paced instead of rejected.
+    """
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+    
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Wait until `tokens` are available and take them."""
+        # The lock makes waiters queue in order instead of racing each refill
+        async with self._lock:
+            self._refill()
+            if self.tokens < tokens:
+                await asyncio.sleep((tokens - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= tokens
+
+
+class MemoryRateLimitBackend:
+    """
+    Per-process token buckets keyed by string.
+    
+    The default backend and the stand-in for tests. With several workers
+    each one enforces the limit on its own, so the effective limit is
+    multiplied by the worker count; use the Redis backend to share state.
+    """
+    
+    def __init__(self, max_keys: int = 100000):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+    
+    async def take(self, key: str, rate: float, capacity: float, cost: float = 1.0) -> tuple[bool, float]:
+        """
+        Take cost tokens from a bucket refilling at rate/s up to capacity.
+        
+        Returns (allowed, seconds until enough tokens are available).
+        """
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.pop(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated_at) * rate)
+        
+        allowed = tokens >= cost
+        if allowed:
+            tokens -= cost
+        
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        
+        return allowed, 0.0 if allowed else (cost - tokens) / rate
+
+
+# Atomic token bucket in Redis: KEYS[1] bucket, ARGV rate, capacity, cost
+_REDIS_TOKEN_BUCKET = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(state[1]) or capacity
+local updated_at = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + (now - updated_at) * rate)
+local allowed = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated_at', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return {allowed, tostring(tokens)}
+"""
+
+
+class RedisRateLimitBackend:
+    """Token buckets shared by every worker and node through Redis (optional)."""
+    
+    def __init__(self, url: str):
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as e:
+            raise RuntimeError(
+                "RATE_LIMIT_BACKEND=redis requires the 'redis' package"
+            ) from e
+        self.client = redis_asyncio.from_url(url)
+        self.script = self.client.register_script(_REDIS_TOKEN_BUCKET)
+    
+    async def take(self, key: str, rate: float, capacity: float, cost: float = 1.0) -> tuple[bool, float]:
+        allowed, tokens = await self.script(keys=[f"ratelimit:{key}"], args=[rate, capacity, cost])
+        if allowed:
+            return True, 0.0
+        return False, (cost - float(tokens)) / rate
+
+
+_backend = None
+
+
+def get_rate_limit_backend():
+    """Process-wide backend selected by RATE_LIMIT_BACKEND."""
+    global _backend
+    if _backend is None:
+        if settings.RATE_LIMIT_BACKEND == "redis":
+            _backend = RedisRateLimitBackend(settings.REDIS_URL)
+        else:
+            _backend = MemoryRateLimitBackend()
+    return _backend
+
+
+def client_ip(request: Request) -> str:
+    """
+    Client address for rate limiting.
+    
+    Behind RATE_LIMIT_TRUSTED_PROXY_HOPS proxies it is the X-Forwarded-For
+    entry the outermost one appended, counted from the right: anything
+    further left came from the client and could be rotated to dodge limits.
+    Requests that did not pass through every proxy use the socket address.
+    """
+    hops = settings.RATE_LIMIT_TRUSTED_PROXY_HOPS
+    if hops > 0:
+        forwarded = [
+            entry.strip()
+            for entry in request.headers.get("x-forwarded-for", "").split(",")
+            if entry.strip()
+        ]
+        if len(forwarded) >= hops:
+            return forwarded[-hops]
+    return request.client.host if request.client else "unknown"
+
+
+async def check_rate_limit(scope: str, key: str, per_minute: float, burst: int) -> None:
+    """Raise 429 (with Retry-After) when key exhausted its bucket in scope."""
+    if not settings.RATE_LIMIT_ENABLED:
+        return
+    
+    allowed, retry_after = await get_rate_limit_backend().take(
+        f"{scope}:{key}", per_minute / 60.0, burst
+    )
+    if not allowed:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests. Please try again later.",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+        )
+
+
+class RateLimiter:
+    """
+    Router dependency limiting requests per client IP.
+    
+    Declared at router level (APIRouter(dependencies=[...])) so throttled
+    requests are rejected before endpoint work such as password hashing or
+    database access.
+    """
+    
+    def __init__(self, scope: str, per_minute: float, burst: int):
+        self.scope = scope
+        self.per_minute = per_minute
+        self.burst = burst
+    
+    async def __call__(self, request: Request) -> None:
+        await check_rate_limit(self.scope, client_ip(request), self.per_minute, self.burst)
@@ -0,0 +1,47 @@
+"""
+Single-flight request coalescing.
+
+Concurrent calls with the same key share one execution: the first caller
+starts it and everyone arriving before it finishes awaits the same result
+(or exception). Used on cache misses of hot reads so a popular entry
+expiring, or a cold cache after a deploy, costs one query instead of one
+per waiting request.
+
+The shared call runs as its own task: a caller that is cancelled (client
+gone) stops waiting without cancelling the call for the others. It should
+therefore not use a request-scoped database session; loaders open their
+own.
+"""
+import asyncio
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesce concurrent identical async calls into one."""
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """Return call()'s result, sharing it with concurrent callers of key."""
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self._calls[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        # Don't warn about an exception nobody is left to retrieve
+        if not future.cancelled():
+            future.exception()
+
+    def in_flight(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    def __len__(self) -> int:
+        return len(self._calls)
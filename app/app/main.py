@@ -8,7 +8,7 @@ from fastapi.responses import JSONResponse
 import logging
 
 from app.core.config import settings
-from app.api import auth, users, profiles, campaigns, notifications, subscription_plans, transactions
+from app.api import auth, users, profiles, campaigns, notifications, subscription_plans, transactions, exports, dashboard
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -62,6 +62,8 @@ app.include_router(campaigns.router)
 app.include_router(notifications.router)
 app.include_router(subscription_plans.router)
 app.include_router(transactions.router)
+app.include_router(exports.router)
+app.include_router(dashboard.router)
 
 
 @app.get("/")
@@ -116,6 +118,32 @@ async def startup_event():
         import traceback
         traceback.print_exc()
         # No interrumpir el inicio de la app
+    
+    # Cross-worker eviction of in-process caches
+    from app.core.invalidation import invalidation_bus
+    await invalidation_bus.start()
+    
+    # Trial/subscription expiry (one node at a time via advisory lock)
+    if settings.EXPIRY_SWEEP_ENABLED:
+        from app.services.expiry_sweeper import expiry_sweeper
+        expiry_sweeper.start()
+    
+    # Profile view counters (buffered, flushed periodically)
+    if settings.PROFILE_VIEWS_ENABLED:
+        from app.services.profile_views import profile_view_buffer
+        profile_view_buffer.start()
+    
+    # Email delivery workers (notifications are emailed after commit)
+    if settings.SMTP_HOST:
+        from app.services.email_service import email_dispatcher
+        email_dispatcher.start()
+        print(f"📧 Email dispatcher started ({settings.EMAIL_POOL_SIZE} SMTP connections)")
+    
+    # Background TikTok insights refresher (enable on a single instance)
+    if settings.TIKTOK_REFRESH_ENABLED and settings.TIKTOK_CLIENT_KEY:
+        from app.services.tiktok_refresher import tiktok_refresher
+        tiktok_refresher.start()
+        print("🎵 TikTok insights refresher started")
 
 
 @app.on_event("shutdown")
@@ -125,3 +153,28 @@ async def shutdown_event():
     Clean up resources.
     """
     print("Shutting down...")
+    
+    if settings.TIKTOK_REFRESH_ENABLED and settings.TIKTOK_CLIENT_KEY:
+        from app.services.tiktok_refresher import tiktok_refresher
+        await tiktok_refresher.stop()
+    
+    if settings.EXPIRY_SWEEP_ENABLED:
+        from app.services.expiry_sweeper import expiry_sweeper
+        await expiry_sweeper.stop()
+    
+    if settings.PROFILE_VIEWS_ENABLED:
+        from app.services.profile_views import profile_view_buffer
+        await profile_view_buffer.stop()
+    
+    if settings.SMTP_HOST:
+        from app.services.email_service import email_dispatcher
+        await email_dispatcher.stop()
+    
+    from app.services.explorer_cache import explorer_cache
+    await explorer_cache.stop()
+    
+    from app.services.import_service import shutdown_hash_pool
+    shutdown_hash_pool()
+    
+    from app.core.invalidation import invalidation_bus
+    await invalidation_bus.stop()
@@ -5,10 +5,13 @@ Exports all models for easy importing.
 from app.models.user import User
 from app.models.profile import InfluencerProfile
 from app.models.campaign import Campaign, CampaignStatus
+from app.models.campaign_event import CampaignStatusEvent, CampaignFunnelDaily
 from app.models.notification import Notification
 from app.models.message import Message
 from app.models.subscription import Subscription, SubscriptionStatus
 from app.models.subscription_plan import SubscriptionPlan
+from app.models.insight import InsightSnapshot, InsightRollup
+from app.models.profile_view import ProfileViewCounter
 from app.models.transaction import Transaction, TransactionType, TransactionStatus
 
 __all__ = [
@@ -16,11 +19,16 @@ __all__ = [
     "InfluencerProfile",
     "Campaign",
     "CampaignStatus",
+    "CampaignStatusEvent",
+    "CampaignFunnelDaily",
     "Notification",
     "Message",
     "Subscription",
     "SubscriptionStatus",
     "SubscriptionPlan",
+    "InsightSnapshot",
+    "InsightRollup",
+    "ProfileViewCounter",
     "Transaction",
     "TransactionType",
     "TransactionStatus",
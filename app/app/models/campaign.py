@@ -4,7 +4,7 @@ Campaign model representing collaboration proposals between empresas and influen
 import enum
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import String, Integer, Text, Float, ForeignKey, DateTime, Enum
+from sqlalchemy import String, Integer, Text, Float, ForeignKey, DateTime, Enum, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -27,6 +27,11 @@ class Campaign(Base):
     Tracks the entire lifecycle from proposal to completion.
     """
     __tablename__ = "campaigns"
+    __table_args__ = (
+        # Per-party dashboards and lists filter by party and group by status
+        Index("ix_campaigns_empresa_status", "empresa_id", "status"),
+        Index("ix_campaigns_influencer_status", "influencer_id", "status"),
+    )
     
     # Primary Key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
@@ -35,15 +40,13 @@ class Campaign(Base):
     empresa_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("users.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     influencer_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("users.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # Campaign Details
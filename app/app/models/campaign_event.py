@@ -0,0 +1,74 @@
+"""
+Campaign status history and its daily funnel rollup.
+"""
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import Integer, Float, ForeignKey, DateTime, Enum, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+from app.models.campaign import CampaignStatus
+
+# Statuses are stored by name in plain VARCHAR columns so the tables don't
+# share (and lock) the campaignstatus type of the campaigns table
+StatusColumn = Enum(CampaignStatus, native_enum=False, length=20)
+
+
+class CampaignStatusEvent(Base):
+    """
+    One status transition of a campaign (creation has no from_status).
+    
+    seconds_since_proposal and latency_bucket are computed when the event is
+    written so rollups need no join back to campaigns.
+    """
+    __tablename__ = "campaign_status_events"
+    
+    # Primary Key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    
+    campaign_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("campaigns.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+    from_status: Mapped[Optional[CampaignStatus]] = mapped_column(StatusColumn, nullable=True)
+    to_status: Mapped[CampaignStatus] = mapped_column(StatusColumn, nullable=False)
+    occurred_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        index=True
+    )
+    
+    # Time since the proposal was created
+    seconds_since_proposal: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    latency_bucket: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    
+    def __repr__(self) -> str:
+        return f"<CampaignStatusEvent(campaign_id={self.campaign_id}, {self.from_status}->{self.to_status})>"
+
+
+class CampaignFunnelDaily(Base):
+    """
+    Transitions into a status per day and time-since-proposal bucket.
+    """
+    __tablename__ = "campaign_funnel_daily"
+    __table_args__ = (
+        Index("ix_campaign_funnel_daily_day_status", "day", "to_status"),
+    )
+    
+    # Primary Key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    
+    day: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    to_status: Mapped[CampaignStatus] = mapped_column(StatusColumn, nullable=False)
+    latency_bucket: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    
+    # Aggregates
+    transitions: Mapped[int] = mapped_column(Integer, nullable=False)
+    seconds_sum: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    
+    def __repr__(self) -> str:
+        return f"<CampaignFunnelDaily(day={self.day}, to_status={self.to_status}, transitions={self.transitions})>"
@@ -0,0 +1,89 @@
+"""
+Social insights time series: raw snapshots and downsampled rollups.
+"""
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import String, Integer, BigInteger, Float, ForeignKey, DateTime, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class InsightSnapshot(Base):
+    """
+    One capture of a profile's metrics on one network.
+    Raw snapshots are kept for a retention window and then only survive
+    as daily/weekly rollups.
+    """
+    __tablename__ = "insight_snapshots"
+    __table_args__ = (
+        # Natural key; also serves (profile, network) + time range scans
+        UniqueConstraint("profile_id", "network", "captured_at", name="uq_insight_snapshots_key"),
+    )
+    
+    # Primary Key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    
+    # Series key
+    profile_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("influencer_profiles.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    network: Mapped[str] = mapped_column(String(20), nullable=False)
+    captured_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+    
+    # Metrics
+    followers: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    following: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    posts_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    total_likes: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    avg_views: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    avg_likes: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    avg_comments: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    avg_shares: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    engagement_rate: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    profile_views: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    reach: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    impressions: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    
+    def __repr__(self) -> str:
+        return f"<InsightSnapshot(profile_id={self.profile_id}, network={self.network}, captured_at={self.captured_at})>"
+
+
+class InsightRollup(Base):
+    """
+    Pre-aggregated insights for one profile, network and day/week bucket.
+    """
+    __tablename__ = "insight_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "profile_id", "network", "granularity", "bucket_start",
+            name="uq_insight_rollups_key"
+        ),
+    )
+    
+    # Primary Key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    
+    # Series key
+    profile_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("influencer_profiles.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    network: Mapped[str] = mapped_column(String(20), nullable=False)
+    granularity: Mapped[str] = mapped_column(String(10), nullable=False)  # day | week
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+    
+    # Aggregates
+    samples: Mapped[int] = mapped_column(Integer, nullable=False)
+    followers_min: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    followers_max: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    engagement_rate_avg: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    avg_views_avg: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    avg_likes_avg: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    avg_comments_avg: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    
+    def __repr__(self) -> str:
+        return f"<InsightRollup(profile_id={self.profile_id}, network={self.network}, {self.granularity}={self.bucket_start})>"
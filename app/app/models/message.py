@@ -3,7 +3,7 @@ Message model for internal messaging between empresas and influencers.
 """
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import String, Integer, Text, Boolean, ForeignKey, DateTime
+from sqlalchemy import String, Integer, Text, Boolean, ForeignKey, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -15,6 +15,10 @@ class Message(Base):
     Message model for campaign-related communication.
     """
     __tablename__ = "messages"
+    __table_args__ = (
+        # Unread message counts per receiver
+        Index("ix_messages_receiver_unread", "receiver_id", "is_read"),
+    )
     
     # Primary Key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
@@ -37,8 +41,7 @@ class Message(Base):
     receiver_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("users.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # Message Content
@@ -3,7 +3,7 @@ Notification model for user alerts and updates.
 """
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import String, Integer, Text, Boolean, ForeignKey, DateTime
+from sqlalchemy import String, Integer, Text, Boolean, ForeignKey, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -15,6 +15,10 @@ class Notification(Base):
     Notification model for alerting users about important events.
     """
     __tablename__ = "notifications"
+    __table_args__ = (
+        # Finds the open digest entry of a user and type
+        Index("ix_notifications_digest", "user_id", "notification_type", "created_at"),
+    )
     
     # Primary Key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
@@ -41,6 +45,17 @@ class Notification(Base):
     # Status
     is_read: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     
+    # Digest: number of events coalesced into this entry (message is the latest)
+    digest_count: Mapped[int] = mapped_column(Integer, default=1, server_default="1", nullable=False)
+    
+    # Digest email owed at this time (set when events are coalesced into the
+    # entry, cleared when the email is queued)
+    email_due_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        index=True
+    )
+    
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
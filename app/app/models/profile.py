@@ -3,7 +3,7 @@ Influencer profile model with metrics and portfolio information.
 """
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import String, Integer, Text, Float, ForeignKey, DateTime, JSON
+from sqlalchemy import String, Integer, Text, Float, ForeignKey, DateTime, JSON, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -16,6 +16,16 @@ class InfluencerProfile(Base):
     Contains social media metrics, rates, and portfolio.
     """
     __tablename__ = "influencer_profiles"
+    __table_args__ = (
+        # Rating-sorted explorer pages (average_rating DESC NULLS LAST, id DESC);
+        # MySQL sorts NULLs lowest and scans the plain index backwards
+        Index(
+            "ix_influencer_profiles_rating_order",
+            "average_rating",
+            "id",
+            postgresql_ops={"average_rating": "DESC NULLS LAST", "id": "DESC"}
+        ),
+    )
     
     # Primary Key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
@@ -45,8 +55,9 @@ class InfluencerProfile(Base):
     # Engagement Metrics
     average_engagement_rate: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     
-    # Social Media Insights (stored as JSON)
-    tiktok_insights: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    # Latest Social Media Insights (stored as JSON). Deferred: history lives
+    # in insight_snapshots/insight_rollups and profile reads never need it.
+    tiktok_insights: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True, deferred=True)
     
     # Pricing
     suggested_rate_per_post: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
@@ -59,8 +70,10 @@ class InfluencerProfile(Base):
     # Portfolio (array of URLs or objects)
     portfolio_items: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     
-    # Statistics
+    # Statistics (running aggregates, maintained with completions and ratings)
     total_campaigns_completed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    rating_sum: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    rating_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
     average_rating: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     
     # Timestamps
@@ -73,7 +86,8 @@ class InfluencerProfile(Base):
         DateTime(timezone=True),
         server_default=func.now(),
         onupdate=func.now(),
-        nullable=False
+        nullable=False,
+        index=True
     )
     
     # Relationships
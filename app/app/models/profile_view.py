@@ -0,0 +1,42 @@
+"""
+Hourly profile view counters.
+"""
+from datetime import datetime
+from sqlalchemy import Integer, ForeignKey, DateTime, Enum, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+from app.models.user import UserRole
+
+
+class ProfileViewCounter(Base):
+    """
+    Views of one profile by users of one role during one hour.
+    
+    Written by the in-memory view buffer as bulk upserts that add to views.
+    """
+    __tablename__ = "profile_view_counters"
+    __table_args__ = (
+        # Upsert key; also serves per-profile time range scans
+        UniqueConstraint("profile_id", "hour", "viewer_role", name="uq_profile_view_counters_key"),
+    )
+    
+    # Primary Key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    
+    # Counter key
+    profile_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("influencer_profiles.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    hour: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    viewer_role: Mapped[UserRole] = mapped_column(
+        Enum(UserRole, native_enum=False, length=20),
+        nullable=False
+    )
+    
+    views: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    
+    def __repr__(self) -> str:
+        return f"<ProfileViewCounter(profile_id={self.profile_id}, hour={self.hour}, {self.viewer_role}={self.views})>"
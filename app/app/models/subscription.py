@@ -4,7 +4,7 @@ Subscription model for empresa monthly subscriptions.
 import enum
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import String, Integer, Float, ForeignKey, DateTime, Enum
+from sqlalchemy import String, Integer, Float, ForeignKey, DateTime, Enum, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -25,6 +25,10 @@ class Subscription(Base):
     Tracks monthly subscription payments and status.
     """
     __tablename__ = "subscriptions"
+    __table_args__ = (
+        # Expiry sweeper: ACTIVA subscriptions past their period end
+        Index("ix_subscriptions_status_period_end", "status", "current_period_end"),
+    )
     
     # Primary Key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
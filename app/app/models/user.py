@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import Optional
 from sqlalchemy import String, Boolean, DateTime, Enum, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, expression
 
 from app.core.database import Base
 
@@ -45,6 +45,10 @@ class User(Base):
     trial_start_time: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     trial_profile_viewed_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     has_active_subscription: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    # Set by the expiry sweeper once the trial window has passed
+    trial_expired: Mapped[bool] = mapped_column(
+        Boolean, default=False, server_default=expression.false(), nullable=False
+    )
     
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -56,7 +60,8 @@ class User(Base):
         DateTime(timezone=True),
         server_default=func.now(),
         onupdate=func.now(),
-        nullable=False
+        nullable=False,
+        index=True
     )
     
     # Relationships
@@ -6,6 +6,11 @@ from app.repositories.profile_repository import ProfileRepository
 from app.repositories.campaign_repository import CampaignRepository
 from app.repositories.notification_repository import NotificationRepository
 from app.repositories.message_repository import MessageRepository
+from app.repositories.insight_repository import InsightRepository
+from app.repositories.profile_view_repository import ProfileViewRepository
+from app.repositories.dashboard_repository import DashboardRepository
+from app.repositories.funnel_repository import FunnelRepository
+from app.repositories.user_loader import UserLoader
 
 __all__ = [
     "UserRepository",
@@ -13,4 +18,9 @@ __all__ = [
     "CampaignRepository",
     "NotificationRepository",
     "MessageRepository",
+    "InsightRepository",
+    "ProfileViewRepository",
+    "DashboardRepository",
+    "FunnelRepository",
+    "UserLoader",
 ]
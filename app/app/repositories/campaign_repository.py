@@ -2,11 +2,15 @@
 Repository for Campaign model data access.
 """
 from typing import Optional
-from sqlalchemy import select, or_
+from sqlalchemy import Row, select, update, or_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
 from app.models.campaign import Campaign, CampaignStatus
+from app.repositories.fields import fetch_rows, load_only_option, projection
+from app.schemas.campaign_schemas import CampaignResponse
+
+# Always loaded so authorization checks work on sparse reads
+PARTY_FIELDS = ["empresa_id", "influencer_id"]
 
 
 class CampaignRepository:
@@ -22,15 +26,25 @@ class CampaignRepository:
         await self.db.refresh(campaign)
         return campaign
     
-    async def get_by_id(self, campaign_id: int) -> Optional[Campaign]:
-        """Get campaign by ID with relationships."""
+    def _select(self, fields: Optional[list[str]] = None):
+        """Base campaign query, restricted to the requested columns if given."""
+        query = select(Campaign)
+        if fields is not None:
+            query = query.options(load_only_option(Campaign, [*fields, *PARTY_FIELDS]))
+        return query
+    
+    def _select_rows(self, fields: Optional[list[str]] = None):
+        """Read-model query: only the response columns, returned as rows."""
+        return select(*projection(Campaign, CampaignResponse, fields, PARTY_FIELDS))
+    
+    async def get_by_id(
+        self,
+        campaign_id: int,
+        fields: Optional[list[str]] = None
+    ) -> Optional[Campaign]:
+        """Get campaign by ID (party names are resolved by the UserLoader)."""
         result = await self.db.execute(
-            select(Campaign)
-            .options(
-                joinedload(Campaign.empresa),
-                joinedload(Campaign.influencer)
-            )
-            .where(Campaign.id == campaign_id)
+            self._select(fields).where(Campaign.id == campaign_id)
         )
         return result.scalar_one_or_none()
     
@@ -39,46 +53,48 @@ class CampaignRepository:
         empresa_id: int,
         status: Optional[CampaignStatus] = None,
         skip: int = 0,
-        limit: int = 100
-    ) -> list[Campaign]:
+        limit: int = 100,
+        fields: Optional[list[str]] = None
+    ) -> list[Row]:
         """Get campaigns created by an empresa."""
-        query = select(Campaign).where(Campaign.empresa_id == empresa_id)
+        query = self._select_rows(fields).where(Campaign.empresa_id == empresa_id)
         
         if status:
             query = query.where(Campaign.status == status)
         
         query = query.offset(skip).limit(limit)
         
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+        return await fetch_rows(self.db, query)
     
     async def get_by_influencer(
         self,
         influencer_id: int,
         status: Optional[CampaignStatus] = None,
         skip: int = 0,
-        limit: int = 100
-    ) -> list[Campaign]:
+        limit: int = 100,
+        fields: Optional[list[str]] = None
+    ) -> list[Row]:
         """Get campaigns received by an influencer."""
-        query = select(Campaign).where(Campaign.influencer_id == influencer_id)
+        query = self._select_rows(fields).where(Campaign.influencer_id == influencer_id)
         
         if status:
             query = query.where(Campaign.status == status)
         
         query = query.offset(skip).limit(limit)
         
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+        return await fetch_rows(self.db, query)
     
     async def get_by_user(
         self,
         user_id: int,
         skip: int = 0,
-        limit: int = 100
-    ) -> list[Campaign]:
+        limit: int = 100,
+        fields: Optional[list[str]] = None
+    ) -> list[Row]:
         """Get all campaigns involving a user (as empresa or influencer)."""
-        result = await self.db.execute(
-            select(Campaign)
+        return await fetch_rows(
+            self.db,
+            self._select_rows(fields)
             .where(
                 or_(
                     Campaign.empresa_id == user_id,
@@ -88,7 +104,47 @@ class CampaignRepository:
             .offset(skip)
             .limit(limit)
         )
-        return list(result.scalars().all())
+    
+    async def mark_completed(self, campaign_id: int) -> bool:
+        """
+        Move an ACTIVA campaign to FINALIZADA.
+        
+        The status check is part of the UPDATE, so concurrent requests can
+        complete a campaign (and count it) only once.
+        """
+        result = await self.db.execute(
+            update(Campaign)
+            .where(Campaign.id == campaign_id, Campaign.status == CampaignStatus.ACTIVA)
+            .values(status=CampaignStatus.FINALIZADA)
+        )
+        return result.rowcount == 1
+    
+    async def set_rating(
+        self,
+        campaign_id: int,
+        by_empresa: bool,
+        rating: int,
+        review: Optional[str] = None
+    ) -> bool:
+        """
+        Store one party's rating of a finalized campaign, once.
+        
+        by_empresa selects empresa_rating/empresa_review (the empresa rating
+        the influencer) or influencer_rating/influencer_review.
+        """
+        rating_column = Campaign.empresa_rating if by_empresa else Campaign.influencer_rating
+        review_column = Campaign.empresa_review if by_empresa else Campaign.influencer_review
+        
+        result = await self.db.execute(
+            update(Campaign)
+            .where(
+                Campaign.id == campaign_id,
+                Campaign.status == CampaignStatus.FINALIZADA,
+                rating_column.is_(None)
+            )
+            .values({rating_column: rating, review_column: review})
+        )
+        return result.rowcount == 1
     
     async def update(self, campaign: Campaign) -> Campaign:
         """Update campaign."""
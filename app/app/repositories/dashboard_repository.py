@@ -0,0 +1,129 @@
+"""
+Dashboard repository: grouped aggregate queries behind the role dashboards.
+
+Each method answers one metric family with a single grouped statement, so
+a dashboard load costs a handful of index-backed queries instead of the
+full campaign and transaction lists.
+"""
+from datetime import datetime
+from sqlalchemy import and_, case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.models.campaign import Campaign, CampaignStatus
+from app.models.message import Message
+from app.models.notification import Notification
+from app.models.transaction import Transaction, TransactionStatus
+from app.models.user import User
+from app.repositories.functions import date_bucket
+
+# The budget a campaign settles at: the negotiated one when set
+SETTLED_BUDGET = func.coalesce(Campaign.final_budget, Campaign.proposed_budget)
+
+
+class DashboardRepository:
+    """Aggregate queries for empresa, influencer and admin dashboards."""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def campaign_status_totals(
+        self,
+        party_column: InstrumentedAttribute = None,
+        user_id: int = None
+    ) -> dict[CampaignStatus, tuple[int, float]]:
+        """
+        Campaign count and settled budget sum per status.
+        
+        Scoped to one party when party_column (Campaign.empresa_id or
+        Campaign.influencer_id) and user_id are given; served by the
+        (party, status) indexes.
+        """
+        query = select(
+            Campaign.status,
+            func.count(),
+            func.coalesce(func.sum(SETTLED_BUDGET), 0)
+        ).group_by(Campaign.status)
+        if party_column is not None:
+            query = query.where(party_column == user_id)
+        
+        result = await self.db.execute(query)
+        return {row[0]: (row[1], float(row[2])) for row in result.all()}
+    
+    async def finished_campaigns_by_month(
+        self,
+        party_column: InstrumentedAttribute,
+        user_id: int,
+        since: datetime
+    ) -> list[tuple[datetime, float, int]]:
+        """
+        Settled budget and count of finished campaigns per month since since.
+        
+        A campaign counts in the month of its end date, or of its last
+        update (when it was finished) if it has none.
+        """
+        finished_at = func.coalesce(Campaign.end_date, Campaign.updated_at)
+        bucket = date_bucket("month", finished_at)
+        result = await self.db.execute(
+            select(bucket, func.sum(SETTLED_BUDGET), func.count())
+            .where(
+                party_column == user_id,
+                Campaign.status == CampaignStatus.FINALIZADA,
+                finished_at >= since
+            )
+            .group_by(bucket)
+            .order_by(bucket)
+        )
+        return [(row[0], float(row[1]), row[2]) for row in result.all()]
+    
+    async def unread_counts(self, user_id: int) -> tuple[int, int]:
+        """Unread messages and notifications of a user, in one round trip."""
+        unread_messages = (
+            select(func.count())
+            .select_from(Message)
+            .where(Message.receiver_id == user_id, Message.is_read == False)  # noqa: E712
+            .scalar_subquery()
+        )
+        unread_notifications = (
+            select(func.count())
+            .select_from(Notification)
+            .where(Notification.user_id == user_id, Notification.is_read == False)  # noqa: E712
+            .scalar_subquery()
+        )
+        result = await self.db.execute(select(unread_messages, unread_notifications))
+        messages, notifications = result.one()
+        return messages, notifications
+    
+    async def user_role_totals(self) -> dict:
+        """User count and pending approvals (active, not approved) per role."""
+        pending = case((and_(User.is_active == True, User.is_approved == False), 1), else_=0)  # noqa: E712
+        result = await self.db.execute(
+            select(User.role, func.count(), func.coalesce(func.sum(pending), 0))
+            .group_by(User.role)
+        )
+        return {row[0]: (row[1], int(row[2])) for row in result.all()}
+    
+    async def transaction_status_totals(self) -> dict[TransactionStatus, tuple[int, float]]:
+        """Transaction count and amount per status."""
+        result = await self.db.execute(
+            select(
+                Transaction.status,
+                func.count(),
+                func.coalesce(func.sum(Transaction.amount), 0)
+            ).group_by(Transaction.status)
+        )
+        return {row[0]: (row[1], float(row[2])) for row in result.all()}
+    
+    async def revenue_by_month(self, since: datetime) -> list[tuple[datetime, float, int]]:
+        """Completed transaction amount and count per month since since."""
+        bucket = date_bucket("month", Transaction.created_at)
+        result = await self.db.execute(
+            select(bucket, func.sum(Transaction.amount), func.count())
+            .where(
+                Transaction.status == TransactionStatus.COMPLETED,
+                Transaction.created_at >= since
+            )
+            .group_by(bucket)
+            .order_by(bucket)
+        )
+        return [(row[0], float(row[1]), row[2]) for row in result.all()]
@@ -0,0 +1,51 @@
+"""
+Helpers for column-restricted loads driven by sparse fieldsets.
+
+load_only_option() restricts ORM loads (single reads and writes);
+projection() builds the column list of Core read models used by list
+endpoints, which return plain rows instead of hydrated instances.
+"""
+from typing import Any, Iterable, Optional
+from pydantic import BaseModel
+from sqlalchemy import Row, Select, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+
+
+def column_attributes(model: Any, fields: Iterable[str]) -> list:
+    """Map field names to the model's column attributes, skipping computed fields."""
+    column_keys = set(inspect(model).column_attrs.keys())
+    return [getattr(model, name) for name in fields if name in column_keys]
+
+
+def load_only_option(model: Any, fields: Iterable[str]):
+    """Build a load_only() option restricted to the requested columns."""
+    return load_only(*column_attributes(model, fields))
+
+
+def projection(
+    model: Any,
+    schema: type[BaseModel],
+    fields: Optional[Iterable[str]] = None,
+    always: Iterable[str] = ()
+) -> list:
+    """
+    Columns backing a response schema (or only the requested fields).
+    
+    Used as select(*projection(...)): rows come back as lightweight Row
+    tuples with attribute access, without identity-map bookkeeping.
+    """
+    names = list(fields) if fields is not None else list(schema.model_fields)
+    return column_attributes(model, dict.fromkeys([*always, *names]))
+
+
+async def fetch_rows(db: AsyncSession, query: Select) -> list[Row]:
+    """
+    Execute a read-model query on the session's connection.
+    
+    Bypasses ORM result processing (and autoflush): meant for list reads,
+    not for reading back pending writes of the same session.
+    """
+    connection = await db.connection()
+    result = await connection.execute(query)
+    return list(result.all())
@@ -0,0 +1,57 @@
+"""
+Portable SQL functions shared by repositories.
+"""
+from sqlalchemy import DateTime
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.sql.visitors import InternalTraversal
+
+BUCKET_UNITS = ("day", "week", "month")
+
+
+class date_bucket(FunctionElement):
+    """
+    Truncate a timestamp to the start of its day, ISO week (Monday) or month.
+    
+    Rendered per dialect; the unit is inlined as a literal so the same
+    expression can be used in SELECT and GROUP BY.
+    """
+    type = DateTime(timezone=True)
+    inherit_cache = True
+    name = "date_bucket"
+    # The unit is part of the statement cache key
+    _traverse_internals = FunctionElement._traverse_internals + [
+        ("unit", InternalTraversal.dp_string)
+    ]
+    
+    def __init__(self, unit: str, column):
+        if unit not in BUCKET_UNITS:
+            raise ValueError(f"Unsupported bucket unit: {unit}")
+        self.unit = unit
+        super().__init__(column)
+
+
+@compiles(date_bucket, "postgresql")
+def _date_bucket_postgresql(element, compiler, **kw):
+    column = compiler.process(list(element.clauses)[0], **kw)
+    return f"date_trunc('{element.unit}', {column})"
+
+
+@compiles(date_bucket, "mysql")
+def _date_bucket_mysql(element, compiler, **kw):
+    column = compiler.process(list(element.clauses)[0], **kw)
+    if element.unit == "day":
+        return f"CAST(DATE({column}) AS DATETIME)"
+    if element.unit == "month":
+        return f"CAST(DATE_SUB(DATE({column}), INTERVAL DAYOFMONTH({column}) - 1 DAY) AS DATETIME)"
+    return f"CAST(DATE_SUB(DATE({column}), INTERVAL WEEKDAY({column}) DAY) AS DATETIME)"
+
+
+@compiles(date_bucket, "sqlite")
+def _date_bucket_sqlite(element, compiler, **kw):
+    column = compiler.process(list(element.clauses)[0], **kw)
+    if element.unit == "day":
+        return f"datetime({column}, 'start of day')"
+    if element.unit == "month":
+        return f"datetime({column}, 'start of month')"
+    return f"datetime({column}, 'start of day', '-6 days', 'weekday 1')"
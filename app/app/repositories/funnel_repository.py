@@ -0,0 +1,89 @@
+"""
+Repository for campaign status events and the daily funnel rollup.
+"""
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.campaign import Campaign
+from app.models.campaign_event import CampaignFunnelDaily, CampaignStatusEvent
+from app.repositories.functions import date_bucket
+
+
+class FunnelRepository:
+    """Repository for CampaignStatusEvent and CampaignFunnelDaily operations."""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def add_events(self, events: list[CampaignStatusEvent]) -> None:
+        """Store status events (flushed with the campaign change)."""
+        self.db.add_all(events)
+        await self.db.flush()
+    
+    async def get_campaigns_without_events(self, limit: int) -> list[Campaign]:
+        """Campaigns that predate the event log, oldest first."""
+        has_events = select(CampaignStatusEvent.id).where(
+            CampaignStatusEvent.campaign_id == Campaign.id
+        ).exists()
+        result = await self.db.execute(
+            select(Campaign).where(~has_events).order_by(Campaign.id).limit(limit)
+        )
+        return list(result.scalars().all())
+    
+    async def rebuild_daily(self, since: datetime) -> int:
+        """
+        Recompute the daily rollup from since (a day boundary) onwards.
+        
+        Events are append-only and stamped when written, so only the days
+        since the previous refresh change: rebuilding them with one grouped
+        INSERT ... SELECT keeps the refresh incremental and idempotent.
+        Returns the number of rollup rows written.
+        """
+        await self.db.execute(
+            delete(CampaignFunnelDaily).where(CampaignFunnelDaily.day >= since)
+        )
+        
+        day = date_bucket("day", CampaignStatusEvent.occurred_at)
+        aggregates = (
+            select(
+                day,
+                CampaignStatusEvent.to_status,
+                CampaignStatusEvent.latency_bucket,
+                func.count(),
+                func.sum(CampaignStatusEvent.seconds_since_proposal),
+            )
+            .where(CampaignStatusEvent.occurred_at >= since)
+            .group_by(day, CampaignStatusEvent.to_status, CampaignStatusEvent.latency_bucket)
+        )
+        
+        result = await self.db.execute(
+            insert(CampaignFunnelDaily).from_select(
+                ["day", "to_status", "latency_bucket", "transitions", "seconds_sum"],
+                aggregates
+            )
+        )
+        return result.rowcount
+    
+    async def get_latest_day(self) -> Optional[datetime]:
+        """Most recent day present in the rollup."""
+        result = await self.db.execute(select(func.max(CampaignFunnelDaily.day)))
+        return result.scalar()
+    
+    async def get_totals(self, start: datetime, end: datetime) -> list[tuple]:
+        """
+        Transitions and summed latency per (status, latency bucket) for the
+        days in [start, end), read from the rollup only.
+        """
+        result = await self.db.execute(
+            select(
+                CampaignFunnelDaily.to_status,
+                CampaignFunnelDaily.latency_bucket,
+                func.sum(CampaignFunnelDaily.transitions),
+                func.sum(CampaignFunnelDaily.seconds_sum),
+            )
+            .where(CampaignFunnelDaily.day >= start, CampaignFunnelDaily.day < end)
+            .group_by(CampaignFunnelDaily.to_status, CampaignFunnelDaily.latency_bucket)
+        )
+        return [tuple(row) for row in result.all()]
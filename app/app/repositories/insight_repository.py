@@ -0,0 +1,130 @@
+"""
+Repository for insights time series (snapshots and rollups).
+"""
+from datetime import datetime
+from sqlalchemy import String, select, insert, delete, func, literal
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.insight import InsightSnapshot, InsightRollup
+from app.repositories.functions import date_bucket
+
+
+class InsightRepository:
+    """Repository for InsightSnapshot and InsightRollup operations."""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def create_snapshot(self, snapshot: InsightSnapshot) -> InsightSnapshot:
+        """Store a new snapshot."""
+        self.db.add(snapshot)
+        await self.db.flush()
+        return snapshot
+    
+    async def get_snapshots(
+        self,
+        profile_id: int,
+        network: str,
+        start: datetime,
+        end: datetime,
+        limit: int
+    ) -> list[InsightSnapshot]:
+        """Get raw snapshots of one series in [start, end), oldest first (at most limit)."""
+        result = await self.db.execute(
+            select(InsightSnapshot)
+            .where(
+                InsightSnapshot.profile_id == profile_id,
+                InsightSnapshot.network == network,
+                InsightSnapshot.captured_at >= start,
+                InsightSnapshot.captured_at < end
+            )
+            .order_by(InsightSnapshot.captured_at)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+    
+    async def get_rollups(
+        self,
+        profile_id: int,
+        network: str,
+        granularity: str,
+        start: datetime,
+        end: datetime
+    ) -> list[InsightRollup]:
+        """Get rollups of one series whose bucket starts in [start, end), oldest first."""
+        result = await self.db.execute(
+            select(InsightRollup)
+            .where(
+                InsightRollup.profile_id == profile_id,
+                InsightRollup.network == network,
+                InsightRollup.granularity == granularity,
+                InsightRollup.bucket_start >= start,
+                InsightRollup.bucket_start < end
+            )
+            .order_by(InsightRollup.bucket_start)
+        )
+        return list(result.scalars().all())
+    
+    async def rebuild_rollups(self, granularity: str, since: datetime) -> int:
+        """
+        Recompute every rollup bucket starting at or after since.
+        
+        since must be a bucket boundary. Buckets are deleted and re-inserted
+        from the raw snapshots with one grouped INSERT ... SELECT, so reruns
+        are idempotent. Returns the number of buckets written.
+        """
+        await self.db.execute(
+            delete(InsightRollup).where(
+                InsightRollup.granularity == granularity,
+                InsightRollup.bucket_start >= since
+            )
+        )
+        
+        bucket = date_bucket(granularity, InsightSnapshot.captured_at)
+        aggregates = (
+            select(
+                InsightSnapshot.profile_id,
+                InsightSnapshot.network,
+                literal(granularity, String),
+                bucket,
+                func.count(),
+                func.min(InsightSnapshot.followers),
+                func.max(InsightSnapshot.followers),
+                func.avg(InsightSnapshot.engagement_rate),
+                func.avg(InsightSnapshot.avg_views),
+                func.avg(InsightSnapshot.avg_likes),
+                func.avg(InsightSnapshot.avg_comments),
+            )
+            .where(InsightSnapshot.captured_at >= since)
+            .group_by(InsightSnapshot.profile_id, InsightSnapshot.network, bucket)
+        )
+        
+        result = await self.db.execute(
+            insert(InsightRollup).from_select(
+                [
+                    "profile_id", "network", "granularity", "bucket_start",
+                    "samples", "followers_min", "followers_max",
+                    "engagement_rate_avg", "avg_views_avg", "avg_likes_avg",
+                    "avg_comments_avg",
+                ],
+                aggregates
+            )
+        )
+        return result.rowcount
+    
+    async def delete_snapshots_before(self, cutoff: datetime) -> int:
+        """Drop raw snapshots older than cutoff."""
+        result = await self.db.execute(
+            delete(InsightSnapshot).where(InsightSnapshot.captured_at < cutoff)
+        )
+        return result.rowcount
+    
+    async def delete_rollups_before(self, granularity: str, cutoff: datetime) -> int:
+        """Drop rollups of one granularity whose bucket starts before cutoff."""
+        result = await self.db.execute(
+            delete(InsightRollup).where(
+                InsightRollup.granularity == granularity,
+                InsightRollup.bucket_start < cutoff
+            )
+        )
+        return result.rowcount
@@ -1,11 +1,14 @@
 """
 Repository for Notification model data access.
 """
+from datetime import datetime, timedelta
 from typing import Optional
-from sqlalchemy import select
+from sqlalchemy import Row, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.notification import Notification
+from app.repositories.fields import fetch_rows, projection
+from app.schemas.notification_schemas import NotificationResponse
 
 
 class NotificationRepository:
@@ -28,23 +31,107 @@ class NotificationRepository:
         )
         return result.scalar_one_or_none()
     
+    async def coalesce_into_digest(
+        self,
+        user_id: int,
+        notification_type: str,
+        since: datetime,
+        title: str,
+        message: str,
+        related_entity_type: Optional[str] = None,
+        related_entity_id: Optional[int] = None,
+        email_delay: Optional[timedelta] = None
+    ) -> Optional[Notification]:
+        """
+        Fold an event into the user's open digest entry of the same type.
+        
+        The open entry is the newest unread notification of that type created
+        at or after since. With email_delay, a digest email becomes due that
+        long after the entry was created. Returns it updated, or None if
+        there is none.
+        """
+        result = await self.db.execute(
+            select(Notification.id, Notification.created_at)
+            .where(
+                Notification.user_id == user_id,
+                Notification.notification_type == notification_type,
+                Notification.created_at >= since,
+                Notification.is_read.is_(False)
+            )
+            .order_by(Notification.created_at.desc())
+            .limit(1)
+        )
+        digest = result.one_or_none()
+        if digest is None:
+            return None
+        digest_id, created_at = digest
+        
+        values = dict(
+            digest_count=Notification.digest_count + 1,
+            title=title,
+            message=message,
+            related_entity_type=related_entity_type,
+            related_entity_id=related_entity_id
+        )
+        if email_delay is not None:
+            values["email_due_at"] = created_at + email_delay
+        
+        # is_read is re-checked so an entry read meanwhile is not reused
+        updated = await self.db.execute(
+            update(Notification)
+            .where(Notification.id == digest_id, Notification.is_read.is_(False))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        if updated.rowcount != 1:
+            return None
+        
+        return await self.db.get(Notification, digest_id, populate_existing=True)
+    
+    async def claim_due_emails(self, now: datetime, limit: int) -> list[int]:
+        """
+        Take up to limit digest emails due by now and return their ids.
+        
+        Each row is claimed by clearing email_due_at with a conditional
+        UPDATE, so workers polling concurrently never claim the same digest.
+        The caller commits.
+        """
+        result = await self.db.execute(
+            select(Notification.id)
+            .where(Notification.email_due_at <= now)
+            .order_by(Notification.email_due_at)
+            .limit(limit)
+        )
+        claimed = []
+        for notification_id in result.scalars().all():
+            updated = await self.db.execute(
+                update(Notification)
+                .where(Notification.id == notification_id, Notification.email_due_at.is_not(None))
+                .values(email_due_at=None)
+                .execution_options(synchronize_session=False)
+            )
+            if updated.rowcount == 1:
+                claimed.append(notification_id)
+        return claimed
+    
     async def get_by_user(
         self,
         user_id: int,
         is_read: Optional[bool] = None,
         skip: int = 0,
         limit: int = 100
-    ) -> list[Notification]:
-        """Get notifications for a user."""
-        query = select(Notification).where(Notification.user_id == user_id)
+    ) -> list[Row]:
+        """Get notifications for a user (read model: response columns as rows)."""
+        query = select(*projection(Notification, NotificationResponse)).where(
+            Notification.user_id == user_id
+        )
         
         if is_read is not None:
             query = query.where(Notification.is_read == is_read)
         
         query = query.order_by(Notification.created_at.desc()).offset(skip).limit(limit)
         
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+        return await fetch_rows(self.db, query)
     
     async def mark_as_read(self, notification: Notification) -> Notification:
         """Mark notification as read."""
@@ -2,11 +2,35 @@
 Repository for InfluencerProfile model data access.
 """
 from typing import Optional
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
+from app.core.database import db_type
 from app.models.profile import InfluencerProfile
+from app.models.user import User
+from app.repositories.fields import load_only_option
+
+# Columns needed to render an explorer card (no Text/JSON blobs except categories)
+SUMMARY_COLUMNS = (
+    InfluencerProfile.id,
+    InfluencerProfile.user_id,
+    User.full_name,
+    InfluencerProfile.profile_picture_url,
+    InfluencerProfile.instagram_handle,
+    InfluencerProfile.instagram_followers,
+    InfluencerProfile.tiktok_handle,
+    InfluencerProfile.tiktok_followers,
+    InfluencerProfile.youtube_handle,
+    InfluencerProfile.youtube_subscribers,
+    InfluencerProfile.average_engagement_rate,
+    InfluencerProfile.suggested_rate_per_post,
+    InfluencerProfile.suggested_rate_per_story,
+    InfluencerProfile.suggested_rate_per_video,
+    InfluencerProfile.categories,
+    InfluencerProfile.total_campaigns_completed,
+    InfluencerProfile.average_rating,
+)
 
 
 class ProfileRepository:
@@ -22,21 +46,42 @@ class ProfileRepository:
         await self.db.refresh(profile)
         return profile
     
-    async def get_by_id(self, profile_id: int) -> Optional[InfluencerProfile]:
+    async def bulk_create(self, rows: list[dict]) -> None:
+        """Insert profiles with a single multi-row INSERT."""
+        if rows:
+            await self.db.execute(insert(InfluencerProfile).values(rows))
+    
+    def _select(self, fields: Optional[list[str]] = None):
+        """
+        Base profile query, restricted to the requested columns if given.
+        
+        user_id is always loaded so the owner can be resolved by the
+        request's UserLoader.
+        """
+        query = select(InfluencerProfile)
+        if fields is None:
+            return query
+        return query.options(load_only_option(InfluencerProfile, [*fields, "user_id"]))
+    
+    async def get_by_id(
+        self,
+        profile_id: int,
+        fields: Optional[list[str]] = None
+    ) -> Optional[InfluencerProfile]:
         """Get profile by ID."""
         result = await self.db.execute(
-            select(InfluencerProfile)
-            .options(joinedload(InfluencerProfile.user))
-            .where(InfluencerProfile.id == profile_id)
+            self._select(fields).where(InfluencerProfile.id == profile_id)
         )
         return result.scalar_one_or_none()
     
-    async def get_by_user_id(self, user_id: int) -> Optional[InfluencerProfile]:
+    async def get_by_user_id(
+        self,
+        user_id: int,
+        fields: Optional[list[str]] = None
+    ) -> Optional[InfluencerProfile]:
         """Get profile by user ID."""
         result = await self.db.execute(
-            select(InfluencerProfile)
-            .options(joinedload(InfluencerProfile.user))
-            .where(InfluencerProfile.user_id == user_id)
+            self._select(fields).where(InfluencerProfile.user_id == user_id)
         )
         return result.scalar_one_or_none()
     
@@ -54,6 +99,78 @@ class ProfileRepository:
         )
         return list(result.scalars().all())
     
+    async def get_all_summaries(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[list[str]] = None,
+        sort_by_rating: bool = False
+    ) -> list[dict]:
+        """
+        Get explorer card rows.
+        
+        Selects only the summary columns (plus the owner's name) instead of
+        hydrating full profiles with their bio, portfolio and insights.
+        Optionally ordered by the stored average rating, best first.
+        """
+        columns = SUMMARY_COLUMNS
+        if fields is not None:
+            columns = [column for column in SUMMARY_COLUMNS if column.key in fields]
+        
+        query = select(*columns).join(User, User.id == InfluencerProfile.user_id)
+        if sort_by_rating:
+            # Matches ix_influencer_profiles_rating_order; unrated profiles last
+            # (PostgreSQL sorts NULLs first in DESC, MySQL/SQLite last)
+            rating_order = InfluencerProfile.average_rating.desc()
+            if db_type == "postgresql":
+                rating_order = rating_order.nullslast()
+            query = query.order_by(rating_order, InfluencerProfile.id.desc())
+        else:
+            query = query.order_by(InfluencerProfile.id)
+        
+        result = await self.db.execute(query.offset(skip).limit(limit))
+        return [dict(row) for row in result.mappings().all()]
+    
+    async def get_summaries_by_ids(self, profile_ids: list[int]) -> dict[int, dict]:
+        """Get explorer card rows for specific profiles, keyed by profile ID."""
+        if not profile_ids:
+            return {}
+        
+        result = await self.db.execute(
+            select(*SUMMARY_COLUMNS)
+            .join(User, User.id == InfluencerProfile.user_id)
+            .where(InfluencerProfile.id.in_(profile_ids))
+        )
+        return {row["id"]: dict(row) for row in result.mappings().all()}
+    
+    async def increment_completed(self, user_id: int) -> None:
+        """Count one more completed campaign for an influencer (atomic in SQL)."""
+        await self.db.execute(
+            update(InfluencerProfile)
+            .where(InfluencerProfile.user_id == user_id)
+            .values(total_campaigns_completed=InfluencerProfile.total_campaigns_completed + 1)
+        )
+    
+    async def add_rating(self, user_id: int, rating: int) -> None:
+        """
+        Fold one rating into an influencer's running aggregates (atomic in SQL).
+        
+        average_rating is assigned first and computed from the pre-update
+        values: PostgreSQL always reads old values in SET, while MySQL
+        evaluates assignments left to right.
+        """
+        new_sum = InfluencerProfile.rating_sum + rating
+        new_count = InfluencerProfile.rating_count + 1
+        await self.db.execute(
+            update(InfluencerProfile)
+            .where(InfluencerProfile.user_id == user_id)
+            .ordered_values(
+                (InfluencerProfile.average_rating, new_sum * 1.0 / new_count),
+                (InfluencerProfile.rating_sum, new_sum),
+                (InfluencerProfile.rating_count, new_count),
+            )
+        )
+    
     async def update(self, profile: InfluencerProfile) -> InfluencerProfile:
         """Update profile."""
         await self.db.flush()
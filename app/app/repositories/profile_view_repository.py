@@ -0,0 +1,68 @@
+"""
+Repository for hourly profile view counters.
+"""
+from datetime import datetime
+from sqlalchemy import func, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import db_type
+from app.models.profile_view import ProfileViewCounter
+from app.models.user import UserRole
+from app.repositories.functions import date_bucket
+
+# Rows per upsert statement (4 bind parameters each)
+UPSERT_CHUNK_SIZE = 1000
+
+
+class ProfileViewRepository:
+    """Repository for ProfileViewCounter operations."""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def add_views(self, counts: dict[tuple[int, UserRole, datetime], int]) -> None:
+        """
+        Add buffered view counts, keyed by (profile_id, viewer_role, hour),
+        with multi-row upserts that add to the stored counts.
+        """
+        rows = [
+            {"profile_id": profile_id, "viewer_role": viewer_role, "hour": hour, "views": views}
+            for (profile_id, viewer_role, hour), views in counts.items()
+        ]
+        
+        for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+            chunk = rows[start:start + UPSERT_CHUNK_SIZE]
+            if db_type == "postgresql":
+                statement = pg_insert(ProfileViewCounter).values(chunk)
+                statement = statement.on_conflict_do_update(
+                    index_elements=["profile_id", "hour", "viewer_role"],
+                    set_={"views": ProfileViewCounter.views + statement.excluded.views}
+                )
+            else:
+                statement = mysql_insert(ProfileViewCounter).values(chunk)
+                statement = statement.on_duplicate_key_update(
+                    views=ProfileViewCounter.views + statement.inserted.views
+                )
+            await self.db.execute(statement)
+    
+    async def get_daily_views(
+        self,
+        profile_id: int,
+        start: datetime,
+        end: datetime
+    ) -> list[tuple[datetime, UserRole, int]]:
+        """Views of a profile per day and viewer role for hours in [start, end)."""
+        day = date_bucket("day", ProfileViewCounter.hour)
+        result = await self.db.execute(
+            select(day, ProfileViewCounter.viewer_role, func.sum(ProfileViewCounter.views))
+            .where(
+                ProfileViewCounter.profile_id == profile_id,
+                ProfileViewCounter.hour >= start,
+                ProfileViewCounter.hour < end
+            )
+            .group_by(day, ProfileViewCounter.viewer_role)
+            .order_by(day)
+        )
+        return [(row[0], row[1], int(row[2])) for row in result.all()]
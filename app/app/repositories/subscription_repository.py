@@ -0,0 +1,85 @@
+"""
+Repository for Subscription model data access.
+"""
+from datetime import datetime
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.subscription import Subscription, SubscriptionStatus
+from app.models.subscription_plan import SubscriptionPlan
+from app.models.user import User
+
+
+class SubscriptionRepository:
+    """Repository for Subscription operations."""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def get_current_with_features(self, user_id: int, now: datetime) -> list:
+        """
+        Current ACTIVA subscriptions of a user with their plan features.
+        
+        Rows are (plan_name, current_period_end, features); features is None
+        when the plan no longer exists.
+        """
+        result = await self.db.execute(
+            select(
+                Subscription.plan_name,
+                Subscription.current_period_end,
+                SubscriptionPlan.features
+            )
+            .outerjoin(SubscriptionPlan, SubscriptionPlan.name == Subscription.plan_name)
+            .where(
+                Subscription.user_id == user_id,
+                Subscription.status == SubscriptionStatus.ACTIVA,
+                Subscription.current_period_end >= now
+            )
+        )
+        return list(result.all())
+    
+    async def get_lapsed(self, now: datetime, limit: int = 500) -> list[tuple[int, int]]:
+        """(subscription_id, user_id) of ACTIVA subscriptions whose period ended."""
+        result = await self.db.execute(
+            select(Subscription.id, Subscription.user_id)
+            .where(
+                Subscription.status == SubscriptionStatus.ACTIVA,
+                Subscription.current_period_end < now
+            )
+            .order_by(Subscription.id)
+            .limit(limit)
+        )
+        return [(row.id, row.user_id) for row in result]
+    
+    async def expire(self, subscription_ids: list[int], now: datetime) -> int:
+        """Mark subscriptions EXPIRADA in one statement (still-lapsed rows only)."""
+        result = await self.db.execute(
+            update(Subscription)
+            .where(
+                Subscription.id.in_(subscription_ids),
+                Subscription.status == SubscriptionStatus.ACTIVA,
+                Subscription.current_period_end < now
+            )
+            .values(status=SubscriptionStatus.EXPIRADA)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+    
+    async def get_subscriber_ids(self, user_ids: list[int]) -> set[int]:
+        """Which of the given users ever had a subscription (any status)."""
+        result = await self.db.execute(
+            select(Subscription.user_id.distinct()).where(Subscription.user_id.in_(user_ids))
+        )
+        return set(result.scalars().all())
+    
+    def active_exists(self, now: datetime):
+        """Correlated EXISTS for users that still have a current ACTIVA subscription."""
+        return (
+            select(Subscription.id)
+            .where(
+                Subscription.user_id == User.id,
+                Subscription.status == SubscriptionStatus.ACTIVA,
+                Subscription.current_period_end >= now
+            )
+            .exists()
+        )
@@ -2,13 +2,16 @@
 Repository for Transaction model operations.
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from sqlalchemy.orm import joinedload
+from sqlalchemy import Row, select, func
 from typing import List, Optional
 
 from app.models.transaction import Transaction, TransactionStatus
-from app.models.user import User
-from app.schemas.transaction_schemas import TransactionCreate, TransactionUpdate
+from app.schemas.transaction_schemas import (
+    TransactionCreate,
+    TransactionUpdate,
+    TransactionWithUserResponse,
+)
+from app.repositories.fields import fetch_rows, load_only_option, projection
 
 
 class TransactionRepository:
@@ -25,12 +28,30 @@ class TransactionRepository:
         await self.db.refresh(transaction)
         return transaction
     
-    async def get_by_id(self, transaction_id: int) -> Optional[Transaction]:
+    def _select(self, fields: Optional[List[str]] = None):
+        """
+        Base transaction query, restricted to the requested columns if given.
+        
+        user_id is always loaded; user names/emails are resolved by the
+        request's UserLoader instead of a join.
+        """
+        query = select(Transaction)
+        if fields is None:
+            return query
+        return query.options(load_only_option(Transaction, [*fields, "user_id"]))
+    
+    def _select_rows(self, fields: Optional[List[str]] = None):
+        """Read-model query: only the response columns (plus user_id), returned as rows."""
+        return select(*projection(Transaction, TransactionWithUserResponse, fields, ("user_id",)))
+    
+    async def get_by_id(
+        self,
+        transaction_id: int,
+        fields: Optional[List[str]] = None
+    ) -> Optional[Transaction]:
         """Get transaction by ID."""
         result = await self.db.execute(
-            select(Transaction)
-            .options(joinedload(Transaction.user))
-            .where(Transaction.id == transaction_id)
+            self._select(fields).where(Transaction.id == transaction_id)
         )
         return result.scalar_one_or_none()
     
@@ -38,34 +59,40 @@ class TransactionRepository:
         self,
         skip: int = 0,
         limit: int = 100,
-        status: Optional[TransactionStatus] = None
-    ) -> List[Transaction]:
+        status: Optional[TransactionStatus] = None,
+        fields: Optional[List[str]] = None
+    ) -> List[Row]:
         """Get all transactions with optional status filter."""
-        query = select(Transaction).options(joinedload(Transaction.user))
+        query = self._select_rows(fields)
         
         if status:
             query = query.where(Transaction.status == status)
         
         query = query.order_by(Transaction.created_at.desc()).offset(skip).limit(limit)
         
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+        return await fetch_rows(self.db, query)
     
     async def get_by_user_id(
         self,
         user_id: int,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[Transaction]:
+        limit: int = 100,
+        status: Optional[TransactionStatus] = None,
+        fields: Optional[List[str]] = None
+    ) -> List[Row]:
         """Get all transactions for a specific user."""
-        result = await self.db.execute(
-            select(Transaction)
-            .where(Transaction.user_id == user_id)
+        query = self._select_rows(fields).where(Transaction.user_id == user_id)
+        
+        if status:
+            query = query.where(Transaction.status == status)
+        
+        return await fetch_rows(
+            self.db,
+            query
             .order_by(Transaction.created_at.desc())
             .offset(skip)
             .limit(limit)
         )
-        return list(result.scalars().all())
     
     async def update(
         self,
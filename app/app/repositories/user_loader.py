@@ -0,0 +1,56 @@
+"""
+Request-scoped batching loader for users related to a response.
+
+Responses that show party names (campaigns, transactions, profiles) collect
+the user ids of every item and resolve them with one
+``SELECT ... WHERE id IN (...)`` instead of joining the users table into
+each query or lazy-loading per row. Results are memoized for the lifetime
+of the loader, i.e. one request (see app.api.dependencies.get_user_loader).
+"""
+from typing import Iterable, NamedTuple, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
+
+
+class UserRef(NamedTuple):
+    """The user columns responses need about a related party."""
+    id: int
+    full_name: str
+    email: str
+
+
+class UserLoader:
+    """Batch and memoize user lookups by ID."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self._cache: dict[int, Optional[UserRef]] = {}
+
+    def prime(self, user: User) -> None:
+        """Seed the memo with an already loaded user (e.g. the current user)."""
+        self._cache.setdefault(user.id, UserRef(user.id, user.full_name, user.email))
+
+    async def load_many(self, user_ids: Iterable[Optional[int]]) -> dict[int, UserRef]:
+        """Resolve user ids, querying only those not seen yet in this request."""
+        wanted = {user_id for user_id in user_ids if user_id is not None}
+        missing = [user_id for user_id in wanted if user_id not in self._cache]
+
+        if missing:
+            result = await self.db.execute(
+                select(User.id, User.full_name, User.email).where(User.id.in_(missing))
+            )
+            found = {row.id: UserRef(*row) for row in result.all()}
+            for user_id in missing:
+                self._cache[user_id] = found.get(user_id)
+
+        return {
+            user_id: self._cache[user_id]
+            for user_id in wanted
+            if self._cache[user_id] is not None
+        }
+
+    async def load(self, user_id: int) -> Optional[UserRef]:
+        """Resolve a single user ID."""
+        return (await self.load_many([user_id])).get(user_id)
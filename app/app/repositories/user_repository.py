@@ -1,10 +1,12 @@
 """
 Repository for User model data access.
 """
+from datetime import datetime
 from typing import Optional
-from sqlalchemy import select
+from sqlalchemy import insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.database import db_type
 from app.models.user import User, UserRole
 
 
@@ -56,6 +58,115 @@ class UserRepository:
         result = await self.db.execute(query)
         return list(result.scalars().all())
     
+    async def get_expired_trial_ids(self, cutoff: datetime, limit: int = 500) -> list[int]:
+        """EMPRESA users without subscription whose trial started before cutoff and is not flagged yet."""
+        result = await self.db.execute(
+            select(User.id)
+            .where(
+                User.role == UserRole.EMPRESA,
+                User.has_active_subscription.is_(False),
+                User.trial_expired.is_(False),
+                User.trial_start_time < cutoff
+            )
+            .order_by(User.id)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+    
+    async def mark_trials_expired(self, user_ids: list[int]) -> int:
+        """Set trial_expired for a batch of users in one statement."""
+        result = await self.db.execute(
+            update(User)
+            .where(User.id.in_(user_ids), User.trial_expired.is_(False))
+            .values(trial_expired=True)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+    
+    async def revoke_subscription_flags(self, user_ids: list[int], still_active) -> list[int]:
+        """
+        Clear has_active_subscription for users with no current subscription left.
+        
+        still_active is a correlated EXISTS over the user's subscriptions.
+        Returns the ids that were revoked.
+        """
+        result = await self.db.execute(
+            select(User.id).where(
+                User.id.in_(user_ids),
+                User.has_active_subscription.is_(True),
+                ~still_active
+            )
+        )
+        revoked = list(result.scalars().all())
+        if revoked:
+            await self.db.execute(
+                update(User)
+                .where(User.id.in_(revoked))
+                .values(has_active_subscription=False)
+                .execution_options(synchronize_session=False)
+            )
+        return revoked
+    
+    async def get_existing_emails(self, emails: list[str]) -> set[str]:
+        """Return which of the given emails are already registered."""
+        if not emails:
+            return set()
+        result = await self.db.execute(
+            select(User.email).where(User.email.in_(emails))
+        )
+        return set(result.scalars().all())
+    
+    async def bulk_create(self, rows: list[dict]) -> dict[str, int]:
+        """
+        Insert users with a single multi-row INSERT.
+        
+        Ids are read back by email afterwards (MySQL has no RETURNING).
+        Returns {email: id}.
+        """
+        if not rows:
+            return {}
+        await self.db.execute(insert(User).values(rows))
+        result = await self.db.execute(
+            select(User.email, User.id).where(User.email.in_([row["email"] for row in rows]))
+        )
+        return dict(result.all())
+    
+    async def bulk_update_flags(self, conditions: list, **values) -> list[int]:
+        """
+        Set flags on every user matching conditions in one set-based UPDATE.
+        
+        Users that already have the target values are left alone, so the
+        returned ids are exactly the users whose state changed.
+        """
+        conditions = [
+            *conditions,
+            or_(*(getattr(User, name) != value for name, value in values.items()))
+        ]
+        
+        if db_type == "postgresql":
+            result = await self.db.execute(
+                update(User)
+                .where(*conditions)
+                .values(**values)
+                .returning(User.id)
+                .execution_options(synchronize_session=False)
+            )
+            return list(result.scalars().all())
+        
+        # MySQL has no UPDATE ... RETURNING: lock the matching rows first
+        result = await self.db.execute(
+            select(User.id).where(*conditions).with_for_update()
+        )
+        user_ids = list(result.scalars().all())
+        if user_ids:
+            await self.db.execute(
+                update(User)
+                .where(User.id.in_(user_ids))
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+        return user_ids
+    
     async def update(self, user: User) -> User:
         """Update user."""
         await self.db.flush()
@@ -7,17 +7,39 @@ from app.schemas.user_schemas import (
     UserResponse,
     Token,
     TokenData,
+    UserBulkSelection,
+    UserBulkActionResult,
 )
 from app.schemas.profile_schemas import (
     InfluencerProfileCreate,
     InfluencerProfileUpdate,
     InfluencerProfileResponse,
+    InfluencerProfileSummary,
+    InfluencerRecommendation,
 )
 from app.schemas.campaign_schemas import (
     CampaignCreate,
     CampaignUpdate,
     CampaignResponse,
     CampaignActionRequest,
+    CampaignRatingRequest,
+)
+from app.schemas.insight_schemas import (
+    InsightSnapshotCreate,
+    InsightPoint,
+    InsightHistoryResponse,
+)
+from app.schemas.import_schemas import (
+    InfluencerImportRow,
+    ImportReport,
+)
+from app.schemas.dashboard_schemas import (
+    EmpresaDashboard,
+    InfluencerDashboard,
+    AdminDashboard,
+)
+from app.schemas.funnel_schemas import (
+    CampaignFunnel,
 )
 from app.schemas.notification_schemas import (
     NotificationResponse,
@@ -33,13 +55,27 @@ __all__ = [
     "UserResponse",
     "Token",
     "TokenData",
+    "UserBulkSelection",
+    "UserBulkActionResult",
     "InfluencerProfileCreate",
     "InfluencerProfileUpdate",
     "InfluencerProfileResponse",
+    "InfluencerProfileSummary",
+    "InfluencerRecommendation",
     "CampaignCreate",
     "CampaignUpdate",
     "CampaignResponse",
     "CampaignActionRequest",
+    "CampaignRatingRequest",
+    "InsightSnapshotCreate",
+    "InsightPoint",
+    "InsightHistoryResponse",
+    "InfluencerImportRow",
+    "ImportReport",
+    "EmpresaDashboard",
+    "InfluencerDashboard",
+    "AdminDashboard",
+    "CampaignFunnel",
     "NotificationResponse",
     "MessageCreate",
     "MessageResponse",
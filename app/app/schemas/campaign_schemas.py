@@ -40,6 +40,12 @@ class CampaignActionRequest(BaseModel):
     message: Optional[str] = None
 
 
+class CampaignRatingRequest(BaseModel):
+    """Schema for rating a completed campaign."""
+    rating: int = Field(..., ge=1, le=5)
+    review: Optional[str] = None
+
+
 class CampaignResponse(BaseModel):
     """Schema for campaign response."""
     id: int
@@ -61,4 +67,8 @@ class CampaignResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     
+    # Resolved through the request's UserLoader
+    empresa_name: Optional[str] = None
+    influencer_name: Optional[str] = None
+    
     model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,56 @@
+"""
+Pydantic schemas for role dashboards.
+"""
+from datetime import date
+from typing import Dict, List
+from pydantic import BaseModel
+
+
+class MonthlyAmount(BaseModel):
+    """Amount of one calendar month (month is its first day)."""
+    month: date
+    amount: float = 0.0
+    count: int = 0
+
+
+class CampaignDashboard(BaseModel):
+    """
+    Campaign figures of an empresa or influencer.
+    
+    committed_budget sums active campaigns and final_budget finished ones,
+    using the negotiated final budget when set and the proposal otherwise.
+    """
+    campaigns_by_status: Dict[str, int]
+    total_campaigns: int
+    pending_proposals: int
+    in_negotiation: int
+    committed_budget: float
+    final_budget: float
+    unread_messages: int
+    unread_notifications: int
+
+
+class EmpresaDashboard(CampaignDashboard):
+    """Dashboard of an empresa."""
+    spend_by_month: List[MonthlyAmount]
+
+
+class InfluencerDashboard(CampaignDashboard):
+    """Dashboard of an influencer."""
+    earnings_by_month: List[MonthlyAmount]
+
+
+class TransactionTotals(BaseModel):
+    """Transaction count and amount of one status."""
+    count: int = 0
+    amount: float = 0.0
+
+
+class AdminDashboard(BaseModel):
+    """Platform-wide figures for admins."""
+    users_by_role: Dict[str, int]
+    pending_approvals: int
+    campaigns_by_status: Dict[str, int]
+    transactions_by_status: Dict[str, TransactionTotals]
+    total_revenue: float
+    revenue_by_month: List[MonthlyAmount]
@@ -0,0 +1,36 @@
+"""
+Pydantic schemas for campaign funnel analytics.
+"""
+from datetime import date
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class LatencyBucket(BaseModel):
+    """Transitions whose time since proposal falls in one band."""
+    label: str
+    max_hours: Optional[float] = None  # None for the open-ended last band
+    count: int = 0
+
+
+class CampaignFunnel(BaseModel):
+    """
+    Proposal -> negotiation -> acceptance -> completion funnel of a period.
+    
+    Counts are transitions that happened in the period; rates divide them
+    by the proposals (or acceptances, for completion) of the same period.
+    """
+    start: date
+    end: date
+    proposals: int
+    negotiations: int
+    acceptances: int
+    rejections: int
+    completions: int
+    cancellations: int
+    negotiation_rate: Optional[float] = None
+    acceptance_rate: Optional[float] = None
+    completion_rate: Optional[float] = None
+    avg_hours_to_accept: Optional[float] = None
+    time_to_accept: List[LatencyBucket]
+    refreshed_through: Optional[date] = None
@@ -0,0 +1,50 @@
+"""
+Bulk import schemas.
+"""
+import json
+from typing import List, Optional
+from pydantic import EmailStr, Field, BaseModel, field_validator
+
+from app.schemas.profile_schemas import InfluencerProfileCreate
+
+
+class InfluencerImportRow(InfluencerProfileCreate):
+    """One influencer (account + profile) of a bulk import file."""
+    email: EmailStr
+    password: str = Field(..., min_length=8, max_length=100)
+    full_name: str = Field(..., min_length=2, max_length=255)
+
+    @field_validator("categories", mode="before")
+    @classmethod
+    def split_categories(cls, value):
+        """Accept a JSON list or a "Moda|Belleza" string (CSV files)."""
+        if isinstance(value, str):
+            value = value.strip()
+            if value.startswith("["):
+                return json.loads(value)
+            return [item.strip() for item in value.split("|") if item.strip()]
+        return value
+
+    @field_validator("portfolio_items", mode="before")
+    @classmethod
+    def parse_portfolio(cls, value):
+        if isinstance(value, str):
+            return json.loads(value)
+        return value
+
+
+class ImportRowError(BaseModel):
+    """A rejected import row."""
+    line: int
+    email: Optional[str] = None
+    error: str
+
+
+class ImportReport(BaseModel):
+    """Outcome of a bulk import."""
+    total_rows: int = 0
+    imported: int = 0
+    failed: int = 0
+    errors: List[ImportRowError] = []
+    errors_truncated: bool = False
+    elapsed_seconds: float = 0.0
@@ -0,0 +1,55 @@
+"""
+Pydantic schemas for social insights history.
+"""
+from datetime import datetime
+from typing import Literal, Optional
+from pydantic import BaseModel, Field
+
+InsightNetwork = Literal["instagram", "tiktok", "youtube"]
+InsightResolution = Literal["raw", "day", "week"]
+
+
+class InsightSnapshotCreate(BaseModel):
+    """Schema for recording an insights snapshot."""
+    network: InsightNetwork
+    captured_at: Optional[datetime] = None  # Defaults to now
+    
+    followers: Optional[int] = Field(None, ge=0)
+    following: Optional[int] = Field(None, ge=0)
+    posts_count: Optional[int] = Field(None, ge=0)
+    total_likes: Optional[int] = Field(None, ge=0)
+    avg_views: Optional[int] = Field(None, ge=0)
+    avg_likes: Optional[int] = Field(None, ge=0)
+    avg_comments: Optional[int] = Field(None, ge=0)
+    avg_shares: Optional[int] = Field(None, ge=0)
+    engagement_rate: Optional[float] = Field(None, ge=0)
+    profile_views: Optional[int] = Field(None, ge=0)
+    reach: Optional[int] = Field(None, ge=0)
+    impressions: Optional[int] = Field(None, ge=0)
+
+
+class InsightPoint(BaseModel):
+    """
+    One point of a growth chart.
+    
+    For raw points samples is 1 and followers_min equals followers; for
+    rollups followers is the bucket maximum and metrics are bucket averages.
+    """
+    timestamp: datetime
+    samples: int
+    followers: Optional[int] = None
+    followers_min: Optional[int] = None
+    engagement_rate: Optional[float] = None
+    avg_views: Optional[float] = None
+    avg_likes: Optional[float] = None
+    avg_comments: Optional[float] = None
+
+
+class InsightHistoryResponse(BaseModel):
+    """Schema for an insights time series."""
+    profile_id: int
+    network: InsightNetwork
+    resolution: InsightResolution
+    start: datetime
+    end: datetime
+    points: list[InsightPoint]
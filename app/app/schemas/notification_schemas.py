@@ -16,6 +16,7 @@ class NotificationResponse(BaseModel):
     related_entity_type: Optional[str] = None
     related_entity_id: Optional[int] = None
     is_read: bool
+    digest_count: int = 1
     created_at: datetime
     read_at: Optional[datetime] = None
     
@@ -1,8 +1,8 @@
 """
 Pydantic schemas for influencer profiles.
 """
-from datetime import datetime
-from typing import Optional, List
+from datetime import date, datetime
+from typing import Dict, Optional, List
 from pydantic import BaseModel, Field, ConfigDict
 
 
@@ -85,4 +85,62 @@ class InfluencerProfileResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     
+    # Owner's name, resolved through the request's UserLoader
+    full_name: Optional[str] = None
+    
     model_config = ConfigDict(from_attributes=True)
+
+
+class InfluencerProfileSummary(BaseModel):
+    """
+    Lightweight schema for explorer cards.
+    
+    Omits bio, portfolio and insights blobs; those are only served
+    by the detail endpoint.
+    """
+    id: int
+    user_id: int
+    full_name: str
+    profile_picture_url: Optional[str] = None
+    
+    instagram_handle: Optional[str] = None
+    instagram_followers: Optional[int] = None
+    
+    tiktok_handle: Optional[str] = None
+    tiktok_followers: Optional[int] = None
+    
+    youtube_handle: Optional[str] = None
+    youtube_subscribers: Optional[int] = None
+    
+    average_engagement_rate: Optional[float] = None
+    
+    suggested_rate_per_post: Optional[float] = None
+    suggested_rate_per_story: Optional[float] = None
+    suggested_rate_per_video: Optional[float] = None
+    
+    categories: Optional[List[str]] = None
+    
+    total_campaigns_completed: int
+    average_rating: Optional[float] = None
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
+class InfluencerRecommendation(InfluencerProfileSummary):
+    """Explorer card with its match score for a campaign brief."""
+    score: float
+
+
+class ProfileViewDay(BaseModel):
+    """Profile views of one day (UTC)."""
+    day: date
+    views: int
+
+
+class ProfileViewStats(BaseModel):
+    """View counts of a profile over the last days."""
+    profile_id: int
+    days: int
+    total_views: int
+    views_by_role: Dict[str, int]
+    daily: List[ProfileViewDay]
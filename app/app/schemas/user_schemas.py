@@ -2,7 +2,7 @@
 Pydantic schemas for user authentication and management.
 """
 from datetime import datetime
-from typing import Optional
+from typing import List, Literal, Optional
 from pydantic import BaseModel, EmailStr, Field, ConfigDict
 
 from app.models.user import UserRole
@@ -37,6 +37,27 @@ class UserResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class UserBulkSelection(BaseModel):
+    """
+    Users targeted by a bulk moderation action.
+    
+    Ids and filters are combined (AND). At least one of them is required so
+    an empty body never selects every user (checked by the service).
+    """
+    user_ids: Optional[List[int]] = Field(None, max_length=10000)
+    role: Optional[UserRole] = None
+    is_approved: Optional[bool] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+
+
+class UserBulkActionResult(BaseModel):
+    """Schema for bulk moderation results."""
+    action: Literal["approve", "deactivate", "reactivate"]
+    updated: int
+    user_ids: List[int]
+
+
 class Token(BaseModel):
     """Schema for JWT token response."""
     access_token: str
@@ -5,10 +5,16 @@ from app.services.auth_service import AuthService
 from app.services.trial_service import TrialService
 from app.services.campaign_service import CampaignService
 from app.services.notification_service import NotificationService
+from app.services.reputation_service import ReputationService
+from app.services.insights_service import InsightsService
+from app.services.entitlement_service import EntitlementService
 
 __all__ = [
     "AuthService",
     "TrialService",
     "CampaignService",
     "NotificationService",
+    "ReputationService",
+    "InsightsService",
+    "EntitlementService",
 ]
@@ -8,8 +8,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.user import User, UserRole
 from app.models.campaign import Campaign, CampaignStatus
 from app.repositories.campaign_repository import CampaignRepository
+from app.repositories.profile_repository import ProfileRepository
 from app.repositories.user_repository import UserRepository
 from app.schemas.campaign_schemas import CampaignCreate, CampaignUpdate
+from app.services.entitlement_service import EntitlementService
+from app.services.funnel_service import FunnelService
+from app.services.influencer_index import influencer_index
+from app.services.profile_cache import invalidate_profile
 from app.services.notification_service import NotificationService
 
 
@@ -20,7 +25,9 @@ class CampaignService:
         self.db = db
         self.campaign_repo = CampaignRepository(db)
         self.user_repo = UserRepository(db)
+        self.profile_repo = ProfileRepository(db)
         self.notification_service = NotificationService(db)
+        self.funnel_service = FunnelService(db)
     
     async def create_campaign(
         self,
@@ -44,7 +51,8 @@ class CampaignService:
             )
         
         # Verify empresa has active subscription or trial
-        if not empresa_user.has_active_subscription:
+        entitlements = await EntitlementService(self.db).get(empresa_user)
+        if not entitlements.has_subscription:
             raise HTTPException(
                 status_code=status.HTTP_402_PAYMENT_REQUIRED,
                 detail="Active subscription required to create campaigns"
@@ -85,6 +93,7 @@ class CampaignService:
         )
         
         campaign = await self.campaign_repo.create(campaign)
+        await self.funnel_service.record_transition(campaign, None, CampaignStatus.PENDIENTE)
         
         # Send notification to influencer
         await self.notification_service.create_notification(
@@ -98,11 +107,18 @@ class CampaignService:
         
         return campaign
     
-    async def get_campaign(self, campaign_id: int, user: User) -> Campaign:
+    async def get_campaign(
+        self,
+        campaign_id: int,
+        user: User,
+        fields: Optional[list[str]] = None
+    ) -> Campaign:
         """
         Get campaign by ID with authorization check.
+        
+        When fields is given only those columns are loaded (read-only use).
         """
-        campaign = await self.campaign_repo.get_by_id(campaign_id)
+        campaign = await self.campaign_repo.get_by_id(campaign_id, fields=fields)
         
         if not campaign:
             raise HTTPException(
@@ -151,8 +167,10 @@ class CampaignService:
             )
         
         # Update status
+        previous_status = campaign.status
         campaign.status = CampaignStatus.ACTIVA
         campaign = await self.campaign_repo.update(campaign)
+        await self.funnel_service.record_transition(campaign, previous_status, CampaignStatus.ACTIVA)
         
         # Notify empresa
         await self.notification_service.create_notification(
@@ -192,8 +210,10 @@ class CampaignService:
             )
         
         # Update status
+        previous_status = campaign.status
         campaign.status = CampaignStatus.RECHAZADA
         campaign = await self.campaign_repo.update(campaign)
+        await self.funnel_service.record_transition(campaign, previous_status, CampaignStatus.RECHAZADA)
         
         # Notify empresa
         notification_message = f"Your campaign '{campaign.title}' has been rejected."
@@ -241,6 +261,9 @@ class CampaignService:
         campaign.status = CampaignStatus.NEGOCIACION
         campaign.final_budget = counter_budget
         campaign = await self.campaign_repo.update(campaign)
+        await self.funnel_service.record_transition(
+            campaign, CampaignStatus.PENDIENTE, CampaignStatus.NEGOCIACION
+        )
         
         # Notify empresa
         notification_message = f"Negotiation requested for '{campaign.title}'. Counter offer: ${counter_budget}"
@@ -265,6 +288,9 @@ class CampaignService:
     ) -> Campaign:
         """
         Mark campaign as completed.
+        
+        The influencer's completed-campaign count is incremented in the
+        same transaction.
         """
         campaign = await self.get_campaign(campaign_id, user)
         
@@ -281,8 +307,18 @@ class CampaignService:
                 detail="Only active campaigns can be completed"
             )
         
-        campaign.status = CampaignStatus.FINALIZADA
+        if not await self.campaign_repo.mark_completed(campaign.id):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Campaign was already completed"
+            )
+        
+        await self.profile_repo.increment_completed(campaign.influencer_id)
         campaign = await self.campaign_repo.update(campaign)
+        await self.funnel_service.record_transition(
+            campaign, CampaignStatus.ACTIVA, CampaignStatus.FINALIZADA
+        )
+        invalidate_profile(user_id=campaign.influencer_id, db=self.db)
         
         # Notify influencer
         await self.notification_service.create_notification(
@@ -295,3 +331,62 @@ class CampaignService:
         )
         
         return campaign
+    
+    async def rate_campaign(
+        self,
+        campaign_id: int,
+        user: User,
+        rating: int,
+        review: Optional[str] = None
+    ) -> Campaign:
+        """
+        Rate the other party of a finalized campaign.
+        
+        Business Rules:
+        - Only the empresa or the influencer of the campaign can rate
+        - Campaign must be FINALIZADA
+        - Each party rates once
+        - The empresa's rating is folded into the influencer's reputation
+          in the same transaction
+        """
+        campaign = await self.get_campaign(campaign_id, user)
+        
+        if user.id == campaign.empresa_id:
+            by_empresa = True
+        elif user.id == campaign.influencer_id:
+            by_empresa = False
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only campaign participants can rate it"
+            )
+        
+        if campaign.status != CampaignStatus.FINALIZADA:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Only completed campaigns can be rated"
+            )
+        
+        if not await self.campaign_repo.set_rating(campaign.id, by_empresa, rating, review):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Campaign already rated"
+            )
+        
+        if by_empresa:
+            await self.profile_repo.add_rating(campaign.influencer_id, rating)
+            influencer_index.mark_stale()
+            invalidate_profile(user_id=campaign.influencer_id, db=self.db)
+        
+        campaign = await self.campaign_repo.update(campaign)
+        
+        await self.notification_service.create_notification(
+            user_id=campaign.influencer_id if by_empresa else campaign.empresa_id,
+            title="New Rating",
+            message=f"You received a {rating}-star rating for '{campaign.title}'",
+            notification_type="CAMPAIGN_RATED",
+            related_entity_type="campaign",
+            related_entity_id=campaign.id
+        )
+        
+        return campaign
@@ -0,0 +1,107 @@
+"""
+Dashboard service assembling the role dashboards from grouped aggregates.
+"""
+from datetime import date, datetime, timezone
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.campaign import Campaign, CampaignStatus
+from app.models.transaction import TransactionStatus
+from app.models.user import User, UserRole
+from app.repositories.dashboard_repository import DashboardRepository
+from app.schemas.dashboard_schemas import (
+    AdminDashboard,
+    EmpresaDashboard,
+    InfluencerDashboard,
+    MonthlyAmount,
+    TransactionTotals,
+)
+
+
+def month_starts(months: int, today: date = None) -> list[date]:
+    """First days of the last months calendar months, oldest first."""
+    today = today or datetime.now(timezone.utc).date()
+    index = today.year * 12 + today.month - 1
+    return [
+        date(month_index // 12, month_index % 12 + 1, 1)
+        for month_index in range(index - months + 1, index + 1)
+    ]
+
+
+def fill_months(starts: list[date], rows: list[tuple[datetime, float, int]]) -> list[MonthlyAmount]:
+    """One entry per month of the window; months without rows are zero."""
+    found = {}
+    for bucket, amount, count in rows:
+        # SQLite returns the bucket as text
+        if isinstance(bucket, str):
+            bucket = datetime.fromisoformat(bucket)
+        found[date(bucket.year, bucket.month, 1)] = (amount, count)
+    return [
+        MonthlyAmount(month=start, amount=amount, count=count)
+        for start in starts
+        for amount, count in [found.get(start, (0.0, 0))]
+    ]
+
+
+def counts_by_status(totals: dict, statuses) -> dict[str, int]:
+    return {item.value: totals.get(item, (0, 0.0))[0] for item in statuses}
+
+
+class DashboardService:
+    """Service for empresa, influencer and admin dashboards."""
+    
+    def __init__(self, db: AsyncSession):
+        self.dashboard_repo = DashboardRepository(db)
+    
+    async def empresa_dashboard(self, user: User, months: int = 12) -> EmpresaDashboard:
+        figures, monthly = await self._party_dashboard(Campaign.empresa_id, user, months)
+        return EmpresaDashboard(**figures, spend_by_month=monthly)
+    
+    async def influencer_dashboard(self, user: User, months: int = 12) -> InfluencerDashboard:
+        figures, monthly = await self._party_dashboard(Campaign.influencer_id, user, months)
+        return InfluencerDashboard(**figures, earnings_by_month=monthly)
+    
+    async def admin_dashboard(self, months: int = 12) -> AdminDashboard:
+        starts = month_starts(months)
+        roles = await self.dashboard_repo.user_role_totals()
+        campaigns = await self.dashboard_repo.campaign_status_totals()
+        transactions = await self.dashboard_repo.transaction_status_totals()
+        # Transaction timestamps are naive UTC
+        revenue = await self.dashboard_repo.revenue_by_month(datetime(starts[0].year, starts[0].month, 1))
+        
+        return AdminDashboard(
+            users_by_role={role.value: roles.get(role, (0, 0))[0] for role in UserRole},
+            pending_approvals=sum(
+                pending for role, (_, pending) in roles.items() if role != UserRole.ADMIN
+            ),
+            campaigns_by_status=counts_by_status(campaigns, CampaignStatus),
+            transactions_by_status={
+                item.value: TransactionTotals(count=count, amount=amount)
+                for item in TransactionStatus
+                for count, amount in [transactions.get(item, (0, 0.0))]
+            },
+            total_revenue=transactions.get(TransactionStatus.COMPLETED, (0, 0.0))[1],
+            revenue_by_month=fill_months(starts, revenue),
+        )
+    
+    async def _party_dashboard(self, party_column, user: User, months: int):
+        """Figures shared by the empresa and influencer dashboards."""
+        starts = month_starts(months)
+        totals = await self.dashboard_repo.campaign_status_totals(party_column, user.id)
+        finished = await self.dashboard_repo.finished_campaigns_by_month(
+            party_column,
+            user.id,
+            datetime(starts[0].year, starts[0].month, 1, tzinfo=timezone.utc)
+        )
+        unread_messages, unread_notifications = await self.dashboard_repo.unread_counts(user.id)
+        
+        figures = {
+            "campaigns_by_status": counts_by_status(totals, CampaignStatus),
+            "total_campaigns": sum(count for count, _ in totals.values()),
+            "pending_proposals": totals.get(CampaignStatus.PENDIENTE, (0, 0.0))[0],
+            "in_negotiation": totals.get(CampaignStatus.NEGOCIACION, (0, 0.0))[0],
+            "committed_budget": totals.get(CampaignStatus.ACTIVA, (0, 0.0))[1],
+            "final_budget": totals.get(CampaignStatus.FINALIZADA, (0, 0.0))[1],
+            "unread_messages": unread_messages,
+            "unread_notifications": unread_notifications,
+        }
+        return figures, fill_months(starts, finished)
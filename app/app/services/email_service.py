@@ -0,0 +1,391 @@
+"""
+Asynchronous email delivery for notifications.
+
+Notifications created during a request are only queued (by id) once the
+request's transaction commits. Worker tasks drain the queue in batches:
+each batch loads recipients with one query, renders the precompiled Jinja
+templates and sends over a pooled, persistent SMTP connection. Transient
+failures are retried with exponential backoff; nothing here runs on the
+request path.
+
+Digest emails are owed by the notification row itself (email_due_at), so a
+restart does not lose them: a poller claims the rows that are due and
+queues them like any other notification.
+"""
+import asyncio
+import logging
+import random
+from email.message import EmailMessage
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, NamedTuple, Optional
+
+import aiosmtplib
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.notification import Notification
+from app.models.user import User
+from app.repositories.notification_repository import NotificationRepository
+
+logger = logging.getLogger(__name__)
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates" / "email"
+
+# Session.info key holding notification ids to email after commit
+PENDING_EMAILS_KEY = "pending_notification_emails"
+
+RETRY_BASE_SECONDS = 2.0
+RETRY_MAX_SECONDS = 300.0
+
+
+class NotificationEmail(NamedTuple):
+    """Everything needed to render one notification email."""
+    notification_id: int
+    email: str
+    full_name: str
+    title: str
+    message: str
+    notification_type: str
+    digest_count: int = 1
+
+
+class EmailRenderer:
+    """Renders notification emails from templates compiled once at startup."""
+    
+    def __init__(self, templates_dir: Path = TEMPLATES_DIR):
+        environment = Environment(
+            loader=FileSystemLoader(templates_dir),
+            autoescape=select_autoescape(["html"]),
+            auto_reload=False
+        )
+        self.text_template = environment.get_template("notification.txt")
+        self.html_template = environment.get_template("notification.html")
+    
+    def render(self, email: NotificationEmail) -> EmailMessage:
+        context = {
+            "full_name": email.full_name,
+            "title": email.title,
+            "message": email.message,
+            "notification_type": email.notification_type,
+            "digest_count": email.digest_count,
+            "app_name": settings.APP_NAME,
+        }
+        message = EmailMessage()
+        message["From"] = settings.EMAIL_FROM or settings.SMTP_USER or ""
+        message["To"] = email.email
+        message["Subject"] = (
+            f"{email.title} (+{email.digest_count - 1})" if email.digest_count > 1 else email.title
+        )
+        message.set_content(self.text_template.render(context))
+        message.add_alternative(self.html_template.render(context), subtype="html")
+        return message
+
+
+async def load_notification_emails(notification_ids: list[int]) -> list[NotificationEmail]:
+    """Load recipients and content for a batch of notifications in one query."""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(
+                Notification.id,
+                User.email,
+                User.full_name,
+                Notification.title,
+                Notification.message,
+                Notification.notification_type,
+                Notification.digest_count
+            )
+            .join(User, User.id == Notification.user_id)
+            .where(Notification.id.in_(notification_ids), User.is_active.is_(True))
+        )
+        return [NotificationEmail(*row) for row in result.all()]
+
+
+async def claim_due_notification_emails(limit: int) -> list[int]:
+    """Claim up to limit digest emails that are due, in their own transaction."""
+    async with AsyncSessionLocal() as db:
+        notification_ids = await NotificationRepository(db).claim_due_emails(
+            datetime.now(timezone.utc), limit
+        )
+        await db.commit()
+        return notification_ids
+
+
+async def connect_smtp() -> aiosmtplib.SMTP:
+    """Open and authenticate one SMTP connection from settings."""
+    smtp = aiosmtplib.SMTP(
+        hostname=settings.SMTP_HOST,
+        port=settings.SMTP_PORT,
+        start_tls=settings.SMTP_START_TLS
+    )
+    await smtp.connect()
+    if settings.SMTP_USER:
+        await smtp.login(settings.SMTP_USER, settings.SMTP_PASSWORD or "")
+    return smtp
+
+
+class SMTPPool:
+    """
+    Fixed-size pool of persistent SMTP connections.
+    
+    Connections are opened lazily, reused across batches and replaced when
+    the server drops them.
+    """
+    
+    def __init__(self, size: int, factory: Callable[[], Awaitable] = connect_smtp):
+        self.size = size
+        self.factory = factory
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._opened = 0
+    
+    async def acquire(self):
+        if self._idle.empty() and self._opened < self.size:
+            self._opened += 1
+            try:
+                return await self.factory()
+            except Exception:
+                self._opened -= 1
+                raise
+        
+        smtp = await self._idle.get()
+        if not smtp.is_connected:
+            self._opened -= 1
+            return await self.acquire()
+        return smtp
+    
+    async def release(self, smtp, broken: bool = False) -> None:
+        if not broken:
+            self._idle.put_nowait(smtp)
+            return
+        self._opened -= 1
+        smtp.close()
+    
+    async def close(self) -> None:
+        while not self._idle.empty():
+            smtp = self._idle.get_nowait()
+            try:
+                await smtp.quit()
+            except Exception:
+                smtp.close()
+        self._opened = 0
+
+
+class EmailDispatcher:
+    """Queue plus worker tasks delivering notification emails."""
+    
+    def __init__(
+        self,
+        pool_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        smtp_factory: Callable[[], Awaitable] = connect_smtp,
+        loader: Callable[[list[int]], Awaitable[list[NotificationEmail]]] = load_notification_emails,
+        claim_due: Callable[[int], Awaitable[list[int]]] = claim_due_notification_emails,
+        retry_base_seconds: float = RETRY_BASE_SECONDS,
+        due_poll_seconds: Optional[float] = None
+    ):
+        self.pool_size = pool_size or settings.EMAIL_POOL_SIZE
+        self.batch_size = batch_size or settings.EMAIL_BATCH_SIZE
+        self.queue_size = queue_size or settings.EMAIL_QUEUE_SIZE
+        self.max_retries = settings.EMAIL_MAX_RETRIES if max_retries is None else max_retries
+        self.smtp_factory = smtp_factory
+        self.loader = loader
+        self.claim_due = claim_due
+        self.retry_base_seconds = retry_base_seconds
+        self.due_poll_seconds = due_poll_seconds or settings.EMAIL_DUE_POLL_SECONDS
+        self.renderer: Optional[EmailRenderer] = None
+        self.pool: Optional[SMTPPool] = None
+        self.queue: Optional[asyncio.Queue] = None
+        self._workers: list[asyncio.Task] = []
+        self._poller: Optional[asyncio.Task] = None
+        self._pending: set[asyncio.Task] = set()  # Scheduled retries
+    
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+    
+    def enqueue(self, notification_id: int, attempt: int = 0) -> bool:
+        """Queue a notification email; never blocks. Returns False if dropped."""
+        if not self.running:
+            return False
+        try:
+            self.queue.put_nowait((notification_id, attempt))
+        except asyncio.QueueFull:
+            logger.error(f"📧 Email queue full, dropping notification {notification_id}")
+            return False
+        return True
+    
+    async def _next_batch(self) -> list[tuple[int, int]]:
+        """Wait for one item, then take whatever else is queued up to batch_size."""
+        batch = [await self.queue.get()]
+        while len(batch) < self.batch_size and not self.queue.empty():
+            batch.append(self.queue.get_nowait())
+        return batch
+    
+    async def _retry_later(self, notification_id: int, attempt: int) -> None:
+        delay = min(RETRY_MAX_SECONDS, self.retry_base_seconds * 2 ** (attempt - 1))
+        await asyncio.sleep(random.uniform(delay / 2, delay))
+        self.enqueue(notification_id, attempt)
+    
+    def _schedule_retry(self, notification_id: int, attempt: int) -> None:
+        if attempt > self.max_retries:
+            logger.error(f"📧 Giving up on notification {notification_id} email")
+            return
+        self._track(asyncio.create_task(self._retry_later(notification_id, attempt)))
+    
+    def _track(self, task: asyncio.Task) -> None:
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+    
+    async def queue_due(self) -> int:
+        """Claim due digest emails (no more than the queue can take) and queue them."""
+        queued = 0
+        while True:
+            limit = min(self.batch_size * self.pool_size, self.queue.maxsize - self.queue.qsize())
+            if limit <= 0:
+                return queued
+            notification_ids = await self.claim_due(limit)
+            for notification_id in notification_ids:
+                self.enqueue(notification_id)
+            queued += len(notification_ids)
+            if len(notification_ids) < limit:
+                return queued
+    
+    async def _poll_due(self) -> None:
+        while True:
+            try:
+                await self.queue_due()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"📧 Claiming due digest emails failed: {e}")
+            await asyncio.sleep(self.due_poll_seconds)
+    
+    async def _deliver(self, batch: list[tuple[int, int]]) -> None:
+        attempts = dict(batch)
+        emails = await self.loader(list(attempts))
+        if not emails:
+            return
+        
+        smtp = await self.pool.acquire()
+        # Anything but a clean pass (including cancellation) drops the connection
+        broken = True
+        try:
+            for index, email in enumerate(emails):
+                try:
+                    message = self.renderer.render(email)
+                except Exception as e:
+                    logger.error(f"📧 Cannot render notification {email.notification_id} email: {e}")
+                    continue
+                
+                try:
+                    await smtp.send_message(message)
+                except aiosmtplib.SMTPRecipientsRefused:
+                    logger.warning(f"📧 Recipient refused for notification {email.notification_id}")
+                except aiosmtplib.SMTPResponseException as e:
+                    if not smtp.is_connected:
+                        self._retry_unsent(emails[index:], attempts, e)
+                        return
+                    # The server rejected this message only; the connection is fine
+                    if e.code >= 500:
+                        logger.error(f"📧 Notification {email.notification_id} email rejected: {e}")
+                    else:
+                        self._schedule_retry(email.notification_id, attempts[email.notification_id] + 1)
+                except Exception as e:
+                    # Connection-level or unexpected failure
+                    self._retry_unsent(emails[index:], attempts, e)
+                    return
+            broken = False
+        finally:
+            await self.pool.release(smtp, broken=broken)
+    
+    def _retry_unsent(self, unsent: list[NotificationEmail], attempts: dict[int, int], error: Exception) -> None:
+        """Back off on the message that failed; the untried rest go straight back to the queue."""
+        failed, *rest = unsent
+        logger.warning(f"📧 SMTP send of notification {failed.notification_id} failed: {error}")
+        self._schedule_retry(failed.notification_id, attempts[failed.notification_id] + 1)
+        for email in rest:
+            try:
+                self.queue.put_nowait((email.notification_id, attempts[email.notification_id]))
+            except asyncio.QueueFull:
+                self._schedule_retry(email.notification_id, attempts[email.notification_id] + 1)
+    
+    async def _worker(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self._deliver(batch)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"📧 Email batch failed: {e}")
+                for notification_id, attempt in batch:
+                    self._schedule_retry(notification_id, attempt + 1)
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+    
+    def start(self) -> None:
+        """
+        Compile templates, open the queue, start one worker per connection
+        and the poller of due digest emails.
+        """
+        if self.running:
+            return
+        self.renderer = EmailRenderer()
+        self.pool = SMTPPool(self.pool_size, self.smtp_factory)
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.pool_size)]
+        self._poller = asyncio.create_task(self._poll_due())
+    
+    async def _drain(self) -> None:
+        """Wait until the queue is empty and no retry is pending."""
+        while True:
+            await self.queue.join()
+            if not self._pending:
+                return
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
+    
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Drain queued emails (up to timeout), then stop workers and close connections."""
+        if not self.running:
+            return
+        # Digests not claimed yet stay due in the database
+        self._poller.cancel()
+        await asyncio.gather(self._poller, return_exceptions=True)
+        self._poller = None
+        try:
+            await asyncio.wait_for(self._drain(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"📧 Stopping with {self.queue.qsize()} emails undelivered")
+        for task in [*self._workers, *self._pending]:
+            task.cancel()
+        await asyncio.gather(*self._workers, *self._pending, return_exceptions=True)
+        self._workers = []
+        await self.pool.close()
+
+
+# Process-wide dispatcher started from app startup when SMTP is configured
+email_dispatcher = EmailDispatcher()
+
+
+def queue_notification_email(db: AsyncSession, notification_id: int) -> None:
+    """Email a notification once the session's transaction commits."""
+    if email_dispatcher.running:
+        db.info.setdefault(PENDING_EMAILS_KEY, []).append(notification_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _enqueue_committed_emails(session: Session) -> None:
+    for notification_id in session.info.pop(PENDING_EMAILS_KEY, []):
+        email_dispatcher.enqueue(notification_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_emails(session: Session) -> None:
+    session.info.pop(PENDING_EMAILS_KEY, None)
@@ -0,0 +1,110 @@
+"""
+Entitlements derived from subscriptions, cached per user.
+
+Access comes from the user's current ACTIVA Subscription rows and the
+features of their SubscriptionPlan. Users without subscription rows fall
+back to the legacy has_active_subscription flag. Results are cached until
+the earliest current_period_end (capped by ENTITLEMENTS_CACHE_TTL_SECONDS),
+so gated endpoints usually answer from memory; every write path that
+changes a user's subscriptions must call invalidate_entitlements(), which
+evicts the users on every worker through the invalidation bus.
+"""
+from datetime import datetime, timezone
+from typing import NamedTuple, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.invalidation import invalidate_after_commit, invalidation_bus
+from app.models.user import User, UserRole
+from app.repositories.subscription_repository import SubscriptionRepository
+
+
+class Entitlements(NamedTuple):
+    """What a user may access."""
+    has_subscription: bool
+    plan_names: tuple[str, ...] = ()
+    features: frozenset[str] = frozenset()
+    expires_at: Optional[datetime] = None
+    
+    def has_feature(self, feature: str) -> bool:
+        return feature in self.features
+
+
+NO_ENTITLEMENTS = Entitlements(has_subscription=False)
+
+entitlements_cache = TTLCache(
+    maxsize=settings.ENTITLEMENTS_CACHE_SIZE,
+    ttl=settings.ENTITLEMENTS_CACHE_TTL_SECONDS
+)
+
+
+def _evict_entitlements(user_ids: Optional[list]) -> None:
+    if user_ids is None:
+        entitlements_cache.clear()
+        return
+    for user_id in user_ids:
+        entitlements_cache.invalidate(user_id)
+
+
+invalidation_bus.subscribe("user", _evict_entitlements)
+
+
+def invalidate_entitlements(*user_ids: int, db: Optional[AsyncSession] = None) -> None:
+    """
+    Drop cached entitlements after a subscription change, on every worker.
+    
+    With db the eviction waits until that session commits.
+    """
+    if db is not None:
+        invalidate_after_commit(db, "user", *user_ids)
+    else:
+        invalidation_bus.publish("user", *user_ids)
+
+
+def _as_utc(moment: datetime) -> datetime:
+    # MySQL/SQLite may return naive datetimes
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+class EntitlementService:
+    """Service resolving (and caching) user entitlements."""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.subscription_repo = SubscriptionRepository(db)
+    
+    async def get(self, user: User) -> Entitlements:
+        """Entitlements of a user; one query on cache miss, none on hit."""
+        if user.role != UserRole.EMPRESA:
+            return NO_ENTITLEMENTS
+        
+        cached = entitlements_cache.get(user.id)
+        if cached is not None:
+            return cached
+        
+        rows = await self.subscription_repo.get_current_with_features(
+            user.id, datetime.now(timezone.utc)
+        )
+        
+        if rows:
+            expires_at = min(_as_utc(period_end) for _, period_end, _ in rows)
+            features = frozenset(
+                feature
+                for _, _, plan_features in rows
+                if isinstance(plan_features, list)
+                for feature in plan_features
+            )
+            entitlements = Entitlements(
+                has_subscription=True,
+                plan_names=tuple(sorted({plan_name for plan_name, _, _ in rows})),
+                features=features,
+                expires_at=expires_at
+            )
+            entitlements_cache.set(user.id, entitlements, expires_at=expires_at.timestamp())
+        else:
+            # Legacy accounts activated without subscription rows
+            entitlements = Entitlements(has_subscription=user.has_active_subscription)
+            entitlements_cache.set(user.id, entitlements)
+        
+        return entitlements
@@ -0,0 +1,135 @@
+"""
+Background sweeper expiring trials and lapsed subscriptions.
+
+Runs on every instance but does work only on the one holding the
+"expiry_sweeper" advisory lock. Each pass processes users in batches with
+set-based UPDATEs, committing per batch, and notifies affected users:
+
+- EMPRESA trials past TRIAL_DURATION_HOURS get trial_expired = True; users
+  who ever had a subscription are flagged without a "Trial Expired" notice
+- ACTIVA subscriptions past current_period_end become EXPIRADA, and their
+  users lose has_active_subscription unless another subscription is current
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.locks import advisory_lock
+from app.repositories.subscription_repository import SubscriptionRepository
+from app.repositories.user_repository import UserRepository
+from app.services.entitlement_service import invalidate_entitlements
+from app.services.notification_service import NotificationService
+
+logger = logging.getLogger(__name__)
+
+LOCK_NAME = "expiry_sweeper"
+
+
+class ExpirySweeper:
+    """Periodic, single-node trial and subscription expiry."""
+    
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        batch_size: Optional[int] = None
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size or settings.EXPIRY_SWEEP_BATCH_SIZE
+        self._task: Optional[asyncio.Task] = None
+    
+    async def expire_trials(self, now: datetime) -> int:
+        """Flag expired trials batch by batch; returns the number flagged."""
+        cutoff = now - timedelta(hours=settings.TRIAL_DURATION_HOURS)
+        total = 0
+        while True:
+            async with self.session_factory() as db:
+                user_ids = await UserRepository(db).get_expired_trial_ids(cutoff, self.batch_size)
+                if not user_ids:
+                    return total
+                
+                await UserRepository(db).mark_trials_expired(user_ids)
+                # Lapsed subscribers were told their subscription expired instead
+                subscribers = await SubscriptionRepository(db).get_subscriber_ids(user_ids)
+                trial_users = [user_id for user_id in user_ids if user_id not in subscribers]
+                if trial_users:
+                    await NotificationService(db).create_bulk_notifications(
+                        trial_users,
+                        title="Trial Expired",
+                        message="Your free trial has ended. Subscribe to keep viewing influencer profiles.",
+                        notification_type="TRIAL_EXPIRED"
+                    )
+                await db.commit()
+                total += len(user_ids)
+    
+    async def expire_subscriptions(self, now: datetime) -> int:
+        """Expire lapsed subscriptions batch by batch; returns users revoked."""
+        total = 0
+        while True:
+            async with self.session_factory() as db:
+                subscription_repo = SubscriptionRepository(db)
+                lapsed = await subscription_repo.get_lapsed(now, self.batch_size)
+                if not lapsed:
+                    return total
+                
+                user_ids = list({user_id for _, user_id in lapsed})
+                await subscription_repo.expire([subscription_id for subscription_id, _ in lapsed], now)
+                revoked = await UserRepository(db).revoke_subscription_flags(
+                    user_ids,
+                    subscription_repo.active_exists(now)
+                )
+                if revoked:
+                    await NotificationService(db).create_bulk_notifications(
+                        revoked,
+                        title="Subscription Expired",
+                        message="Your subscription period has ended. Renew it to keep full access.",
+                        notification_type="SUBSCRIPTION_EXPIRED"
+                    )
+                await db.commit()
+                invalidate_entitlements(*user_ids)
+                total += len(revoked)
+    
+    async def sweep(self) -> Optional[dict[str, int]]:
+        """One pass; returns None when another node holds the lock."""
+        async with advisory_lock(LOCK_NAME) as acquired:
+            if not acquired:
+                return None
+            now = datetime.now(timezone.utc)
+            return {
+                "trials_expired": await self.expire_trials(now),
+                "subscriptions_revoked": await self.expire_subscriptions(now),
+            }
+    
+    async def _run_forever(self) -> None:
+        while True:
+            try:
+                stats = await self.sweep()
+                if stats and any(stats.values()):
+                    logger.info(f"⏰ Expiry sweep: {stats}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Expiry sweep failed: {e}")
+            await asyncio.sleep(settings.EXPIRY_SWEEP_INTERVAL_SECONDS)
+    
+    def start(self) -> None:
+        """Start the periodic background sweep."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run_forever())
+    
+    async def stop(self) -> None:
+        """Cancel the background sweep."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# Process-wide sweeper started from app startup when enabled
+expiry_sweeper = ExpirySweeper()
@@ -0,0 +1,99 @@
+"""
+Stale-while-revalidate cache of explorer listing pages.
+
+The first pages of GET /profiles/ are requested by every brand session and
+change slowly. Each normalized query keeps its serialized page; within the
+soft TTL it is served as is. Past the soft TTL it is still served right
+away while one background task recomputes it, so explorer latency does not
+depend on the listing query. Pages older than the max age are dropped and
+the next request waits for a fresh one (shared with concurrent requests).
+
+Profile writes published on the invalidation bus mark every page stale
+rather than dropping them: they are refreshed on their next request.
+"""
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Hashable, NamedTuple, Optional
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.invalidation import invalidation_bus
+from app.core.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+Loader = Callable[[], Awaitable[bytes]]
+
+
+class ExplorerPage(NamedTuple):
+    """A serialized page and when its query started."""
+    body: bytes
+    loaded_at: float
+
+
+class ExplorerPageCache:
+    """Serve cached pages, refreshing stale ones in the background."""
+
+    def __init__(self, soft_ttl: float, max_age: float, maxsize: int):
+        self.soft_ttl = soft_ttl
+        self._pages = TTLCache(maxsize=maxsize, ttl=max_age)
+        self._flights = SingleFlight()
+        self._refreshes: set[asyncio.Task] = set()
+        self._stale_before = 0.0
+
+    def is_stale(self, page: ExplorerPage) -> bool:
+        return page.loaded_at + self.soft_ttl <= time.time() or page.loaded_at < self._stale_before
+
+    async def get(self, key: Hashable, load: Loader) -> bytes:
+        """Page for key, loading it with load() when missing or stale."""
+        page = self._pages.get(key)
+        if page is None:
+            return await self._flights.do(key, lambda: self._fill(key, load))
+        if self.is_stale(page) and not self._flights.in_flight(key):
+            task = asyncio.create_task(self._refresh(key, load))
+            self._refreshes.add(task)
+            task.add_done_callback(self._refreshes.discard)
+        return page.body
+
+    async def _fill(self, key: Hashable, load: Loader) -> bytes:
+        # Stamped before the query, so a write during it leaves the page stale
+        loaded_at = time.time()
+        body = await load()
+        self._pages.set(key, ExplorerPage(body, loaded_at))
+        return body
+
+    async def _refresh(self, key: Hashable, load: Loader) -> None:
+        try:
+            await self._flights.do(key, lambda: self._fill(key, load))
+        except Exception as e:
+            # The stale page keeps being served until its max age
+            logger.error(f"❌ Explorer page refresh failed: {e}")
+
+    def mark_stale(self, ids: Optional[list] = None) -> None:
+        """Have every cached page refreshed on its next request."""
+        self._stale_before = time.time()
+
+    def clear(self) -> None:
+        self._pages.clear()
+
+    async def stop(self) -> None:
+        """Cancel background refreshes still running."""
+        for task in list(self._refreshes):
+            task.cancel()
+        if self._refreshes:
+            await asyncio.gather(*self._refreshes, return_exceptions=True)
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+
+# Process-wide explorer cache
+explorer_cache = ExplorerPageCache(
+    soft_ttl=settings.EXPLORER_CACHE_SOFT_TTL_SECONDS,
+    max_age=settings.EXPLORER_CACHE_MAX_AGE_SECONDS,
+    maxsize=settings.EXPLORER_CACHE_SIZE
+)
+
+invalidation_bus.subscribe("profile", explorer_cache.mark_stale)
+invalidation_bus.subscribe("profile_user", explorer_cache.mark_stale)
@@ -0,0 +1,194 @@
+"""
+Streaming exports of admin data as CSV or NDJSON.
+
+Rows are read with server-side cursors (yield_per) and encoded one
+partition at a time, so memory stays flat whatever the size of the
+export. The header (CSV) is emitted before the query runs so the client
+gets its first byte immediately.
+"""
+import csv
+import enum
+import io
+import json
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Callable, Literal, Optional
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.campaign import Campaign, CampaignStatus
+from app.models.profile import InfluencerProfile
+from app.models.transaction import Transaction, TransactionStatus
+from app.models.user import User, UserRole
+
+ExportFormat = Literal["csv", "ndjson"]
+
+MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def transactions_export(status: Optional[TransactionStatus] = None) -> Select:
+    """Transactions with the paying user's email."""
+    query = (
+        select(
+            Transaction.id,
+            Transaction.user_id,
+            User.email.label("user_email"),
+            Transaction.amount,
+            Transaction.type,
+            Transaction.status,
+            Transaction.description,
+            Transaction.payment_method,
+            Transaction.transaction_reference,
+            Transaction.created_at,
+            Transaction.updated_at,
+        )
+        .join(User, User.id == Transaction.user_id)
+        .order_by(Transaction.id)
+    )
+    if status:
+        query = query.where(Transaction.status == status)
+    return query
+
+
+def users_export(
+    role: Optional[UserRole] = None,
+    is_approved: Optional[bool] = None
+) -> Select:
+    """Users without credentials."""
+    query = select(
+        User.id,
+        User.email,
+        User.full_name,
+        User.role,
+        User.is_active,
+        User.is_approved,
+        User.has_active_subscription,
+        User.trial_start_time,
+        User.trial_expired,
+        User.created_at,
+    ).order_by(User.id)
+    if role:
+        query = query.where(User.role == role)
+    if is_approved is not None:
+        query = query.where(User.is_approved == is_approved)
+    return query
+
+
+def campaigns_export(status: Optional[CampaignStatus] = None) -> Select:
+    """Campaigns without their free-text briefing and reviews."""
+    query = select(
+        Campaign.id,
+        Campaign.empresa_id,
+        Campaign.influencer_id,
+        Campaign.title,
+        Campaign.status,
+        Campaign.proposed_budget,
+        Campaign.final_budget,
+        Campaign.start_date,
+        Campaign.end_date,
+        Campaign.empresa_rating,
+        Campaign.influencer_rating,
+        Campaign.created_at,
+        Campaign.updated_at,
+    ).order_by(Campaign.id)
+    if status:
+        query = query.where(Campaign.status == status)
+    return query
+
+
+def profiles_export(is_approved: Optional[bool] = None) -> Select:
+    """Influencer profiles with audience, rates and reputation."""
+    query = (
+        select(
+            InfluencerProfile.id,
+            InfluencerProfile.user_id,
+            User.full_name,
+            User.email,
+            User.is_approved,
+            InfluencerProfile.instagram_handle,
+            InfluencerProfile.instagram_followers,
+            InfluencerProfile.tiktok_handle,
+            InfluencerProfile.tiktok_followers,
+            InfluencerProfile.youtube_handle,
+            InfluencerProfile.youtube_subscribers,
+            InfluencerProfile.average_engagement_rate,
+            InfluencerProfile.suggested_rate_per_post,
+            InfluencerProfile.suggested_rate_per_story,
+            InfluencerProfile.suggested_rate_per_video,
+            InfluencerProfile.categories,
+            InfluencerProfile.total_campaigns_completed,
+            InfluencerProfile.rating_count,
+            InfluencerProfile.average_rating,
+            InfluencerProfile.created_at,
+        )
+        .join(User, User.id == InfluencerProfile.user_id)
+        .order_by(InfluencerProfile.id)
+    )
+    if is_approved is not None:
+        query = query.where(User.is_approved == is_approved)
+    return query
+
+
+def export_value(value: Any) -> Any:
+    """Convert a column value into something JSON/CSV can represent."""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def csv_value(value: Any) -> Any:
+    value = export_value(value)
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+class ExportService:
+    """Encode the result of a column select as a stream of text chunks."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        chunk_size: int = settings.EXPORT_CHUNK_SIZE
+    ):
+        # Exports outlive the request handler, so they use their own session
+        self.session_factory = session_factory
+        self.chunk_size = chunk_size
+
+    async def stream(self, query: Select, export_format: ExportFormat) -> AsyncIterator[str]:
+        """Yield the export in chunks of at most chunk_size rows."""
+        columns = list(query.selected_columns.keys())
+
+        if export_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(columns)
+            yield buffer.getvalue()
+
+        async with self.session_factory() as db:
+            result = await db.stream(
+                query.execution_options(yield_per=self.chunk_size)
+            )
+            async for rows in result.partitions():
+                if export_format == "csv":
+                    buffer.seek(0)
+                    buffer.truncate()
+                    writer.writerows([csv_value(value) for value in row] for row in rows)
+                    yield buffer.getvalue()
+                else:
+                    yield "".join(
+                        json.dumps(
+                            {name: export_value(value) for name, value in zip(columns, row)},
+                            ensure_ascii=False
+                        ) + "\n"
+                        for row in rows
+                    )
@@ -0,0 +1,160 @@
+"""
+Campaign funnel analytics: status event log and daily rollups.
+
+CampaignService records every status transition. The rollup is rebuilt
+for recent days only (see refresh) and funnel queries read nothing but
+the rollup, so their cost depends on the length of the period in days,
+not on the number of campaigns.
+"""
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.campaign import Campaign, CampaignStatus
+from app.models.campaign_event import CampaignStatusEvent
+from app.repositories.funnel_repository import FunnelRepository
+from app.schemas.funnel_schemas import CampaignFunnel, LatencyBucket
+
+# Upper bounds (hours since proposal) of the latency bands; the last band
+# is open-ended
+LATENCY_BOUNDS_HOURS = (1, 6, 24, 72, 168, 720)
+LATENCY_LABELS = ("<1h", "1-6h", "6-24h", "1-3d", "3-7d", "7-30d", ">30d")
+
+
+def latency_bucket(seconds: float) -> int:
+    """Index of the latency band containing seconds."""
+    for index, bound in enumerate(LATENCY_BOUNDS_HOURS):
+        if seconds < bound * 3600:
+            return index
+    return len(LATENCY_BOUNDS_HOURS)
+
+
+def as_utc(moment: datetime) -> datetime:
+    # SQLite returns naive datetimes
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+def day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+def status_event(
+    campaign: Campaign,
+    from_status: Optional[CampaignStatus],
+    to_status: CampaignStatus,
+    occurred_at: Optional[datetime] = None
+) -> CampaignStatusEvent:
+    """Build the event of one transition, with its time since proposal."""
+    occurred_at = occurred_at or datetime.now(timezone.utc)
+    seconds = None
+    bucket = None
+    if from_status is not None or to_status != CampaignStatus.PENDIENTE:
+        seconds = max(0.0, (as_utc(occurred_at) - as_utc(campaign.created_at)).total_seconds())
+        bucket = latency_bucket(seconds)
+    return CampaignStatusEvent(
+        campaign_id=campaign.id,
+        from_status=from_status,
+        to_status=to_status,
+        occurred_at=occurred_at,
+        seconds_since_proposal=seconds,
+        latency_bucket=bucket,
+    )
+
+
+def rate(part: int, whole: int) -> Optional[float]:
+    return round(part / whole, 4) if whole else None
+
+
+class FunnelService:
+    """Service for recording campaign transitions and reading the funnel."""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.funnel_repo = FunnelRepository(db)
+    
+    async def record_transition(
+        self,
+        campaign: Campaign,
+        from_status: Optional[CampaignStatus],
+        to_status: CampaignStatus
+    ) -> None:
+        """Log a status change in the caller's transaction."""
+        await self.funnel_repo.add_events([status_event(campaign, from_status, to_status)])
+    
+    async def backfill(self, batch_size: int = 500) -> int:
+        """
+        Log campaigns created before the event log existed.
+        
+        Only the creation and the current status are known: the current
+        status is logged at the campaign's last update. Returns the number
+        of campaigns backfilled.
+        """
+        backfilled = 0
+        while True:
+            campaigns = await self.funnel_repo.get_campaigns_without_events(batch_size)
+            if not campaigns:
+                return backfilled
+            events = []
+            for campaign in campaigns:
+                events.append(status_event(campaign, None, CampaignStatus.PENDIENTE, campaign.created_at))
+                if campaign.status != CampaignStatus.PENDIENTE:
+                    events.append(status_event(campaign, None, campaign.status, campaign.updated_at))
+            await self.funnel_repo.add_events(events)
+            backfilled += len(campaigns)
+    
+    async def refresh(self, now: Optional[datetime] = None, lookback_days: int = 1) -> int:
+        """
+        Rebuild the rollup days touched in the last lookback_days.
+        
+        Meant to run periodically (e.g. every 15 minutes); a run with a
+        large lookback rebuilds history after a backfill.
+        """
+        now = now or datetime.now(timezone.utc)
+        since = day_start((now - timedelta(days=lookback_days)).date())
+        written = await self.funnel_repo.rebuild_daily(since)
+        await self.db.flush()
+        return written
+    
+    async def get_funnel(self, start: date, end: date) -> CampaignFunnel:
+        """Funnel of the days in [start, end] from the rollup."""
+        totals = await self.funnel_repo.get_totals(day_start(start), day_start(end + timedelta(days=1)))
+        
+        counts = {item: 0 for item in CampaignStatus}
+        accept_latency = [0] * len(LATENCY_LABELS)
+        accept_seconds = 0.0
+        for to_status, bucket, transitions, seconds_sum in totals:
+            counts[to_status] += transitions
+            if to_status == CampaignStatus.ACTIVA and bucket is not None:
+                accept_latency[bucket] += transitions
+                accept_seconds += seconds_sum or 0.0
+        
+        proposals = counts[CampaignStatus.PENDIENTE]
+        acceptances = counts[CampaignStatus.ACTIVA]
+        timed_acceptances = sum(accept_latency)
+        latest_day = await self.funnel_repo.get_latest_day()
+        
+        return CampaignFunnel(
+            start=start,
+            end=end,
+            proposals=proposals,
+            negotiations=counts[CampaignStatus.NEGOCIACION],
+            acceptances=acceptances,
+            rejections=counts[CampaignStatus.RECHAZADA],
+            completions=counts[CampaignStatus.FINALIZADA],
+            cancellations=counts[CampaignStatus.CANCELADA],
+            negotiation_rate=rate(counts[CampaignStatus.NEGOCIACION], proposals),
+            acceptance_rate=rate(acceptances, proposals),
+            completion_rate=rate(counts[CampaignStatus.FINALIZADA], acceptances),
+            avg_hours_to_accept=(
+                round(accept_seconds / timed_acceptances / 3600, 2) if timed_acceptances else None
+            ),
+            time_to_accept=[
+                LatencyBucket(
+                    label=label,
+                    max_hours=LATENCY_BOUNDS_HOURS[index] if index < len(LATENCY_BOUNDS_HOURS) else None,
+                    count=accept_latency[index]
+                )
+                for index, label in enumerate(LATENCY_LABELS)
+            ],
+            refreshed_through=as_utc(latest_day).date() if latest_day else None,
+        )
@@ -0,0 +1,239 @@
+"""
+Bulk import of influencer accounts and profiles.
+
+The file is parsed as a stream of CSV or NDJSON records and processed in
+batches: rows are validated, passwords are bcrypt-hashed in a process pool
+(hashing dominates the cost of a registration and holds the GIL), and users
+and profiles are written with one multi-row INSERT each per batch. Hashing
+of the next batch overlaps with the inserts of the current one.
+
+The process pool is shared by every import of the process, so concurrent
+imports queue for IMPORT_HASH_WORKERS processes instead of each starting
+its own.
+"""
+import asyncio
+import csv
+import json
+import math
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Iterable, Iterator, Literal, Optional
+
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.security import get_password_hash
+from app.models.user import UserRole
+from app.repositories.profile_repository import ProfileRepository
+from app.repositories.user_repository import UserRepository
+from app.schemas.import_schemas import ImportReport, ImportRowError, InfluencerImportRow
+from app.services.influencer_index import influencer_index
+
+ImportFormat = Literal["csv", "ndjson"]
+
+ACCOUNT_FIELDS = {"email", "password", "full_name"}
+
+
+def iter_records(lines: Iterable[str], import_format: ImportFormat) -> Iterator[tuple[int, Optional[dict], Optional[str]]]:
+    """
+    Yield (line number, record, parse error) for each record of the file.
+
+    Empty CSV cells are dropped so they fall back to the schema defaults.
+    """
+    if import_format == "csv":
+        reader = csv.DictReader(lines)
+        for record in reader:
+            yield reader.line_num, {
+                key.strip(): value for key, value in record.items()
+                if key and value not in (None, "")
+            }, None
+        return
+
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, None, f"Invalid JSON: {e.msg}"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, "Expected a JSON object"
+            continue
+        yield line_number, record, None
+
+
+_hash_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_hash_pool() -> ProcessPoolExecutor:
+    """The process-wide password hashing pool, started on first use."""
+    global _hash_pool
+    if _hash_pool is None:
+        _hash_pool = ProcessPoolExecutor(max_workers=settings.IMPORT_HASH_WORKERS or os.cpu_count() or 1)
+    return _hash_pool
+
+
+def shutdown_hash_pool() -> None:
+    """Stop the hashing processes (app shutdown)."""
+    global _hash_pool
+    if _hash_pool is not None:
+        _hash_pool.shutdown(cancel_futures=True)
+        _hash_pool = None
+
+
+def hash_passwords(passwords: list[str]) -> list[str]:
+    """Hash a slice of passwords (runs in a worker process)."""
+    return [get_password_hash(password) for password in passwords]
+
+
+def describe_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}"
+        for item in error.errors()
+    )
+
+
+class InfluencerImporter:
+    """Validate and insert influencer rows in hashed, batched inserts."""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        approve: bool = False,
+        batch_size: int = settings.IMPORT_BATCH_SIZE,
+        hash_workers: Optional[int] = settings.IMPORT_HASH_WORKERS,
+        max_reported_errors: int = settings.IMPORT_MAX_REPORTED_ERRORS,
+        pool: Optional[Executor] = None
+    ):
+        self.db = db
+        self.approve = approve
+        self.batch_size = batch_size
+        self.hash_workers = hash_workers or os.cpu_count() or 1
+        self.pool = pool
+        self.max_reported_errors = max_reported_errors
+        self.user_repo = UserRepository(db)
+        self.profile_repo = ProfileRepository(db)
+        self.report = ImportReport()
+        self._seen_emails: set[str] = set()
+
+    async def run(self, lines: Iterable[str], import_format: ImportFormat) -> ImportReport:
+        """Import every record of the file. Each batch is committed on its own."""
+        started_at = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        pool = self.pool or get_hash_pool()
+
+        previous = None
+        for batch in self._batches(iter_records(lines, import_format)):
+            # Drop already registered emails before paying for their hashes
+            batch = await self._drop_registered(batch)
+            if not batch:
+                continue
+            hashing = self._hash(loop, pool, [row.password for _, row in batch])
+            if previous:
+                await self._insert(previous[0], await previous[1])
+            previous = (batch, hashing)
+        if previous:
+            await self._insert(previous[0], await previous[1])
+
+        if self.report.imported and self.approve:
+            influencer_index.mark_stale()
+
+        self.report.elapsed_seconds = round(time.perf_counter() - started_at, 3)
+        return self.report
+
+    def _batches(self, records) -> Iterator[list[tuple[int, InfluencerImportRow]]]:
+        """Group valid, not-yet-seen rows into batches; record the rest as errors."""
+        batch = []
+        for line, record, parse_error in records:
+            self.report.total_rows += 1
+            if parse_error:
+                self._fail(line, None, parse_error)
+                continue
+
+            try:
+                row = InfluencerImportRow.model_validate(record)
+            except ValidationError as e:
+                email = record.get("email")
+                self._fail(line, str(email) if email else None, describe_validation_error(e))
+                continue
+
+            if row.email in self._seen_emails:
+                self._fail(line, row.email, "Duplicate email in file")
+                continue
+            self._seen_emails.add(row.email)
+
+            batch.append((line, row))
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _hash(self, loop, pool: Executor, passwords: list[str]) -> asyncio.Future:
+        """Hash passwords across the pool, one slice per worker."""
+        size = max(1, math.ceil(len(passwords) / self.hash_workers))
+        slices = [
+            loop.run_in_executor(pool, hash_passwords, passwords[start:start + size])
+            for start in range(0, len(passwords), size)
+        ]
+
+        async def join() -> list[str]:
+            return [hashed for part in await asyncio.gather(*slices) for hashed in part]
+
+        return asyncio.ensure_future(join())
+
+    async def _drop_registered(self, batch: list[tuple[int, InfluencerImportRow]]) -> list[tuple[int, InfluencerImportRow]]:
+        existing = await self.user_repo.get_existing_emails([row.email for _, row in batch])
+        if not existing:
+            return batch
+
+        remaining = []
+        for line, row in batch:
+            if row.email in existing:
+                self._fail(line, row.email, "Email already registered")
+            else:
+                remaining.append((line, row))
+        return remaining
+
+    async def _insert(self, batch: list[tuple[int, InfluencerImportRow]], hashes: list[str]) -> None:
+        """Insert one batch of users and their profiles."""
+        accepted = [(line, row, hashed_password) for (line, row), hashed_password in zip(batch, hashes)]
+
+        try:
+            user_ids = await self.user_repo.bulk_create([
+                {
+                    "email": row.email,
+                    "hashed_password": hashed_password,
+                    "full_name": row.full_name,
+                    "role": UserRole.INFLUENCER,
+                    "is_active": True,
+                    "is_approved": self.approve,
+                    "has_active_subscription": False,
+                    "trial_expired": False,
+                }
+                for _, row, hashed_password in accepted
+            ])
+            await self.profile_repo.bulk_create([
+                {"user_id": user_ids[row.email], **row.model_dump(exclude=ACCOUNT_FIELDS)}
+                for _, row, _ in accepted
+            ])
+            await self.db.commit()
+        except IntegrityError as e:
+            # E.g. an email registered concurrently: the whole batch is rejected
+            await self.db.rollback()
+            for line, row, _ in accepted:
+                self._fail(line, row.email, f"Rejected by the database: {e.orig}")
+            return
+
+        self.report.imported += len(accepted)
+
+    def _fail(self, line: int, email: Optional[str], error: str) -> None:
+        self.report.failed += 1
+        if len(self.report.errors) < self.max_reported_errors:
+            self.report.errors.append(ImportRowError(line=line, email=email, error=error))
+        else:
+            self.report.errors_truncated = True
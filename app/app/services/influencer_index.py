@@ -0,0 +1,359 @@
+"""
+In-memory columnar index of influencer profiles for vectorized ranking.
+
+The index keeps one row per profile in NumPy arrays (follower counts,
+engagement, rates, rating, category membership and eligibility) plus a
+unit-length float32 embedding per profile for cosine-similarity lookups.
+It is loaded once and then refreshed incrementally: only profiles or users
+whose updated_at moved past the last seen watermark are re-read, so ranking
+the whole catalog never requires a full-table ORM scan.
+"""
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+import numpy as np
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.profile import InfluencerProfile
+from app.models.user import User
+
+NETWORKS = ("instagram", "tiktok", "youtube")
+
+# Rate that best represents a deliverable on each network
+NETWORK_RATE_COLUMN = {"instagram": 0, "tiktok": 2, "youtube": 2}
+
+# Relative weight of each signal in the recommendation score
+SCORE_WEIGHTS = {
+    "reach": 0.25,
+    "engagement": 0.25,
+    "price": 0.20,
+    "categories": 0.20,
+    "rating": 0.10,
+}
+
+# Incremental refreshes re-read this much history before the watermark, so
+# transactions that committed after a refresh with an older now() are not missed
+WATERMARK_OVERLAP = timedelta(minutes=2)
+
+# Engagement rates above this (in %) get the maximum engagement score
+ENGAGEMENT_CAP = 15.0
+
+# Similarity embedding layout: follower mix (3), audience size, engagement,
+# price tier, then one column per category. Weights balance the blocks so
+# that the open-ended category block does not dominate the cosine.
+EMBEDDING_DENSE_DIMS = len(NETWORKS) + 3
+EMBEDDING_WEIGHTS = {
+    "mix": 1.0,
+    "audience": 0.8,
+    "engagement": 0.6,
+    "price": 0.8,
+    "categories": 1.0,
+}
+
+INDEX_COLUMNS = (
+    InfluencerProfile.id,
+    InfluencerProfile.user_id,
+    InfluencerProfile.instagram_followers,
+    InfluencerProfile.tiktok_followers,
+    InfluencerProfile.youtube_subscribers,
+    InfluencerProfile.average_engagement_rate,
+    InfluencerProfile.suggested_rate_per_post,
+    InfluencerProfile.suggested_rate_per_story,
+    InfluencerProfile.suggested_rate_per_video,
+    InfluencerProfile.average_rating,
+    InfluencerProfile.categories,
+    InfluencerProfile.updated_at,
+    User.is_approved,
+    User.is_active,
+    User.updated_at.label("user_updated_at"),
+)
+
+
+def _nan_if_none(value) -> float:
+    return np.nan if value is None else float(value)
+
+
+class InfluencerIndex:
+    """
+    Columnar feature store for approved influencer profiles.
+
+    Arrays grow geometrically; rows are never removed; profiles that stop
+    being eligible (unapproved or inactive owner) are masked out instead.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.size = 0
+        self.profile_ids = np.zeros(capacity, dtype=np.int64)
+        self.user_ids = np.zeros(capacity, dtype=np.int64)
+        self.followers = np.zeros((capacity, len(NETWORKS)), dtype=np.float64)
+        self.engagement = np.full(capacity, np.nan, dtype=np.float64)
+        self.rates = np.full((capacity, 3), np.nan, dtype=np.float64)
+        self.rating = np.full(capacity, np.nan, dtype=np.float64)
+        self.eligible = np.zeros(capacity, dtype=bool)
+        self.categories = np.zeros((capacity, 0), dtype=bool)
+        self.category_columns: dict[str, int] = {}
+        self.row_by_profile: dict[int, int] = {}
+        self.vectors = np.zeros((capacity, EMBEDDING_DENSE_DIMS), dtype=np.float32)
+
+        self.watermark: Optional[datetime] = None
+        self.loaded = False
+        self.stale = False
+        self.last_refresh = 0.0
+        self._lock = asyncio.Lock()
+
+    # ============================================
+    # MAINTENANCE
+    # ============================================
+
+    def mark_stale(self) -> None:
+        """Force the next refresh to run regardless of the refresh interval."""
+        self.stale = True
+
+    async def refresh(self, db: AsyncSession, force: bool = False) -> None:
+        """
+        Bring the index up to date.
+
+        The first call loads every profile; later calls only read rows whose
+        profile or owner changed since the watermark. Refreshes are throttled
+        to RECOMMENDATION_REFRESH_SECONDS unless the index was marked stale.
+        """
+        interval = settings.RECOMMENDATION_REFRESH_SECONDS
+        if self.loaded and not (force or self.stale) and time.monotonic() - self.last_refresh < interval:
+            return
+
+        async with self._lock:
+            if self.loaded and not (force or self.stale) and time.monotonic() - self.last_refresh < interval:
+                return
+
+            self.stale = False
+            query = select(*INDEX_COLUMNS).join(User, User.id == InfluencerProfile.user_id)
+            if self.loaded and self.watermark is not None:
+                # Re-reading the overlap window is harmless: upserts are idempotent
+                since = self.watermark - WATERMARK_OVERLAP
+                query = query.where(or_(
+                    InfluencerProfile.updated_at >= since,
+                    User.updated_at >= since,
+                ))
+
+            result = await db.execute(query)
+            self.upsert_rows(dict(row) for row in result.mappings().all())
+            self.loaded = True
+            self.last_refresh = time.monotonic()
+
+    def upsert_rows(self, rows: Iterable[dict]) -> None:
+        """Insert or overwrite index rows from profile/user column mappings."""
+        for row in rows:
+            index = self.row_by_profile.get(row["id"])
+            if index is None:
+                index = self._append(row["id"])
+
+            self.user_ids[index] = row["user_id"]
+            self.followers[index] = (
+                row.get("instagram_followers") or 0,
+                row.get("tiktok_followers") or 0,
+                row.get("youtube_subscribers") or 0,
+            )
+            self.engagement[index] = _nan_if_none(row.get("average_engagement_rate"))
+            self.rates[index] = (
+                _nan_if_none(row.get("suggested_rate_per_post")),
+                _nan_if_none(row.get("suggested_rate_per_story")),
+                _nan_if_none(row.get("suggested_rate_per_video")),
+            )
+            self.rating[index] = _nan_if_none(row.get("average_rating"))
+            self.eligible[index] = bool(row.get("is_approved", True) and row.get("is_active", True))
+
+            self.categories[index] = False
+            for category in row.get("categories") or []:
+                # Resolve first: a new category widens (replaces) the matrix
+                column = self._category_column(category)
+                self.categories[index, column] = True
+
+            self._embed(index)
+
+            for key in ("updated_at", "user_updated_at"):
+                seen = row.get(key)
+                if seen is not None and (self.watermark is None or seen > self.watermark):
+                    self.watermark = seen
+
+    def _append(self, profile_id: int) -> int:
+        if self.size == len(self.profile_ids):
+            self._grow(max(1, len(self.profile_ids)) * 2)
+        index = self.size
+        self.size += 1
+        self.profile_ids[index] = profile_id
+        self.row_by_profile[profile_id] = index
+        return index
+
+    def _grow(self, capacity: int) -> None:
+        def grow(array: np.ndarray, fill) -> np.ndarray:
+            grown = np.full((capacity, *array.shape[1:]), fill, dtype=array.dtype)
+            grown[: len(array)] = array
+            return grown
+
+        self.profile_ids = grow(self.profile_ids, 0)
+        self.user_ids = grow(self.user_ids, 0)
+        self.followers = grow(self.followers, 0)
+        self.engagement = grow(self.engagement, np.nan)
+        self.rates = grow(self.rates, np.nan)
+        self.rating = grow(self.rating, np.nan)
+        self.eligible = grow(self.eligible, False)
+        self.categories = grow(self.categories, False)
+        self.vectors = grow(self.vectors, 0)
+
+    def _category_column(self, category: str) -> int:
+        key = category.strip().lower()
+        column = self.category_columns.get(key)
+        if column is None:
+            column = len(self.category_columns)
+            self.category_columns[key] = column
+            self.categories = np.hstack(
+                [self.categories, np.zeros((len(self.categories), 1), dtype=bool)]
+            )
+            self.vectors = np.hstack(
+                [self.vectors, np.zeros((len(self.vectors), 1), dtype=np.float32)]
+            )
+        return column
+
+    def _embed(self, index: int) -> None:
+        """Recompute the unit-length similarity embedding of one row."""
+        followers = self.followers[index]
+        total = followers.sum()
+        vector = np.zeros(self.vectors.shape[1], dtype=np.float64)
+
+        if total > 0:
+            vector[: len(NETWORKS)] = EMBEDDING_WEIGHTS["mix"] * followers / total
+        # log10 scale: 1 ~ 10 followers, 8 ~ 100M followers
+        vector[len(NETWORKS)] = EMBEDDING_WEIGHTS["audience"] * np.log10(1.0 + total) / 8.0
+
+        engagement = self.engagement[index]
+        if not np.isnan(engagement):
+            vector[len(NETWORKS) + 1] = (
+                EMBEDDING_WEIGHTS["engagement"] * min(engagement, ENGAGEMENT_CAP) / ENGAGEMENT_CAP
+            )
+
+        rates = self.rates[index]
+        known_rates = rates[~np.isnan(rates)]
+        if known_rates.size:
+            # Price tier on a log scale: 1 ~ $10, 5 ~ $100k per deliverable
+            vector[len(NETWORKS) + 2] = (
+                EMBEDDING_WEIGHTS["price"] * np.log10(1.0 + known_rates.max()) / 5.0
+            )
+
+        categories = self.categories[index]
+        count = categories.sum()
+        if count:
+            vector[EMBEDDING_DENSE_DIMS:] = (
+                EMBEDDING_WEIGHTS["categories"] * categories / np.sqrt(count)
+            )
+
+        norm = np.linalg.norm(vector)
+        self.vectors[index] = vector / norm if norm > 0 else vector
+
+    # ============================================
+    # RANKING
+    # ============================================
+
+    def recommend(
+        self,
+        budget: Optional[float] = None,
+        categories: Optional[list[str]] = None,
+        network: Optional[str] = None,
+        limit: int = 20
+    ) -> list[tuple[int, float]]:
+        """
+        Score every eligible profile against a campaign brief.
+
+        Returns (profile_id, score) pairs, best first. Scores are in [0, 1].
+        """
+        n = self.size
+        if n == 0:
+            return []
+
+        mask = self.eligible[:n].copy()
+
+        # Reach: log-scaled followers on the requested network (or all networks)
+        followers = self.followers[:n]
+        if network:
+            audience = followers[:, NETWORKS.index(network)]
+            mask &= audience > 0
+        else:
+            audience = followers.sum(axis=1)
+        reach = np.log1p(audience)
+        top_reach = reach[mask].max() if mask.any() else 0.0
+        reach = reach / top_reach if top_reach > 0 else np.zeros(n)
+
+        engagement = np.nan_to_num(self.engagement[:n], nan=0.0)
+        engagement = np.clip(engagement / ENGAGEMENT_CAP, 0.0, 1.0)
+
+        # Price fit: full score within budget, quadratic decay above it
+        rate = self.rates[:n, NETWORK_RATE_COLUMN.get(network, 0)]
+        if budget:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                price = np.where(rate <= budget, 1.0, (budget / rate) ** 2)
+            price = np.where(np.isnan(rate), 0.5, price)
+        else:
+            price = np.ones(n)
+
+        category_score = np.ones(n)
+        if categories:
+            columns = [self.category_columns.get(c.strip().lower()) for c in categories]
+            known = [column for column in columns if column is not None]
+            if known:
+                category_score = self.categories[:n, known].sum(axis=1) / len(columns)
+            else:
+                category_score = np.zeros(n)
+
+        # Unrated influencers get a neutral prior instead of zero
+        rating = np.nan_to_num((self.rating[:n] - 1.0) / 4.0, nan=0.5)
+
+        score = (
+            SCORE_WEIGHTS["reach"] * reach
+            + SCORE_WEIGHTS["engagement"] * engagement
+            + SCORE_WEIGHTS["price"] * price
+            + SCORE_WEIGHTS["categories"] * category_score
+            + SCORE_WEIGHTS["rating"] * rating
+        )
+        score = np.where(mask, score, -np.inf)
+
+        candidates = int(mask.sum())
+        if candidates == 0:
+            return []
+        k = min(limit, candidates)
+        top = np.argpartition(-score, k - 1)[:k]
+        top = top[np.argsort(-score[top], kind="stable")]
+        return [(int(self.profile_ids[i]), float(score[i])) for i in top]
+
+    def similar(self, profile_id: int, limit: int = 10) -> Optional[list[tuple[int, float]]]:
+        """
+        Find the eligible profiles closest to one profile by cosine similarity.
+
+        Returns (profile_id, similarity) pairs, best first, or None if the
+        profile is not in the index.
+        """
+        index = self.row_by_profile.get(profile_id)
+        if index is None:
+            return None
+
+        n = self.size
+        # Rows are unit length, so the dot product is the cosine similarity
+        similarity = self.vectors[:n] @ self.vectors[index]
+        mask = self.eligible[:n].copy()
+        mask[index] = False
+
+        candidates = int(mask.sum())
+        if candidates == 0:
+            return []
+        similarity = np.where(mask, similarity, -np.inf)
+
+        k = min(limit, candidates)
+        top = np.argpartition(-similarity, k - 1)[:k]
+        top = top[np.argsort(-similarity[top], kind="stable")]
+        return [(int(self.profile_ids[i]), float(similarity[i])) for i in top]
+
+
+# Process-wide index shared by all requests
+influencer_index = InfluencerIndex()
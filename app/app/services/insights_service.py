@@ -0,0 +1,195 @@
+"""
+Insights history service: snapshot capture, downsampling and retention.
+
+Raw snapshots are kept for INSIGHTS_RAW_RETENTION_DAYS, daily rollups for
+INSIGHTS_DAILY_RETENTION_DAYS and weekly rollups indefinitely. Growth charts
+read whichever resolution fits the requested range, so long ranges are
+served from a few compact pre-aggregated rows.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.insight import InsightSnapshot
+from app.repositories.insight_repository import InsightRepository
+from app.schemas.insight_schemas import InsightPoint
+
+# Typed metric columns of InsightSnapshot
+SNAPSHOT_METRICS = (
+    "followers",
+    "following",
+    "posts_count",
+    "total_likes",
+    "avg_views",
+    "avg_likes",
+    "avg_comments",
+    "avg_shares",
+    "engagement_rate",
+    "profile_views",
+    "reach",
+    "impressions",
+)
+
+# Insights JSON keys that map to a differently named metric
+INSIGHTS_KEY_ALIASES = {"total_videos": "posts_count"}
+
+# Widest range (in days) served at each resolution when none is requested
+RAW_MAX_DAYS = 14
+DAILY_MAX_DAYS = 180
+
+# Cap on raw snapshots returned by one request
+RAW_MAX_POINTS = 5000
+
+
+def bucket_start(moment: datetime, granularity: str) -> datetime:
+    """Start (UTC) of the day or ISO week containing moment."""
+    day = moment.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+def snapshot_from_insights(
+    profile_id: int,
+    network: str,
+    insights: dict,
+    captured_at: Optional[datetime] = None
+) -> InsightSnapshot:
+    """Build a typed snapshot from an insights payload (seed/API JSON shape)."""
+    metrics = {}
+    for key, value in insights.items():
+        name = INSIGHTS_KEY_ALIASES.get(key, key)
+        if name in SNAPSHOT_METRICS and isinstance(value, (int, float)):
+            metrics[name] = value
+    
+    return InsightSnapshot(
+        profile_id=profile_id,
+        network=network,
+        captured_at=captured_at or datetime.now(timezone.utc),
+        **metrics
+    )
+
+
+def snapshot_point(snapshot: InsightSnapshot) -> InsightPoint:
+    """Chart point for a single raw snapshot."""
+    return InsightPoint(
+        timestamp=snapshot.captured_at,
+        samples=1,
+        followers=snapshot.followers,
+        followers_min=snapshot.followers,
+        engagement_rate=snapshot.engagement_rate,
+        avg_views=snapshot.avg_views,
+        avg_likes=snapshot.avg_likes,
+        avg_comments=snapshot.avg_comments,
+    )
+
+
+class InsightsService:
+    """Service for insights time series."""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.insight_repo = InsightRepository(db)
+    
+    async def record_snapshot(
+        self,
+        profile_id: int,
+        network: str,
+        metrics: dict,
+        captured_at: Optional[datetime] = None
+    ) -> InsightSnapshot:
+        """Append one snapshot to a profile's series."""
+        snapshot = snapshot_from_insights(profile_id, network, metrics, captured_at)
+        return await self.insight_repo.create_snapshot(snapshot)
+    
+    async def get_history(
+        self,
+        profile_id: int,
+        network: str,
+        start: datetime,
+        end: datetime,
+        resolution: Optional[str] = None
+    ) -> tuple[str, list[InsightPoint]]:
+        """
+        Get chart points for [start, end).
+        
+        Without an explicit resolution, short ranges use raw snapshots,
+        medium ranges daily rollups and long ranges weekly rollups. Raw
+        points are only kept for INSIGHTS_RAW_RETENTION_DAYS, so longer raw
+        ranges are rejected (400).
+        """
+        if resolution is None:
+            span = end - start
+            if span <= timedelta(days=RAW_MAX_DAYS):
+                resolution = "raw"
+            elif span <= timedelta(days=DAILY_MAX_DAYS):
+                resolution = "day"
+            else:
+                resolution = "week"
+        
+        if resolution == "raw":
+            if end - start > timedelta(days=settings.INSIGHTS_RAW_RETENTION_DAYS):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=(
+                        f"Raw resolution covers at most {settings.INSIGHTS_RAW_RETENTION_DAYS} days; "
+                        "use resolution=day or week for longer ranges"
+                    )
+                )
+            snapshots = await self.insight_repo.get_snapshots(
+                profile_id, network, start, end, limit=RAW_MAX_POINTS
+            )
+            points = [snapshot_point(snapshot) for snapshot in snapshots]
+        else:
+            rollups = await self.insight_repo.get_rollups(
+                profile_id, network, resolution, bucket_start(start, resolution), end
+            )
+            points = [
+                InsightPoint(
+                    timestamp=rollup.bucket_start,
+                    samples=rollup.samples,
+                    followers=rollup.followers_max,
+                    followers_min=rollup.followers_min,
+                    engagement_rate=rollup.engagement_rate_avg,
+                    avg_views=rollup.avg_views_avg,
+                    avg_likes=rollup.avg_likes_avg,
+                    avg_comments=rollup.avg_comments_avg,
+                )
+                for rollup in rollups
+            ]
+        
+        return resolution, points
+    
+    async def maintain(
+        self,
+        now: Optional[datetime] = None,
+        lookback_days: int = 7
+    ) -> dict[str, int]:
+        """
+        Refresh recent rollups and apply retention.
+        
+        Rebuilds the day and week buckets touched in the last lookback_days,
+        then drops raw snapshots and daily rollups past their retention.
+        Must run more often than the raw retention window (e.g. hourly).
+        """
+        now = now or datetime.now(timezone.utc)
+        since = now - timedelta(days=lookback_days)
+        
+        stats = {
+            "daily_rollups": await self.insight_repo.rebuild_rollups(
+                "day", bucket_start(since, "day")
+            ),
+            "weekly_rollups": await self.insight_repo.rebuild_rollups(
+                "week", bucket_start(since, "week")
+            ),
+            "snapshots_pruned": await self.insight_repo.delete_snapshots_before(
+                now - timedelta(days=settings.INSIGHTS_RAW_RETENTION_DAYS)
+            ),
+            "daily_rollups_pruned": await self.insight_repo.delete_rollups_before(
+                "day", now - timedelta(days=settings.INSIGHTS_DAILY_RETENTION_DAYS)
+            ),
+        }
+        await self.db.flush()
+        return stats
@@ -0,0 +1,96 @@
+"""
+Bulk user moderation service for admins.
+"""
+from typing import Literal
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
+from app.repositories.user_repository import UserRepository
+from app.schemas.user_schemas import UserBulkActionResult, UserBulkSelection
+from app.services.influencer_index import influencer_index
+from app.services.notification_service import NotificationService
+
+ModerationAction = Literal["approve", "deactivate", "reactivate"]
+
+# Flag values written and notification sent for each action
+ACTIONS = {
+    "approve": (
+        {"is_approved": True},
+        "Account Approved",
+        "Your account has been approved. Your profile is now visible to companies.",
+        "ACCOUNT_APPROVED",
+    ),
+    "deactivate": (
+        {"is_active": False},
+        "Account Deactivated",
+        "Your account has been deactivated by an administrator.",
+        "ACCOUNT_DEACTIVATED",
+    ),
+    "reactivate": (
+        {"is_active": True},
+        "Account Reactivated",
+        "Your account has been reactivated. You can sign in again.",
+        "ACCOUNT_REACTIVATED",
+    ),
+}
+
+
+class UserModerationService:
+    """Service for approving, deactivating and reactivating users in bulk."""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.user_repo = UserRepository(db)
+        self.notification_service = NotificationService(db)
+    
+    async def apply(
+        self,
+        action: ModerationAction,
+        selection: UserBulkSelection,
+        acting_user: User
+    ) -> UserBulkActionResult:
+        """
+        Apply action to the selected users with one UPDATE.
+        
+        Only users whose state actually changes are notified. The acting
+        admin is never deactivated by their own bulk action.
+        """
+        values, title, message, notification_type = ACTIONS[action]
+        
+        conditions = self._conditions(selection)
+        if not conditions:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Provide user_ids or at least one filter"
+            )
+        if action == "deactivate":
+            conditions.append(User.id != acting_user.id)
+        
+        user_ids = await self.user_repo.bulk_update_flags(conditions, **values)
+        
+        if user_ids:
+            await self.notification_service.create_bulk_notifications(
+                user_ids=user_ids,
+                title=title,
+                message=message,
+                notification_type=notification_type
+            )
+            influencer_index.mark_stale()
+        
+        return UserBulkActionResult(action=action, updated=len(user_ids), user_ids=user_ids)
+    
+    def _conditions(self, selection: UserBulkSelection) -> list:
+        conditions = []
+        if selection.user_ids is not None:
+            conditions.append(User.id.in_(selection.user_ids))
+        if selection.role:
+            conditions.append(User.role == selection.role)
+        if selection.is_approved is not None:
+            conditions.append(User.is_approved == selection.is_approved)
+        if selection.created_after:
+            conditions.append(User.created_at >= selection.created_after)
+        if selection.created_before:
+            conditions.append(User.created_at < selection.created_before)
+        return conditions
@@ -1,11 +1,16 @@
 """
 Notification service for user alerts and updates.
 """
+from datetime import datetime, timedelta, timezone
 from typing import Optional
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+
 from app.models.notification import Notification
 from app.repositories.notification_repository import NotificationRepository
+from app.services.email_service import queue_notification_email
 
 
 class NotificationService:
@@ -27,6 +32,12 @@ class NotificationService:
         """
         Create a new notification for a user.
         
+        The email is sent right away. With digests enabled, an unread
+        notification of the same type created within
+        NOTIFICATION_DIGEST_WINDOW_MINUTES absorbs the event instead
+        (digest_count + 1, latest message); the entry then owes one digest
+        email, persisted as email_due_at and sent when the window closes.
+        
         Args:
             user_id: Target user ID
             title: Notification title
@@ -36,8 +47,24 @@ class NotificationService:
             related_entity_id: Optional related entity ID
             
         Returns:
-            Created notification
+            Created (or coalesced) notification
         """
+        window = timedelta(minutes=settings.NOTIFICATION_DIGEST_WINDOW_MINUTES)
+        
+        if window:
+            digest = await self.notification_repo.coalesce_into_digest(
+                user_id=user_id,
+                notification_type=notification_type,
+                since=datetime.now(timezone.utc) - window,
+                title=title,
+                message=message,
+                related_entity_type=related_entity_type,
+                related_entity_id=related_entity_id,
+                email_delay=window if settings.SMTP_HOST else None
+            )
+            if digest:
+                return digest
+        
         notification = Notification(
             user_id=user_id,
             title=title,
@@ -50,20 +77,49 @@ class NotificationService:
         
         notification = await self.notification_repo.create(notification)
         
-        # In production, also send email notification here
-        # await self._send_email_notification(notification)
+        await self._send_email_notification(notification)
         
         return notification
     
+    async def create_bulk_notifications(
+        self,
+        user_ids: list[int],
+        title: str,
+        message: str,
+        notification_type: str
+    ) -> int:
+        """
+        Create the same notification for many users in one batched INSERT.
+        
+        Used by background jobs; digests are not applied.
+        """
+        notifications = [
+            Notification(
+                user_id=user_id,
+                title=title,
+                message=message,
+                notification_type=notification_type,
+                is_read=False,
+            )
+            for user_id in user_ids
+        ]
+        self.db.add_all(notifications)
+        await self.db.flush()
+        
+        for notification in notifications:
+            await self._send_email_notification(notification)
+        
+        return len(notifications)
+    
     async def get_user_notifications(
         self,
         user_id: int,
         is_read: Optional[bool] = None,
         skip: int = 0,
         limit: int = 100
-    ) -> list[Notification]:
+    ) -> list[Row]:
         """
-        Get notifications for a user.
+        Get notifications for a user as read-model rows.
         """
         return await self.notification_repo.get_by_user(
             user_id=user_id,
@@ -88,9 +144,11 @@ class NotificationService:
     
     async def _send_email_notification(self, notification: Notification) -> None:
         """
-        Send email notification (placeholder for MVP).
+        Send email notification.
         
-        In production, integrate with email service (SMTP, SendGrid, etc.)
+        Only queues the notification id on the session; the email dispatcher
+        picks it up after the transaction commits (dropped on rollback).
+        Digest emails are not queued here: the dispatcher picks them up from
+        email_due_at.
         """
-        # TODO: Implement email sending
-        pass
+        queue_notification_email(self.db, notification.id)
@@ -0,0 +1,80 @@
+"""
+Read-through cache of subscription plan responses.
+
+Every pricing page asks for the plan list and plans change only when an
+admin edits them, so list and detail responses are kept as JSON bytes.
+Concurrent misses share one query through single-flight, each on its own
+session. Admin writes call invalidate_plans() with their session; once it
+commits, the cache is cleared on every worker through the invalidation bus.
+"""
+from typing import Optional
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.invalidation import invalidate_after_commit, invalidation_bus
+from app.core.singleflight import SingleFlight
+from app.repositories.subscription_plan_repository import SubscriptionPlanRepository
+from app.schemas.subscription_schemas import SubscriptionPlanResponse
+
+_plan_list = TypeAdapter(list[SubscriptionPlanResponse])
+
+# Entries are keyed ("list", active_only) and ("plan", plan_id)
+plan_cache = TTLCache(maxsize=256, ttl=settings.PLAN_CACHE_TTL_SECONDS)
+plan_flights = SingleFlight()
+
+
+async def get_plan_list(active_only: bool) -> bytes:
+    """Serialized plan list, queried at most once for concurrent misses."""
+    key = ("list", active_only)
+    body = plan_cache.get(key)
+    if body is None:
+        body = await plan_flights.do(key, lambda: _load_plan_list(active_only))
+    return body
+
+
+async def get_plan(plan_id: int) -> Optional[bytes]:
+    """Serialized plan, or None if it does not exist."""
+    key = ("plan", plan_id)
+    body = plan_cache.get(key)
+    if body is None:
+        body = await plan_flights.do(key, lambda: _load_plan(plan_id))
+    return body
+
+
+async def _load_plan_list(active_only: bool) -> bytes:
+    generation = plan_cache.generation
+    async with AsyncSessionLocal() as db:
+        plans = await SubscriptionPlanRepository(db).get_all(active_only=active_only)
+        body = _plan_list.dump_json(_plan_list.validate_python(plans, from_attributes=True))
+    # A plan written meanwhile may not be in this result
+    if generation == plan_cache.generation:
+        plan_cache.set(("list", active_only), body)
+    return body
+
+
+async def _load_plan(plan_id: int) -> Optional[bytes]:
+    generation = plan_cache.generation
+    async with AsyncSessionLocal() as db:
+        plan = await SubscriptionPlanRepository(db).get_by_id(plan_id)
+        if plan is None:
+            return None
+        body = SubscriptionPlanResponse.model_validate(plan).model_dump_json().encode()
+    if generation == plan_cache.generation:
+        plan_cache.set(("plan", plan_id), body)
+    return body
+
+
+def _evict_plans(plan_ids: Optional[list]) -> None:
+    # Any plan can appear in the cached lists
+    plan_cache.clear()
+
+
+invalidation_bus.subscribe("plan", _evict_plans)
+
+
+def invalidate_plans(db: AsyncSession, *plan_ids: int) -> None:
+    """Drop cached plans on every worker once db commits."""
+    invalidate_after_commit(db, "plan", *plan_ids)
@@ -0,0 +1,106 @@
+"""
+Read-through cache of serialized influencer profile responses.
+
+Profile detail is read far more often than profiles change, so
+GET /profiles/{id} and /profiles/user/{user_id} keep each response as JSON
+bytes (plus the dict sparse-field requests are trimmed from) in a bounded
+LRU. Every path that changes a profile must call invalidate_profile(),
+which evicts it on every worker through the invalidation bus;
+PROFILE_CACHE_TTL_SECONDS bounds staleness from writes the bus cannot see
+(scripts, MySQL deployments with several workers). The trial gate is a dependency of the
+endpoints and runs before the cache is consulted.
+"""
+from typing import Iterable, NamedTuple, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.invalidation import invalidate_after_commit, invalidation_bus
+from app.schemas.profile_schemas import InfluencerProfileResponse
+
+
+class CachedProfile(NamedTuple):
+    """A serialized profile response."""
+    payload: dict
+    body: bytes
+
+
+# Entries are keyed ("profile", profile_id); ("user", user_id) maps an
+# owner to their profile id
+profile_cache = TTLCache(
+    maxsize=settings.PROFILE_CACHE_SIZE,
+    ttl=settings.PROFILE_CACHE_TTL_SECONDS
+)
+
+
+def get_cached_profile(profile_id: Optional[int] = None, user_id: Optional[int] = None) -> Optional[CachedProfile]:
+    """Cached response of a profile, by profile id or owner id."""
+    if profile_id is None:
+        profile_id = profile_cache.get(("user", user_id))
+        if profile_id is None:
+            return None
+    return profile_cache.get(("profile", profile_id))
+
+
+def cache_profile(payload: dict, generation: Optional[int] = None) -> CachedProfile:
+    """
+    Validate and serialize a full profile payload once, and cache it.
+    
+    With the cache generation read before loading the payload, it is not
+    stored if an eviction happened meanwhile (it may predate that write).
+    """
+    response = InfluencerProfileResponse.model_validate(payload)
+    entry = CachedProfile(payload=response.model_dump(), body=response.model_dump_json().encode())
+    if generation is None or generation == profile_cache.generation:
+        profile_cache.set(("profile", response.id), entry)
+        profile_cache.set(("user", response.user_id), response.id)
+    return entry
+
+
+def _evict_profiles(profile_ids: Optional[list]) -> None:
+    if profile_ids is None:
+        profile_cache.clear()
+        return
+    for profile_id in profile_ids:
+        entry = profile_cache.get(("profile", profile_id))
+        if entry is not None:
+            profile_cache.invalidate(("user", entry.payload["user_id"]))
+        profile_cache.invalidate(("profile", profile_id))
+
+
+def _evict_profile_owners(user_ids: Optional[list]) -> None:
+    if user_ids is None:
+        profile_cache.clear()
+        return
+    for user_id in user_ids:
+        profile_id = profile_cache.get(("user", user_id))
+        if profile_id is not None:
+            profile_cache.invalidate(("profile", profile_id))
+        profile_cache.invalidate(("user", user_id))
+
+
+invalidation_bus.subscribe("profile", _evict_profiles)
+invalidation_bus.subscribe("profile_user", _evict_profile_owners)
+
+
+def invalidate_profile(
+    profile_id: Optional[int] = None,
+    user_id: Optional[int] = None,
+    db: Optional[AsyncSession] = None
+) -> None:
+    """
+    Drop a cached profile after a write, by profile id and/or owner id, on
+    every worker. With db the eviction waits until that session commits.
+    """
+    for entity, key in (("profile", profile_id), ("profile_user", user_id)):
+        if key is None:
+            continue
+        if db is not None:
+            invalidate_after_commit(db, entity, key)
+        else:
+            invalidation_bus.publish(entity, key)
+
+
+def invalidate_profiles(profile_ids: Iterable[int]) -> None:
+    """Drop cached profiles on every worker (after the write committed)."""
+    invalidation_bus.publish("profile", *profile_ids)
@@ -0,0 +1,167 @@
+"""
+Buffered profile view tracking.
+
+GET /profiles/{id} only bumps an in-memory counter keyed by
+(profile_id, viewer_role, hour). A background task swaps the buffer out
+every PROFILE_VIEWS_FLUSH_SECONDS (or earlier once PROFILE_VIEWS_MAX_KEYS
+counters are pending) and adds it to profile_view_counters with one bulk
+upsert, so a crash loses at most one flush interval of views. Shutdown
+flushes what is left.
+"""
+import asyncio
+import logging
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.user import UserRole
+from app.repositories.profile_view_repository import ProfileViewRepository
+from app.schemas.profile_schemas import ProfileViewDay, ProfileViewStats
+
+logger = logging.getLogger(__name__)
+
+ViewKey = tuple[int, UserRole, datetime]
+
+
+def hour_start(moment: datetime) -> datetime:
+    return moment.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+class ProfileViewBuffer:
+    """Aggregates profile views in memory and flushes them periodically."""
+    
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        flush_seconds: Optional[int] = None,
+        max_keys: Optional[int] = None
+    ):
+        self.session_factory = session_factory
+        self.flush_seconds = flush_seconds or settings.PROFILE_VIEWS_FLUSH_SECONDS
+        self.max_keys = max_keys or settings.PROFILE_VIEWS_MAX_KEYS
+        self._counts: Counter = Counter()
+        self._task: Optional[asyncio.Task] = None
+        self._flush_requested: Optional[asyncio.Event] = None
+        self._lock: Optional[asyncio.Lock] = None
+    
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+    
+    def record(self, profile_id: int, viewer_role: UserRole, now: Optional[datetime] = None) -> None:
+        """Count one view (no I/O). Ignored while the buffer is not running."""
+        if not self.running:
+            return
+        self._counts[(profile_id, viewer_role, hour_start(now or datetime.now(timezone.utc)))] += 1
+        if len(self._counts) >= self.max_keys:
+            self._flush_requested.set()
+    
+    def pending(self, profile_id: int) -> list[tuple[ViewKey, int]]:
+        """Views of a profile recorded on this node but not flushed yet."""
+        return [(key, views) for key, views in self._counts.items() if key[0] == profile_id]
+    
+    async def flush(self) -> int:
+        """
+        Write buffered counts with one upsert; returns the counters written.
+        
+        On failure the counts are merged back and retried on the next flush.
+        """
+        async with self._lock:
+            counts, self._counts = self._counts, Counter()
+            if not counts:
+                return 0
+            try:
+                async with self.session_factory() as db:
+                    await ProfileViewRepository(db).add_views(counts)
+                    await db.commit()
+            except Exception:
+                self._counts.update(counts)
+                raise
+            return len(counts)
+    
+    async def _run_forever(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            try:
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Profile view flush failed: {e}")
+    
+    def start(self) -> None:
+        """Start buffering views and the periodic flush."""
+        if self._task is None:
+            self._flush_requested = asyncio.Event()
+            self._lock = asyncio.Lock()
+            self._task = asyncio.create_task(self._run_forever())
+    
+    async def stop(self) -> None:
+        """Stop the periodic flush and write what is still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"❌ Final profile view flush failed: {e}")
+
+
+# Process-wide buffer started from app startup when enabled
+profile_view_buffer = ProfileViewBuffer()
+
+
+class ProfileViewService:
+    """Service for reading profile view counters."""
+    
+    def __init__(self, db: AsyncSession, buffer: ProfileViewBuffer = profile_view_buffer):
+        self.view_repo = ProfileViewRepository(db)
+        self.buffer = buffer
+    
+    async def get_stats(self, profile_id: int, days: int = 30) -> ProfileViewStats:
+        """
+        Views per day and viewer role over the last days (today included).
+        
+        Includes views still buffered on this node, so a viewer sees their
+        own views right away.
+        """
+        today = datetime.now(timezone.utc).date()
+        first_day = today - timedelta(days=days - 1)
+        start = datetime(first_day.year, first_day.month, first_day.day, tzinfo=timezone.utc)
+        
+        daily: Counter = Counter()
+        by_role: Counter = Counter()
+        for day, viewer_role, views in await self.view_repo.get_daily_views(
+            profile_id, start, start + timedelta(days=days)
+        ):
+            # SQLite returns the bucket as text
+            if isinstance(day, str):
+                day = datetime.fromisoformat(day)
+            daily[day.date()] += views
+            by_role[viewer_role] += views
+        for (_, viewer_role, hour), views in self.buffer.pending(profile_id):
+            if hour >= start:
+                daily[hour.date()] += views
+                by_role[viewer_role] += views
+        
+        return ProfileViewStats(
+            profile_id=profile_id,
+            days=days,
+            total_views=sum(by_role.values()),
+            views_by_role={role.value: by_role[role] for role in UserRole},
+            daily=[
+                ProfileViewDay(day=day, views=daily[day])
+                for day in (first_day + timedelta(days=offset) for offset in range(days))
+            ],
+        )
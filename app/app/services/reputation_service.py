@@ -0,0 +1,81 @@
+"""
+Reputation service reconciling influencer running aggregates with campaigns.
+
+Completions and ratings update InfluencerProfile counters incrementally (see
+CampaignService). This batch job recomputes them from the campaigns table so
+any drift (manual edits, failed writes, imported data) is corrected.
+"""
+from sqlalchemy import select, update, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.campaign import Campaign, CampaignStatus
+from app.models.profile import InfluencerProfile
+
+
+class ReputationService:
+    """Service for recomputing influencer reputation stats in batches."""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def reconcile_batch(self, first_id: int, last_id: int) -> int:
+        """
+        Recompute the stats of profiles with first_id <= id <= last_id.
+        
+        A single set-based UPDATE with correlated aggregates over the
+        campaigns of each profile's user; returns the number of rows touched.
+        """
+        own_campaigns = Campaign.influencer_id == InfluencerProfile.user_id
+        completed = (
+            select(func.count(Campaign.id))
+            .where(own_campaigns, Campaign.status == CampaignStatus.FINALIZADA)
+            .scalar_subquery()
+        )
+        rating_sum = (
+            select(func.coalesce(func.sum(Campaign.empresa_rating), 0))
+            .where(own_campaigns)
+            .scalar_subquery()
+        )
+        rating_count = (
+            select(func.count(Campaign.empresa_rating))
+            .where(own_campaigns)
+            .scalar_subquery()
+        )
+        average = (
+            select(func.avg(Campaign.empresa_rating * 1.0))
+            .where(own_campaigns)
+            .scalar_subquery()
+        )
+        
+        result = await self.db.execute(
+            update(InfluencerProfile)
+            .where(InfluencerProfile.id.between(first_id, last_id))
+            .values(
+                total_campaigns_completed=completed,
+                rating_sum=rating_sum,
+                rating_count=rating_count,
+                average_rating=average
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+    
+    async def reconcile_all(self, batch_size: int = 1000) -> int:
+        """
+        Reconcile every profile, committing one id range at a time.
+        
+        Short transactions keep row locks brief while the API keeps running.
+        """
+        bounds = await self.db.execute(
+            select(func.min(InfluencerProfile.id), func.max(InfluencerProfile.id))
+        )
+        first_id, last_id = bounds.one()
+        if first_id is None:
+            return 0
+        
+        total = 0
+        for start in range(first_id, last_id + 1, batch_size):
+            total += await self.reconcile_batch(start, start + batch_size - 1)
+            await self.db.commit()
+        
+        return total
@@ -0,0 +1,162 @@
+"""
+TikTok API client shared by the insights refresher.
+
+One pooled httpx.AsyncClient is reused for every call. Requests are paced by
+a token bucket sized to the app's quota and retried with exponential backoff
+(honoring Retry-After) on throttling, server errors and transport failures.
+"""
+import asyncio
+import logging
+import random
+import time
+from typing import Optional
+
+import httpx
+
+from app.core.config import settings
+from app.core.rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PATH = "/v2/oauth/token/"
+USER_INFO_PATH = "/v2/research/user/info/"
+USER_INFO_FIELDS = "display_name,follower_count,following_count,likes_count,video_count"
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 30.0
+
+
+class TikTokAPIError(Exception):
+    """Raised when the TikTok API keeps failing after retries."""
+
+
+class TikTokClient:
+    """
+    Async client for the TikTok Research API (client-credentials auth).
+    
+    Use as an async context manager, or call close() when done.
+    """
+    
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        client_key: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        max_concurrency: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        concurrency = max_concurrency or settings.TIKTOK_MAX_CONCURRENCY
+        self.client_key = client_key or settings.TIKTOK_CLIENT_KEY
+        self.client_secret = client_secret or settings.TIKTOK_CLIENT_SECRET
+        self.max_retries = settings.TIKTOK_MAX_RETRIES if max_retries is None else max_retries
+        self.rate_limiter = rate_limiter or TokenBucket(
+            settings.TIKTOK_RATE_LIMIT_PER_SECOND,
+            settings.TIKTOK_RATE_LIMIT_BURST
+        )
+        self.http = httpx.AsyncClient(
+            base_url=base_url or settings.TIKTOK_API_BASE_URL,
+            timeout=settings.TIKTOK_REQUEST_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=concurrency,
+                max_keepalive_connections=concurrency
+            ),
+            transport=transport
+        )
+        self._access_token: Optional[str] = None
+        self._token_expires_at = 0.0
+        self._token_lock = asyncio.Lock()
+    
+    async def __aenter__(self) -> "TikTokClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    async def close(self) -> None:
+        await self.http.aclose()
+    
+    async def _get_access_token(self, force: bool = False) -> str:
+        """Client-credentials token, cached until shortly before it expires."""
+        async with self._token_lock:
+            if not force and self._access_token and time.monotonic() < self._token_expires_at:
+                return self._access_token
+            
+            response = await self._send(
+                "POST",
+                TOKEN_PATH,
+                data={
+                    "client_key": self.client_key,
+                    "client_secret": self.client_secret,
+                    "grant_type": "client_credentials",
+                }
+            )
+            payload = response.json()
+            self._access_token = payload["access_token"]
+            self._token_expires_at = time.monotonic() + payload.get("expires_in", 7200) - 60
+            return self._access_token
+    
+    async def _send(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """Rate-limited request with exponential backoff on retryable failures."""
+        for attempt in range(self.max_retries + 1):
+            await self.rate_limiter.acquire()
+            try:
+                response = await self.http.request(method, path, **kwargs)
+            except httpx.TransportError as e:
+                if attempt == self.max_retries:
+                    raise TikTokAPIError(f"{method} {path} failed: {e}") from e
+                delay = None
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    return response
+                if attempt == self.max_retries:
+                    raise TikTokAPIError(f"{method} {path} returned {response.status_code}")
+                retry_after = response.headers.get("Retry-After")
+                delay = float(retry_after) if retry_after and retry_after.isdigit() else None
+            
+            if delay is None:
+                # Full jitter keeps concurrent workers from retrying in lockstep
+                delay = random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt))
+            logger.warning(f"TikTok API retry {attempt + 1} for {path} in {delay:.2f}s")
+            await asyncio.sleep(delay)
+        
+        raise TikTokAPIError(f"{method} {path} failed")
+    
+    async def get_user_info(self, username: str) -> Optional[dict]:
+        """
+        Public stats of one account, or None if it does not exist.
+        
+        Returned keys follow the insights JSON shape (followers, following,
+        total_likes, total_videos) so they map onto insight snapshots.
+        """
+        token = await self._get_access_token()
+        for attempt in range(2):
+            response = await self._send(
+                "POST",
+                USER_INFO_PATH,
+                params={"fields": USER_INFO_FIELDS},
+                json={"username": username.lstrip("@")},
+                headers={"Authorization": f"Bearer {token}"}
+            )
+            if response.status_code == 401 and attempt == 0:
+                token = await self._get_access_token(force=True)
+                continue
+            break
+        
+        if response.status_code in (400, 404):
+            return None
+        if response.status_code != 200:
+            raise TikTokAPIError(f"user info for {username} returned {response.status_code}")
+        
+        data = response.json().get("data") or {}
+        if not data:
+            return None
+        
+        return {
+            "followers": data.get("follower_count"),
+            "following": data.get("following_count"),
+            "total_likes": data.get("likes_count"),
+            "total_videos": data.get("video_count"),
+        }
@@ -0,0 +1,157 @@
+"""
+Background refresher pulling TikTok stats for every linked tiktok_handle.
+
+Profiles are walked in id-ordered batches. For each batch the handles are
+read with a short-lived session, fetched concurrently through the shared
+TikTokClient (paced by its token bucket and capped by a semaphore), and the
+results are written back in one transaction: one snapshot per profile plus
+a bulk UPDATE of tiktok_followers. No database connection is held while
+waiting on the API, so request handling never competes with the worker.
+
+Run it on a single instance (TIKTOK_REFRESH_ENABLED) or via
+scripts/refresh_tiktok_insights.py.
+"""
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Callable, Optional
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.profile import InfluencerProfile
+from app.services.influencer_index import influencer_index
+from app.services.insights_service import snapshot_from_insights
+from app.services.profile_cache import invalidate_profiles
+from app.services.tiktok_client import TikTokClient, TikTokAPIError
+
+logger = logging.getLogger(__name__)
+
+
+class TikTokInsightsRefresher:
+    """Batched, rate-limited TikTok insights ingestion."""
+    
+    def __init__(
+        self,
+        client_factory: Callable[[], TikTokClient] = TikTokClient,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None
+    ):
+        self.client_factory = client_factory
+        self.session_factory = session_factory
+        self.batch_size = batch_size or settings.TIKTOK_REFRESH_BATCH_SIZE
+        self.max_concurrency = max_concurrency or settings.TIKTOK_MAX_CONCURRENCY
+        self._task: Optional[asyncio.Task] = None
+    
+    async def _load_batch(self, after_id: int) -> list[tuple[int, str]]:
+        """Next (profile_id, handle) pairs after after_id (keyset pagination)."""
+        async with self.session_factory() as db:
+            result = await db.execute(
+                select(InfluencerProfile.id, InfluencerProfile.tiktok_handle)
+                .where(
+                    InfluencerProfile.id > after_id,
+                    InfluencerProfile.tiktok_handle.is_not(None),
+                    InfluencerProfile.tiktok_handle != ""
+                )
+                .order_by(InfluencerProfile.id)
+                .limit(self.batch_size)
+            )
+            return [(row.id, row.tiktok_handle) for row in result]
+    
+    async def _fetch_batch(
+        self,
+        client: TikTokClient,
+        rows: list[tuple[int, str]]
+    ) -> list[tuple[int, dict]]:
+        """Fetch stats for a batch concurrently; failed handles are skipped."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def fetch(profile_id: int, handle: str) -> Optional[tuple[int, dict]]:
+            async with semaphore:
+                try:
+                    stats = await client.get_user_info(handle)
+                except TikTokAPIError as e:
+                    logger.warning(f"TikTok refresh failed for profile {profile_id}: {e}")
+                    return None
+            return (profile_id, stats) if stats else None
+        
+        results = await asyncio.gather(*(fetch(profile_id, handle) for profile_id, handle in rows))
+        return [result for result in results if result]
+    
+    async def _store_batch(self, results: list[tuple[int, dict]]) -> None:
+        """Write one batch of results in a single transaction."""
+        captured_at = datetime.now(timezone.utc)
+        async with self.session_factory() as db:
+            db.add_all([
+                snapshot_from_insights(profile_id, "tiktok", stats, captured_at)
+                for profile_id, stats in results
+            ])
+            
+            followers = [
+                {"id": profile_id, "tiktok_followers": stats["followers"]}
+                for profile_id, stats in results
+                if stats.get("followers") is not None
+            ]
+            if followers:
+                # ORM bulk UPDATE by primary key (executemany)
+                await db.execute(update(InfluencerProfile), followers)
+            
+            await db.commit()
+        
+        invalidate_profiles(row["id"] for row in followers)
+    
+    async def refresh_all(self) -> dict[str, int]:
+        """Refresh every profile with a TikTok handle once."""
+        stats = {"profiles": 0, "refreshed": 0}
+        after_id = 0
+        
+        async with self.client_factory() as client:
+            while True:
+                rows = await self._load_batch(after_id)
+                if not rows:
+                    break
+                after_id = rows[-1][0]
+                
+                results = await self._fetch_batch(client, rows)
+                if results:
+                    await self._store_batch(results)
+                
+                stats["profiles"] += len(rows)
+                stats["refreshed"] += len(results)
+        
+        if stats["refreshed"]:
+            influencer_index.mark_stale()
+        
+        return stats
+    
+    async def _run_forever(self) -> None:
+        while True:
+            try:
+                stats = await self.refresh_all()
+                logger.info(f"🎵 TikTok insights refreshed: {stats}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ TikTok insights refresh failed: {e}")
+            await asyncio.sleep(settings.TIKTOK_REFRESH_INTERVAL_HOURS * 3600)
+    
+    def start(self) -> None:
+        """Start the periodic background refresh."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run_forever())
+    
+    async def stop(self) -> None:
+        """Cancel the background refresh."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# Process-wide refresher started from app startup when enabled
+tiktok_refresher = TikTokInsightsRefresher()
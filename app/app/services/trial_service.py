@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
 from app.models.user import User, UserRole
 from app.repositories.user_repository import UserRepository
+from app.services.entitlement_service import invalidate_entitlements
 
 
 class TrialService:
@@ -46,12 +47,16 @@ class TrialService:
         if not user.trial_start_time:
             return False
         
+        # Precomputed by the expiry sweeper
+        if user.trial_expired:
+            return False
+        
         # Ensure trial_start_time is timezone-aware (MySQL may return naive datetime)
         trial_start = user.trial_start_time
         if trial_start.tzinfo is None:
             trial_start = trial_start.replace(tzinfo=timezone.utc)
         
-        # Calculate trial expiration
+        # Calculate trial expiration (covers trials that lapsed since the last sweep)
         trial_duration = timedelta(hours=settings.TRIAL_DURATION_HOURS)
         trial_end_time = trial_start + trial_duration
         
@@ -204,4 +209,5 @@ class TrialService:
         """
         user.has_active_subscription = True
         await self.user_repo.update(user)
+        invalidate_entitlements(user.id, db=self.db)
         return user
@@ -0,0 +1,520 @@
+"""
+Synthetic dataset generator for reproducing production-scale load locally.
+
+Generates users (empresas, influencers, admins), influencer profiles with
+TikTok insights, campaigns, messages, notifications and transactions with
+realistic distributions (log-normal audiences, long-tail brand activity,
+popularity-weighted proposals). Columns are generated vectorized with NumPy
+one chunk at a time, so memory stays bounded regardless of the target size.
+
+Loading:
+- PostgreSQL: binary COPY through asyncpg (copy_records_to_table)
+- MySQL: batched multi-row INSERT ... VALUES statements
+
+Usage:
+    python scripts/generate_dataset.py --influencers 1000000 --empresas 100000
+    python scripts/generate_dataset.py --influencers 50000 --campaigns 200000 --seed 7
+
+All generated users share the password printed at the end of the run.
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import JSON, func, insert, select, text
+
+from app.core.database import engine, db_type
+from app.core.security import get_password_hash
+from app.models.campaign import Campaign, CampaignStatus
+from app.models.message import Message
+from app.models.notification import Notification
+from app.models.profile import InfluencerProfile
+from app.models.transaction import Transaction, TransactionStatus, TransactionType
+from app.models.user import User, UserRole
+
+GENERATED_PASSWORD = "password123"
+
+CATEGORIES = np.array([
+    "Moda", "Belleza", "Fitness", "Viajes", "Gastronomía", "Tecnología",
+    "Gaming", "Música", "Lifestyle", "Deportes", "Educación", "Humor",
+    "Mascotas", "Familia", "Finanzas", "Arte",
+])
+# Zipf-like popularity: fashion and beauty dominate, long tail for the rest
+CATEGORY_WEIGHTS = 1.0 / np.arange(1, len(CATEGORIES) + 1) ** 0.8
+CATEGORY_WEIGHTS /= CATEGORY_WEIGHTS.sum()
+
+CAMPAIGN_STATUSES = np.array([s.value for s in (
+    CampaignStatus.PENDIENTE,
+    CampaignStatus.ACTIVA,
+    CampaignStatus.NEGOCIACION,
+    CampaignStatus.RECHAZADA,
+    CampaignStatus.FINALIZADA,
+    CampaignStatus.CANCELADA,
+)])
+CAMPAIGN_STATUS_WEIGHTS = np.array([0.18, 0.14, 0.08, 0.15, 0.40, 0.05])
+
+NOTIFICATION_TYPES = np.array([
+    "CAMPAIGN_PROPOSAL", "CAMPAIGN_ACCEPTED", "CAMPAIGN_REJECTED",
+    "CAMPAIGN_NEGOTIATION", "CAMPAIGN_COMPLETED",
+])
+NOTIFICATION_TYPE_WEIGHTS = np.array([0.40, 0.20, 0.15, 0.10, 0.15])
+
+PAYMENT_METHODS = np.array(["credit_card", "paypal", "bank_transfer"])
+PAYMENT_METHOD_WEIGHTS = np.array([0.70, 0.20, 0.10])
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class IdRange:
+    """Contiguous block of explicit primary keys reserved for one table."""
+
+    def __init__(self, start: int, count: int):
+        self.start = start
+        self.count = count
+
+    @property
+    def stop(self) -> int:
+        return self.start + self.count
+
+    def chunks(self, size: int):
+        for offset in range(0, self.count, size):
+            yield np.arange(self.start + offset, min(self.start + offset + size, self.stop))
+
+
+def to_datetimes(epoch_us: np.ndarray, aware: bool = True) -> list[datetime]:
+    """Convert an array of epoch microseconds into datetime objects."""
+    base = EPOCH if aware else EPOCH.replace(tzinfo=None)
+    return [base + timedelta(microseconds=us) for us in epoch_us.tolist()]
+
+
+def random_timestamps(rng: np.random.Generator, n: int, days_back: int, now_us: int) -> np.ndarray:
+    """Timestamps skewed toward the present (platform growth)."""
+    # Beta(2, 1) puts more mass near "now" like a growing user base
+    fraction = rng.beta(2.0, 1.0, size=n)
+    span_us = days_back * 86_400 * 1_000_000
+    return (now_us - span_us + fraction * span_us).astype(np.int64)
+
+
+# ============================================
+# GENERATORS (one chunk of rows at a time)
+# ============================================
+
+def generate_users(rng, ids, role: UserRole, hashed_password: str, now_us: int) -> dict:
+    n = len(ids)
+    created = random_timestamps(rng, n, 730, now_us)
+    prefix = role.value.lower()
+    columns = {
+        "id": ids.tolist(),
+        "email": [f"{prefix}{i}@generated.test" for i in ids.tolist()],
+        "hashed_password": [hashed_password] * n,
+        "full_name": [f"{role.value.title()} {i}" for i in ids.tolist()],
+        "role": [role.value] * n,
+        "is_active": (rng.random(n) > 0.02).tolist(),
+        "created_at": to_datetimes(created),
+        "updated_at": to_datetimes(created),
+    }
+    if role == UserRole.EMPRESA:
+        columns["is_approved"] = [True] * n
+        columns["has_active_subscription"] = (rng.random(n) < 0.35).tolist()
+        columns["trial_start_time"] = to_datetimes(created)
+    elif role == UserRole.INFLUENCER:
+        columns["is_approved"] = (rng.random(n) < 0.9).tolist()
+        columns["has_active_subscription"] = [False] * n
+        columns["trial_start_time"] = [None] * n
+    else:
+        columns["is_approved"] = [True] * n
+        columns["has_active_subscription"] = [False] * n
+        columns["trial_start_time"] = [None] * n
+    return columns
+
+
+def generate_profiles(rng, ids, user_ids, now_us: int) -> dict:
+    n = len(ids)
+    # Audience sizes are log-normal: most influencers are micro, few are mega
+    # (clipped to fit the INTEGER columns)
+    instagram = np.clip(np.rint(rng.lognormal(mean=9.0, sigma=1.6, size=n)), 100, 2e9).astype(np.int64)
+    tiktok = np.clip(np.rint(instagram * rng.lognormal(mean=0.0, sigma=0.8, size=n)), 0, 2e9).astype(np.int64)
+    youtube = np.clip(np.rint(instagram * rng.lognormal(mean=-1.5, sigma=1.0, size=n)), 0, 2e9).astype(np.int64)
+    has_tiktok = rng.random(n) < 0.75
+    has_youtube = rng.random(n) < 0.35
+
+    # Engagement decays with audience size
+    engagement = np.clip(
+        12.0 * (instagram / 1_000.0) ** -0.25 * rng.lognormal(0.0, 0.3, size=n), 0.3, 25.0
+    )
+    rate_per_post = np.round(15.0 * (instagram / 1_000.0) ** 0.85 * rng.lognormal(0.0, 0.35, size=n), 2)
+    rate_per_story = np.round(rate_per_post * rng.uniform(0.3, 0.6, size=n), 2)
+    rate_per_video = np.round(rate_per_post * rng.uniform(1.2, 2.5, size=n), 2)
+
+    category_count = rng.integers(1, 4, size=n)
+    category_picks = rng.choice(len(CATEGORIES), size=(n, 3), p=CATEGORY_WEIGHTS)
+
+    avg_views = np.rint(tiktok * rng.uniform(0.5, 2.0, size=n)).astype(np.int64)
+    tiktok_engagement = np.round(rng.uniform(5.0, 15.0, size=n), 2)
+    avg_likes = np.rint(avg_views * tiktok_engagement / 100).astype(np.int64)
+    total_videos = rng.integers(20, 400, size=n)
+
+    created = random_timestamps(rng, n, 700, now_us)
+
+    categories = []
+    insights = []
+    rows = zip(
+        category_count.tolist(), category_picks.tolist(), has_tiktok.tolist(), tiktok.tolist(),
+        avg_views.tolist(), avg_likes.tolist(), total_videos.tolist(), tiktok_engagement.tolist(),
+    )
+    for count, picks, linked, followers, views, likes, videos, rate in rows:
+        categories.append(list(dict.fromkeys(CATEGORIES[picks[:count]].tolist())))
+        insights.append({
+            "followers": followers,
+            "total_videos": videos,
+            "avg_views": views,
+            "avg_likes": likes,
+            "avg_comments": likes // 20,
+            "avg_shares": likes // 12,
+            "engagement_rate": rate,
+            "total_likes": likes * videos,
+        } if linked else None)
+
+    id_list = ids.tolist()
+    return {
+        "id": id_list,
+        "user_id": user_ids.tolist(),
+        "bio": [f"Creador de contenido #{i}" for i in id_list],
+        "profile_picture_url": [f"https://picsum.photos/seed/{i}/200" for i in id_list],
+        "instagram_handle": [f"@ig_{i}" for i in id_list],
+        "instagram_followers": instagram.tolist(),
+        "tiktok_handle": [f"@tt_{i}" if linked else None for i, linked in zip(id_list, has_tiktok.tolist())],
+        "tiktok_followers": np.where(has_tiktok, tiktok, 0).tolist(),
+        "youtube_handle": [f"yt_{i}" if linked else None for i, linked in zip(id_list, has_youtube.tolist())],
+        "youtube_subscribers": np.where(has_youtube, youtube, 0).tolist(),
+        "average_engagement_rate": np.round(engagement, 2).tolist(),
+        "tiktok_insights": insights,
+        "suggested_rate_per_post": rate_per_post.tolist(),
+        "suggested_rate_per_story": rate_per_story.tolist(),
+        "suggested_rate_per_video": rate_per_video.tolist(),
+        "categories": categories,
+        "portfolio_items": [None] * n,
+        "total_campaigns_completed": [0] * n,
+        "average_rating": [None] * n,
+        "created_at": to_datetimes(created),
+        "updated_at": to_datetimes(created),
+    }
+
+
+def generate_campaigns(rng, ids, empresas: IdRange, influencers: IdRange,
+                       empresa_weights, influencer_weights, now_us: int) -> dict:
+    n = len(ids)
+    empresa_ids = empresas.start + rng.choice(empresas.count, size=n, p=empresa_weights)
+    influencer_ids = influencers.start + rng.choice(influencers.count, size=n, p=influencer_weights)
+    statuses = rng.choice(CAMPAIGN_STATUSES, size=n, p=CAMPAIGN_STATUS_WEIGHTS)
+
+    proposed = np.round(rng.lognormal(mean=6.0, sigma=1.0, size=n), 2)
+    negotiated = np.isin(statuses, ["ACTIVA", "NEGOCIACION", "FINALIZADA"])
+    final = np.round(proposed * rng.uniform(0.9, 1.4, size=n), 2)
+
+    created = random_timestamps(rng, n, 540, now_us)
+    updated = np.minimum(created + rng.exponential(3 * 86_400e6, size=n).astype(np.int64), now_us)
+    start = created + rng.integers(1, 15, size=n) * 86_400_000_000
+    end = start + rng.integers(7, 60, size=n) * 86_400_000_000
+
+    finished = statuses == "FINALIZADA"
+    rated = finished & (rng.random(n) < 0.7)
+    # Ratings skew positive, as on most marketplaces
+    ratings = rng.choice(np.arange(1, 6), size=(n, 2), p=[0.03, 0.05, 0.12, 0.35, 0.45])
+
+    id_list = ids.tolist()
+    start_dt = to_datetimes(start)
+    end_dt = to_datetimes(end)
+    return {
+        "id": id_list,
+        "empresa_id": empresa_ids.tolist(),
+        "influencer_id": influencer_ids.tolist(),
+        "title": [f"Campaña generada {i}" for i in id_list],
+        "description": [f"Descripción de la campaña generada {i}" for i in id_list],
+        "briefing": [None] * n,
+        "proposed_budget": proposed.tolist(),
+        "final_budget": [f if keep else None for f, keep in zip(final.tolist(), negotiated.tolist())],
+        "status": statuses.tolist(),
+        "deliverables": [None] * n,
+        "start_date": start_dt,
+        "end_date": end_dt,
+        "empresa_rating": [r if keep else None for r, keep in zip(ratings[:, 0].tolist(), rated.tolist())],
+        "empresa_review": [None] * n,
+        "influencer_rating": [r if keep else None for r, keep in zip(ratings[:, 1].tolist(), rated.tolist())],
+        "influencer_review": [None] * n,
+        "created_at": to_datetimes(created),
+        "updated_at": to_datetimes(updated),
+        # Kept for dependent generators, not loaded
+        "_created_us": created,
+        "_statuses": statuses,
+        "_final": np.where(negotiated, final, proposed),
+    }
+
+
+def generate_messages(rng, first_id: int, campaigns: dict, now_us: int) -> dict:
+    statuses = campaigns["_statuses"]
+    active = np.isin(statuses, ["ACTIVA", "NEGOCIACION", "FINALIZADA"])
+    counts = rng.poisson(np.where(active, 6.0, 0.5))
+    total = int(counts.sum())
+
+    campaign_ids = np.repeat(np.asarray(campaigns["id"]), counts)
+    empresa_ids = np.repeat(np.asarray(campaigns["empresa_id"]), counts)
+    influencer_ids = np.repeat(np.asarray(campaigns["influencer_id"]), counts)
+    base = np.repeat(campaigns["_created_us"], counts)
+
+    from_empresa = rng.random(total) < 0.5
+    sender = np.where(from_empresa, empresa_ids, influencer_ids)
+    receiver = np.where(from_empresa, influencer_ids, empresa_ids)
+    created = np.minimum(base + rng.exponential(2 * 86_400e6, size=total).astype(np.int64), now_us)
+    is_read = rng.random(total) < 0.85
+    created_dt = to_datetimes(created)
+
+    ids = np.arange(first_id, first_id + total)
+    return {
+        "id": ids.tolist(),
+        "campaign_id": campaign_ids.tolist(),
+        "sender_id": sender.tolist(),
+        "receiver_id": receiver.tolist(),
+        "content": [f"Mensaje {i}" for i in ids.tolist()],
+        "attachment_url": [None] * total,
+        "is_read": is_read.tolist(),
+        "created_at": created_dt,
+        "read_at": [dt if read else None for dt, read in zip(created_dt, is_read.tolist())],
+    }
+
+
+def generate_notifications(rng, ids, users: IdRange, now_us: int) -> dict:
+    n = len(ids)
+    user_ids = users.start + rng.integers(0, users.count, size=n)
+    types = rng.choice(NOTIFICATION_TYPES, size=n, p=NOTIFICATION_TYPE_WEIGHTS)
+    created = random_timestamps(rng, n, 365, now_us)
+    is_read = rng.random(n) < 0.7
+    created_dt = to_datetimes(created)
+    return {
+        "id": ids.tolist(),
+        "user_id": user_ids.tolist(),
+        "title": [t.replace("_", " ").title() for t in types.tolist()],
+        "message": [f"Notificación generada {i}" for i in ids.tolist()],
+        "notification_type": types.tolist(),
+        "related_entity_type": ["campaign"] * n,
+        "related_entity_id": [None] * n,
+        "is_read": is_read.tolist(),
+        "created_at": created_dt,
+        "read_at": [dt if read else None for dt, read in zip(created_dt, is_read.tolist())],
+    }
+
+
+def generate_transactions(rng, ids, empresas: IdRange, now_us: int) -> dict:
+    n = len(ids)
+    user_ids = empresas.start + rng.integers(0, empresas.count, size=n)
+    is_subscription = rng.random(n) < 0.6
+    amounts = np.where(
+        is_subscription,
+        rng.choice([49.99, 99.99, 149.99], size=n, p=[0.3, 0.5, 0.2]),
+        np.round(rng.lognormal(6.0, 1.0, size=n), 2),
+    )
+    # SQLAlchemy persists Python enums by member name
+    statuses = rng.choice(
+        np.array([s.name for s in TransactionStatus]), size=n, p=[0.08, 0.85, 0.05, 0.02]
+    )
+    created = random_timestamps(rng, n, 730, now_us)
+    created_dt = to_datetimes(created, aware=False)
+    return {
+        "id": ids.tolist(),
+        "user_id": user_ids.tolist(),
+        "amount": amounts.tolist(),
+        "type": np.where(
+            is_subscription, TransactionType.SUBSCRIPTION.name, TransactionType.CAMPAIGN.name
+        ).tolist(),
+        "status": statuses.tolist(),
+        "description": np.where(
+            is_subscription, "Suscripción mensual", "Pago de campaña"
+        ).tolist(),
+        "payment_method": rng.choice(PAYMENT_METHODS, size=n, p=PAYMENT_METHOD_WEIGHTS).tolist(),
+        "transaction_reference": [f"GEN-{i}" for i in ids.tolist()],
+        "created_at": created_dt,
+        "updated_at": created_dt,
+    }
+
+
+# ============================================
+# LOADERS
+# ============================================
+
+class BulkLoader:
+    """Writes column dictionaries using the fastest path for the active database."""
+
+    # MySQL max_allowed_packet defaults to 64MB; keep statements comfortably below
+    MYSQL_ROWS_PER_STATEMENT = 1000
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    async def load(self, model, columns: dict) -> int:
+        names = [name for name in columns if not name.startswith("_")]
+        if not names:
+            return 0
+        row_count = len(columns[names[0]])
+        if row_count == 0:
+            return 0
+
+        if db_type == "postgresql":
+            await self._copy(model, names, columns)
+        else:
+            await self._multi_row_insert(model, names, columns, row_count)
+        return row_count
+
+    async def _copy(self, model, names: list[str], columns: dict) -> None:
+        table = model.__table__
+        values = []
+        for name in names:
+            column_values = columns[name]
+            if isinstance(table.c[name].type, JSON):
+                # asyncpg expects serialized text for json columns
+                column_values = [None if v is None else json.dumps(v) for v in column_values]
+            values.append(column_values)
+
+        raw = await self.connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            table.name,
+            records=zip(*values),
+            columns=names,
+        )
+
+    async def _multi_row_insert(self, model, names: list[str], columns: dict, row_count: int) -> None:
+        step = self.MYSQL_ROWS_PER_STATEMENT
+        for offset in range(0, row_count, step):
+            rows = [
+                {name: columns[name][i] for name in names}
+                for i in range(offset, min(offset + step, row_count))
+            ]
+            await self.connection.execute(insert(model.__table__).values(rows))
+
+
+async def next_id(connection, model) -> int:
+    result = await connection.execute(select(func.coalesce(func.max(model.id), 0)))
+    return int(result.scalar()) + 1
+
+
+async def reset_sequences(connection) -> None:
+    """Move PostgreSQL serial sequences past explicitly inserted ids."""
+    if db_type != "postgresql":
+        return
+    for model in (User, InfluencerProfile, Campaign, Message, Notification, Transaction):
+        table = model.__tablename__
+        await connection.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+            f"(SELECT COALESCE(MAX(id), 1) FROM {table}))"
+        ))
+
+
+async def generate_dataset(args) -> None:
+    rng = np.random.default_rng(args.seed)
+    now_us = int(datetime.now(timezone.utc).timestamp() * 1_000_000)
+    hashed_password = get_password_hash(GENERATED_PASSWORD)
+    totals: dict[str, int] = {}
+
+    async with engine.begin() as connection:
+        loader = BulkLoader(connection)
+        started = time.perf_counter()
+
+        # Users: reserve contiguous id blocks so foreign keys need no lookups
+        first_user_id = await next_id(connection, User)
+        empresas = IdRange(first_user_id, args.empresas)
+        influencers = IdRange(empresas.stop, args.influencers)
+        admins = IdRange(influencers.stop, args.admins)
+        all_users = IdRange(first_user_id, empresas.count + influencers.count + admins.count)
+
+        for role, id_range in (
+            (UserRole.EMPRESA, empresas),
+            (UserRole.INFLUENCER, influencers),
+            (UserRole.ADMIN, admins),
+        ):
+            for ids in id_range.chunks(args.batch_size):
+                rows = generate_users(rng, ids, role, hashed_password, now_us)
+                totals["users"] = totals.get("users", 0) + await loader.load(User, rows)
+        print(f"   👤 {totals.get('users', 0):,} users")
+
+        # Profiles: exactly one per influencer
+        first_profile_id = await next_id(connection, InfluencerProfile)
+        profiles = IdRange(first_profile_id, influencers.count)
+        for ids in profiles.chunks(args.batch_size):
+            user_ids = influencers.start + (ids - profiles.start)
+            rows = generate_profiles(rng, ids, user_ids, now_us)
+            totals["profiles"] = totals.get("profiles", 0) + await loader.load(InfluencerProfile, rows)
+        print(f"   📸 {totals.get('profiles', 0):,} influencer profiles")
+
+        # Campaigns: long-tail brand activity, proposals skewed toward popular influencers
+        if args.campaigns and empresas.count and influencers.count:
+            empresa_weights = rng.pareto(1.5, size=empresas.count) + 1.0
+            empresa_weights /= empresa_weights.sum()
+            influencer_weights = rng.lognormal(0.0, 1.2, size=influencers.count)
+            influencer_weights /= influencer_weights.sum()
+
+            first_campaign_id = await next_id(connection, Campaign)
+            next_message_id = await next_id(connection, Message)
+            for ids in IdRange(first_campaign_id, args.campaigns).chunks(args.batch_size):
+                rows = generate_campaigns(
+                    rng, ids, empresas, influencers, empresa_weights, influencer_weights, now_us
+                )
+                totals["campaigns"] = totals.get("campaigns", 0) + await loader.load(Campaign, rows)
+
+                messages = generate_messages(rng, next_message_id, rows, now_us)
+                next_message_id += len(messages["id"])
+                totals["messages"] = totals.get("messages", 0) + await loader.load(Message, messages)
+            print(f"   📣 {totals.get('campaigns', 0):,} campaigns")
+            print(f"   💬 {totals.get('messages', 0):,} messages")
+
+        if args.notifications and all_users.count:
+            first_notification_id = await next_id(connection, Notification)
+            for ids in IdRange(first_notification_id, args.notifications).chunks(args.batch_size):
+                rows = generate_notifications(rng, ids, all_users, now_us)
+                totals["notifications"] = (
+                    totals.get("notifications", 0) + await loader.load(Notification, rows)
+                )
+            print(f"   🔔 {totals.get('notifications', 0):,} notifications")
+
+        if args.transactions and empresas.count:
+            first_transaction_id = await next_id(connection, Transaction)
+            for ids in IdRange(first_transaction_id, args.transactions).chunks(args.batch_size):
+                rows = generate_transactions(rng, ids, empresas, now_us)
+                totals["transactions"] = (
+                    totals.get("transactions", 0) + await loader.load(Transaction, rows)
+                )
+            print(f"   💳 {totals.get('transactions', 0):,} transactions")
+
+        await reset_sequences(connection)
+        elapsed = time.perf_counter() - started
+
+    rows_total = sum(totals.values())
+    print(f"\n✅ Loaded {rows_total:,} rows in {elapsed:.1f}s ({rows_total / max(elapsed, 1e-9):,.0f} rows/s)")
+    print(f"   Password for all generated users: {GENERATED_PASSWORD}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic production-scale dataset.")
+    parser.add_argument("--influencers", type=int, default=100_000)
+    parser.add_argument("--empresas", type=int, default=10_000)
+    parser.add_argument("--admins", type=int, default=5)
+    parser.add_argument("--campaigns", type=int, default=500_000)
+    parser.add_argument("--notifications", type=int, default=1_000_000)
+    parser.add_argument("--transactions", type=int, default=200_000)
+    parser.add_argument("--batch-size", type=int, default=50_000, help="Rows generated per chunk")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for reproducible datasets")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    print(f"🚀 Generating synthetic dataset on {db_type}...")
+    asyncio.run(generate_dataset(arguments))
+    print("✅ Done!")
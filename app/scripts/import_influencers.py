@@ -0,0 +1,52 @@
+"""
+Script to bulk import influencer accounts and profiles.
+
+Reads a CSV or NDJSON file (one influencer per row: email, password,
+full_name and the profile fields) and inserts it in batches. Invalid rows
+are skipped and listed at the end.
+
+Usage:
+    python scripts/import_influencers.py roster.csv [--format csv] [--approve]
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.core.database import AsyncSessionLocal
+from app.services.import_service import InfluencerImporter
+
+
+async def import_influencers(path: Path, import_format: str, approve: bool, batch_size: int):
+    """Import the file and print the report."""
+    print(f"🚀 Importing influencers from {path}...")
+    
+    async with AsyncSessionLocal() as db:
+        with open(path, encoding="utf-8-sig", newline="") as lines:
+            report = await InfluencerImporter(db, approve=approve, batch_size=batch_size).run(
+                lines, import_format
+            )
+    
+    for error in report.errors:
+        print(f"   ⚠️  Line {error.line} ({error.email or '-'}): {error.error}")
+    if report.errors_truncated:
+        print("   ⚠️  ... more errors not shown")
+    
+    print(f"\n✅ Imported {report.imported:,} of {report.total_rows:,} rows "
+          f"in {report.elapsed_seconds:.1f}s ({report.failed:,} failed)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk import influencers from CSV/NDJSON.")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--format", choices=["csv", "ndjson"], default=None,
+                        help="File format (default: from the extension)")
+    parser.add_argument("--approve", action="store_true", help="Approve imported influencers")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    arguments = parser.parse_args()
+    
+    import_format = arguments.format or ("csv" if arguments.path.suffix.lower() == ".csv" else "ndjson")
+    asyncio.run(import_influencers(arguments.path, import_format, arguments.approve, arguments.batch_size))
@@ -0,0 +1,44 @@
+"""
+Script to downsample insights snapshots and apply retention.
+
+Rebuilds the daily and weekly rollups touched in the lookback window and
+prunes raw snapshots and daily rollups past their retention. Run it
+periodically (e.g. hourly cron); reruns are idempotent.
+
+Usage:
+    python scripts/maintain_insights.py [--lookback-days 7]
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.core.database import AsyncSessionLocal
+from app.services.insights_service import InsightsService
+
+
+async def maintain_insights(lookback_days: int):
+    """Refresh rollups and prune old insights."""
+    async with AsyncSessionLocal() as db:
+        try:
+            stats = await InsightsService(db).maintain(lookback_days=lookback_days)
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            print(f"❌ Error maintaining insights: {e}")
+            raise
+    
+    for name, count in stats.items():
+        print(f"   📊 {name}: {count}")
+    print("✅ Insights maintenance complete")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Downsample and prune insights history.")
+    parser.add_argument("--lookback-days", type=int, default=7)
+    arguments = parser.parse_args()
+    
+    asyncio.run(maintain_insights(arguments.lookback_days))
@@ -0,0 +1,44 @@
+"""
+Script to reconcile influencer reputation stats with the campaigns table.
+
+Recomputes total_campaigns_completed, rating_sum, rating_count and
+average_rating for every profile in id batches. Safe to run periodically
+(e.g. nightly cron) while the API is serving traffic.
+
+Usage:
+    python scripts/reconcile_reputation.py [--batch-size 1000]
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.core.database import AsyncSessionLocal
+from app.services.reputation_service import ReputationService
+
+
+async def reconcile_reputation(batch_size: int):
+    """Reconcile all influencer profiles."""
+    started = time.perf_counter()
+    
+    async with AsyncSessionLocal() as db:
+        try:
+            updated = await ReputationService(db).reconcile_all(batch_size=batch_size)
+        except Exception as e:
+            await db.rollback()
+            print(f"❌ Error: {e}")
+            raise
+    
+    print(f"✅ Reconciled {updated} profiles in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reconcile influencer reputation stats.")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    arguments = parser.parse_args()
+    
+    asyncio.run(reconcile_reputation(arguments.batch_size))
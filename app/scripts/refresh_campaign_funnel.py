@@ -0,0 +1,49 @@
+"""
+Script to refresh the daily campaign funnel rollup.
+
+Rebuilds the rollup days touched in the lookback window from the campaign
+status events. Run it periodically (e.g. every 15 minutes via cron); reruns
+are idempotent. After deploying the event log, run it once with --backfill
+and a lookback covering the whole history.
+
+Usage:
+    python scripts/refresh_campaign_funnel.py [--lookback-days 1] [--backfill]
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.core.database import AsyncSessionLocal
+from app.services.funnel_service import FunnelService
+
+
+async def refresh_campaign_funnel(lookback_days: int, backfill: bool):
+    """Backfill events if asked, then rebuild recent rollup days."""
+    async with AsyncSessionLocal() as db:
+        try:
+            service = FunnelService(db)
+            if backfill:
+                backfilled = await service.backfill()
+                print(f"   📥 Campaigns backfilled: {backfilled}")
+            written = await service.refresh(lookback_days=lookback_days)
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            print(f"❌ Error refreshing campaign funnel: {e}")
+            raise
+    
+    print(f"   📊 Rollup rows written: {written}")
+    print("✅ Campaign funnel refresh complete")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Refresh the daily campaign funnel rollup.")
+    parser.add_argument("--lookback-days", type=int, default=1)
+    parser.add_argument("--backfill", action="store_true", help="Log campaigns created before the event log")
+    arguments = parser.parse_args()
+    
+    asyncio.run(refresh_campaign_funnel(arguments.lookback_days, arguments.backfill))
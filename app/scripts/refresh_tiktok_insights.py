@@ -0,0 +1,42 @@
+"""
+Script to refresh TikTok insights for every profile with a tiktok_handle.
+
+Runs one full pass of the background refresher. --base-url points it at a
+local stub server for testing.
+
+Usage:
+    python scripts/refresh_tiktok_insights.py [--base-url http://localhost:9000]
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.services.tiktok_client import TikTokClient
+from app.services.tiktok_refresher import TikTokInsightsRefresher
+
+
+async def refresh_tiktok_insights(base_url: str, batch_size: int):
+    """Run one refresh pass."""
+    started = time.perf_counter()
+    refresher = TikTokInsightsRefresher(
+        client_factory=lambda: TikTokClient(base_url=base_url),
+        batch_size=batch_size
+    )
+    stats = await refresher.refresh_all()
+    
+    print(f"✅ Refreshed {stats['refreshed']}/{stats['profiles']} TikTok profiles "
+          f"in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Refresh TikTok insights once.")
+    parser.add_argument("--base-url", default=None, help="TikTok API base URL (default: settings)")
+    parser.add_argument("--batch-size", type=int, default=None)
+    arguments = parser.parse_args()
+    
+    asyncio.run(refresh_tiktok_insights(arguments.base_url, arguments.batch_size))
@@ -0,0 +1,32 @@
+"""
+Script to run one trial/subscription expiry sweep.
+
+Safe to run alongside the API: an advisory lock ensures only one sweep
+runs at a time across all nodes.
+
+Usage:
+    python scripts/sweep_expirations.py
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.services.expiry_sweeper import ExpirySweeper
+
+
+async def sweep_expirations():
+    """Run one sweep."""
+    stats = await ExpirySweeper().sweep()
+    if stats is None:
+        print("⚠️  Another node is already sweeping, skipping.")
+        return
+    
+    print(f"✅ Trials expired: {stats['trials_expired']}")
+    print(f"✅ Subscriptions revoked: {stats['subscriptions_revoked']}")
+
+
+if __name__ == "__main__":
+    asyncio.run(sweep_expirations())
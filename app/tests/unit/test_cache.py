@@ -0,0 +1,34 @@
+"""
+Unit tests for the in-process TTL/LRU cache.
+"""
+import time
+
+import pytest
+
+from app.core.cache import TTLCache
+
+
+@pytest.mark.unit
+class TestTTLCache:
+    """Test suite for per-entry expiry and LRU eviction."""
+    
+    def test_entry_expires_at_its_deadline(self):
+        """Test that an explicit deadline shortens the default TTL."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", 1, expires_at=time.time() - 1)
+        cache.set("b", 2)
+        
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+    
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the cache stays bounded and keeps recently read keys."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert len(cache) == 2
@@ -0,0 +1,29 @@
+"""
+Unit tests for dashboard month windows.
+"""
+from datetime import date, datetime
+
+import pytest
+
+from app.services.dashboard_service import fill_months, month_starts
+
+
+@pytest.mark.unit
+class TestDashboardMonths:
+    """Test suite for monthly dashboard series."""
+
+    def test_month_starts_cross_year_boundary(self):
+        """Test that the window ends at the current month, oldest first."""
+        starts = month_starts(3, today=date(2026, 2, 17))
+
+        assert starts == [date(2025, 12, 1), date(2026, 1, 1), date(2026, 2, 1)]
+
+    def test_missing_months_are_zero(self):
+        """Test that months without rows are filled and text buckets parsed."""
+        starts = month_starts(3, today=date(2026, 2, 17))
+        months = fill_months(starts, [
+            (datetime(2025, 12, 1), 300.0, 2),
+            ("2026-02-01 00:00:00", 50.0, 1),
+        ])
+
+        assert [(m.amount, m.count) for m in months] == [(300.0, 2), (0.0, 0), (50.0, 1)]
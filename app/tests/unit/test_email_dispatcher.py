@@ -0,0 +1,154 @@
+"""
+Unit tests for the pooled email dispatcher with a fake SMTP server.
+"""
+import aiosmtplib
+import pytest
+
+from app.services.email_service import EmailDispatcher, NotificationEmail
+
+
+class FakeSMTP:
+    """In-memory SMTP connection recording sent messages."""
+    
+    def __init__(self, outbox: list, fail_once: set, reject: set = frozenset()):
+        self.outbox = outbox
+        self.fail_once = fail_once
+        self.reject = reject
+        self.is_connected = True
+    
+    async def send_message(self, message):
+        if message["To"] in self.reject:
+            raise aiosmtplib.SMTPDataError(550, "mailbox unavailable")
+        if message["To"] == "crash@example.com":
+            raise ValueError("unexpected")
+        if message["To"] in self.fail_once:
+            self.fail_once.discard(message["To"])
+            self.is_connected = False
+            raise aiosmtplib.SMTPServerDisconnected("connection lost")
+        self.outbox.append(message)
+    
+    async def quit(self):
+        self.is_connected = False
+    
+    def close(self):
+        self.is_connected = False
+
+
+def make_dispatcher(
+    outbox: list,
+    connections: list,
+    fail_once: set,
+    due: list = None,
+    reject: set = frozenset(),
+    emails: dict = None
+) -> EmailDispatcher:
+    async def smtp_factory():
+        smtp = FakeSMTP(outbox, fail_once, reject)
+        connections.append(smtp)
+        return smtp
+    
+    async def loader(notification_ids):
+        return [
+            NotificationEmail(i, (emails or {}).get(i, f"user{i}@example.com"), f"User {i}", "Title", "Body", "TEST")
+            for i in notification_ids
+        ]
+    
+    async def claim_due(limit):
+        claimed, due[:limit] = due[:limit], []
+        return claimed
+    
+    due = [] if due is None else due
+    return EmailDispatcher(
+        pool_size=2,
+        batch_size=25,
+        max_retries=2,
+        smtp_factory=smtp_factory,
+        loader=loader,
+        claim_due=claim_due,
+        retry_base_seconds=0
+    )
+
+
+@pytest.mark.unit
+class TestEmailDispatcher:
+    """Test suite for batched email delivery."""
+    
+    @pytest.mark.asyncio
+    async def test_delivers_all_queued_emails_over_pooled_connections(self):
+        """Test that every queued email is sent while reusing connections."""
+        outbox, connections = [], []
+        dispatcher = make_dispatcher(outbox, connections, set())
+        dispatcher.start()
+        
+        for notification_id in range(200):
+            assert dispatcher.enqueue(notification_id)
+        await dispatcher.stop()
+        
+        assert len(outbox) == 200
+        assert len(connections) <= 2
+    
+    @pytest.mark.asyncio
+    async def test_connection_failures_are_retried(self):
+        """Test that a dropped connection retries unsent emails on a new one."""
+        outbox, connections = [], []
+        dispatcher = make_dispatcher(outbox, connections, {"user3@example.com"})
+        dispatcher.start()
+        
+        for notification_id in range(10):
+            dispatcher.enqueue(notification_id)
+        await dispatcher.stop()
+        
+        assert sorted(message["To"] for message in outbox) == sorted(
+            f"user{i}@example.com" for i in range(10)
+        )
+    
+    @pytest.mark.asyncio
+    async def test_rejected_message_does_not_drop_the_connection(self):
+        """Test that a 5xx for one message neither retries nor reconnects."""
+        outbox, connections = [], []
+        dispatcher = make_dispatcher(outbox, connections, set(), reject={"user3@example.com"})
+        dispatcher.start()
+        
+        for notification_id in range(10):
+            dispatcher.enqueue(notification_id)
+        await dispatcher.stop()
+        
+        assert len(outbox) == 9
+        assert all(smtp.is_connected is False for smtp in connections)  # Closed on stop only
+        assert len(connections) <= 2
+    
+    @pytest.mark.asyncio
+    async def test_unexpected_error_releases_the_connection(self):
+        """Test that a non-SMTP error neither leaks a pool slot nor loses emails."""
+        outbox, connections = [], []
+        dispatcher = make_dispatcher(outbox, connections, set(), emails={0: "crash@example.com"})
+        dispatcher.start()
+        
+        for notification_id in range(10):
+            dispatcher.enqueue(notification_id)
+        await dispatcher._drain()
+        
+        # Every opened connection is back in the pool
+        assert dispatcher.pool._idle.qsize() == dispatcher.pool._opened
+        assert len(outbox) == 9
+        await dispatcher.stop()
+    
+    @pytest.mark.asyncio
+    async def test_due_digest_emails_are_claimed_and_sent(self):
+        """Test that digests persisted as due are picked up in batches."""
+        outbox, connections = [], []
+        due = list(range(120))
+        dispatcher = make_dispatcher(outbox, connections, set(), due=due)
+        dispatcher.start()
+        
+        await dispatcher.queue_due()
+        await dispatcher.stop()
+        
+        assert due == []
+        assert len(outbox) == 120
+    
+    def test_enqueue_is_noop_when_not_started(self):
+        """Test that nothing is queued when email delivery is disabled."""
+        dispatcher = make_dispatcher([], [], set())
+        
+        assert dispatcher.enqueue(1) is False
@@ -0,0 +1,76 @@
+"""
+Unit tests for the stale-while-revalidate explorer cache.
+"""
+import asyncio
+
+import pytest
+
+from app.services.explorer_cache import ExplorerPageCache
+
+
+def counting_loader(calls: list, delay: float = 0.0):
+    async def load() -> bytes:
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return str(len(calls)).encode()
+    return load
+
+
+@pytest.mark.unit
+class TestExplorerPageCache:
+    """Test suite for soft TTL expiry and background refresh."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_page_is_served_without_loading(self):
+        """Test that a page within its soft TTL is not recomputed."""
+        cache = ExplorerPageCache(soft_ttl=60, max_age=600, maxsize=10)
+        calls = []
+        load = counting_loader(calls)
+
+        assert await cache.get("page", load) == b"1"
+        assert await cache.get("page", load) == b"1"
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_page_is_served_while_refreshing(self):
+        """Test that a stale page is returned at once and refreshed once."""
+        cache = ExplorerPageCache(soft_ttl=0, max_age=600, maxsize=10)
+        calls = []
+        load = counting_loader(calls, delay=0.01)
+        await cache.get("page", load)
+
+        stale = await asyncio.gather(*[cache.get("page", load) for _ in range(3)])
+        assert stale == [b"1", b"1", b"1"]
+
+        await asyncio.sleep(0.05)
+        assert len(calls) == 2
+        await cache.stop()
+
+    @pytest.mark.asyncio
+    async def test_mark_stale_triggers_refresh(self):
+        """Test that a profile write makes fresh pages refresh."""
+        cache = ExplorerPageCache(soft_ttl=60, max_age=600, maxsize=10)
+        calls = []
+        load = counting_loader(calls)
+        await cache.get("page", load)
+
+        cache.mark_stale()
+        assert await cache.get("page", load) == b"1"
+        await asyncio.sleep(0.01)
+
+        assert len(calls) == 2
+        assert await cache.get("page", load) == b"2"
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_stale_page(self):
+        """Test that a refresh error does not evict the page."""
+        cache = ExplorerPageCache(soft_ttl=0, max_age=600, maxsize=10)
+        await cache.get("page", counting_loader([]))
+
+        async def failing() -> bytes:
+            raise RuntimeError("db down")
+
+        assert await cache.get("page", failing) == b"1"
+        await asyncio.sleep(0.01)
+        assert await cache.get("page", failing) == b"1"
+        await cache.stop()
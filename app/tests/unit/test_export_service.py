@@ -0,0 +1,30 @@
+"""
+Unit tests for admin export encoding.
+"""
+from datetime import datetime
+
+import pytest
+
+from app.models.user import UserRole
+from app.services.export_service import csv_value, export_value, users_export
+
+
+@pytest.mark.unit
+class TestExportEncoding:
+    """Test suite for export value conversion."""
+
+    def test_values_are_serializable(self):
+        """Test that enums, datetimes, JSON and NULLs are encoded per format."""
+        created = datetime(2026, 1, 2, 3, 4, 5)
+
+        assert export_value(UserRole.ADMIN) == "ADMIN"
+        assert export_value(created) == "2026-01-02T03:04:05"
+        assert csv_value(None) == ""
+        assert csv_value(["Moda", "Belleza"]) == '["Moda", "Belleza"]'
+
+    def test_users_export_never_selects_password(self):
+        """Test that credentials are not part of the users export."""
+        columns = list(users_export().selected_columns.keys())
+
+        assert "hashed_password" not in columns
+        assert columns[0] == "id"
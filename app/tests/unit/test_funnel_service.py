@@ -0,0 +1,38 @@
+"""
+Unit tests for campaign funnel events.
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models.campaign import Campaign, CampaignStatus
+from app.services.funnel_service import latency_bucket, status_event
+
+
+@pytest.mark.unit
+class TestFunnelEvents:
+    """Test suite for status event construction."""
+
+    def test_latency_bands(self):
+        """Test that latencies fall in the expected bands."""
+        assert latency_bucket(0) == 0
+        assert latency_bucket(3600) == 1
+        assert latency_bucket(2 * 86400) == 3
+        assert latency_bucket(90 * 86400) == 6
+
+    def test_event_measures_time_since_proposal(self):
+        """Test that transitions carry their latency and creation does not."""
+        created = datetime(2026, 1, 1, 12, 0)  # Naive, as read from SQLite
+        campaign = Campaign(id=7, created_at=created)
+
+        created_event = status_event(campaign, None, CampaignStatus.PENDIENTE, created)
+        accepted = status_event(
+            campaign,
+            CampaignStatus.PENDIENTE,
+            CampaignStatus.ACTIVA,
+            created.replace(tzinfo=timezone.utc) + timedelta(hours=3)
+        )
+
+        assert created_event.seconds_since_proposal is None
+        assert accepted.seconds_since_proposal == 3 * 3600
+        assert accepted.latency_bucket == 1
@@ -0,0 +1,41 @@
+"""
+Unit tests for bulk import parsing and validation.
+"""
+import pytest
+
+from app.schemas.import_schemas import InfluencerImportRow
+from app.services.import_service import iter_records
+
+
+@pytest.mark.unit
+class TestImportParsing:
+    """Test suite for streamed import records."""
+
+    def test_csv_records_drop_empty_cells(self):
+        """Test that CSV rows keep their line numbers and skip empty values."""
+        lines = [
+            "email,password,full_name,instagram_followers,categories\n",
+            "a@x.com,secret123,Ana,1000,Moda|Belleza\n",
+            "b@x.com,secret123,Bea,,\n",
+        ]
+
+        records = list(iter_records(lines, "csv"))
+
+        assert records[0] == (2, {
+            "email": "a@x.com", "password": "secret123", "full_name": "Ana",
+            "instagram_followers": "1000", "categories": "Moda|Belleza",
+        }, None)
+        assert "instagram_followers" not in records[1][1]
+        row = InfluencerImportRow.model_validate(records[0][1])
+        assert row.categories == ["Moda", "Belleza"]
+        assert row.instagram_followers == 1000
+
+    def test_ndjson_reports_invalid_lines(self):
+        """Test that malformed NDJSON lines become errors, blank lines are skipped."""
+        lines = ['{"email": "a@x.com"}\n', "\n", "{oops\n", "[1]\n"]
+
+        records = list(iter_records(lines, "ndjson"))
+
+        assert [(line, error is None) for line, _, error in records] == [
+            (1, True), (3, False), (4, False)
+        ]
@@ -0,0 +1,105 @@
+"""
+Unit tests for the in-memory influencer index used by recommendations.
+"""
+import pytest
+
+from app.services.influencer_index import InfluencerIndex
+
+
+def make_row(profile_id: int, **overrides) -> dict:
+    row = {
+        "id": profile_id,
+        "user_id": profile_id + 100,
+        "instagram_followers": 10000,
+        "tiktok_followers": 0,
+        "youtube_subscribers": 0,
+        "average_engagement_rate": 5.0,
+        "suggested_rate_per_post": 200.0,
+        "suggested_rate_per_story": 80.0,
+        "suggested_rate_per_video": 400.0,
+        "average_rating": None,
+        "categories": ["Moda"],
+        "is_approved": True,
+        "is_active": True,
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.mark.unit
+class TestInfluencerIndex:
+    """Test suite for vectorized influencer ranking."""
+
+    def test_unapproved_profiles_are_excluded(self):
+        """Test that profiles of unapproved users are never recommended."""
+        index = InfluencerIndex(capacity=2)
+        index.upsert_rows([make_row(1), make_row(2, is_approved=False)])
+
+        ranked = index.recommend()
+
+        assert [profile_id for profile_id, _ in ranked] == [1]
+
+    def test_category_overlap_ranks_first(self):
+        """Test that matching categories outrank otherwise identical profiles."""
+        index = InfluencerIndex()
+        index.upsert_rows([
+            make_row(1, categories=["Gaming"]),
+            make_row(2, categories=["Moda", "Belleza"]),
+        ])
+
+        ranked = index.recommend(categories=["belleza"])
+
+        assert ranked[0][0] == 2
+
+    def test_over_budget_profiles_rank_lower(self):
+        """Test that rates above the budget are penalized."""
+        index = InfluencerIndex()
+        index.upsert_rows([
+            make_row(1, suggested_rate_per_post=5000.0),
+            make_row(2, suggested_rate_per_post=150.0),
+        ])
+
+        ranked = index.recommend(budget=200.0)
+
+        assert ranked[0][0] == 2
+        assert ranked[0][1] > ranked[1][1]
+
+    def test_network_filter_requires_audience(self):
+        """Test that a network filter drops profiles without followers there."""
+        index = InfluencerIndex()
+        index.upsert_rows([make_row(1), make_row(2, tiktok_followers=50000)])
+
+        ranked = index.recommend(network="tiktok")
+
+        assert [profile_id for profile_id, _ in ranked] == [2]
+
+    def test_upsert_updates_existing_row_and_grows(self):
+        """Test that re-upserting overwrites a row and capacity grows on demand."""
+        index = InfluencerIndex(capacity=1)
+        index.upsert_rows([make_row(1), make_row(2), make_row(3)])
+        index.upsert_rows([make_row(1, is_active=False)])
+
+        ranked = index.recommend(limit=10)
+
+        assert index.size == 3
+        assert sorted(profile_id for profile_id, _ in ranked) == [2, 3]
+
+    def test_similar_prefers_matching_mix_and_categories(self):
+        """Test that similar profiles share follower mix and categories."""
+        index = InfluencerIndex()
+        index.upsert_rows([
+            make_row(1, tiktok_followers=90000, instagram_followers=1000, categories=["Gaming"]),
+            make_row(2, tiktok_followers=80000, instagram_followers=2000, categories=["Gaming"]),
+            make_row(3, categories=["Moda"]),
+        ])
+
+        ranked = index.similar(1, limit=2)
+
+        assert [profile_id for profile_id, _ in ranked] == [2, 3]
+        assert ranked[0][1] > ranked[1][1]
+
+    def test_similar_unknown_profile(self):
+        """Test that unknown profiles are reported as missing."""
+        index = InfluencerIndex()
+
+        assert index.similar(42) is None
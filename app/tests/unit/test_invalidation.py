@@ -0,0 +1,60 @@
+"""
+Unit tests for the cache invalidation bus.
+"""
+import asyncio
+
+import pytest
+
+from app.core.invalidation import InvalidationBus, MemoryInvalidationBackend
+
+
+class BrokerBackend(MemoryInvalidationBackend):
+    """Delivers every sent payload to all connected workers, like NOTIFY."""
+
+    def __init__(self, broker: list):
+        self.broker = broker
+
+    async def send(self, payload: str) -> None:
+        for deliver in self.broker:
+            deliver(payload)
+
+
+def start_worker(bus: InvalidationBus, broker: list) -> None:
+    broker.append(bus._deliver)
+    bus._backend = BrokerBackend(broker)
+    bus._outbox = asyncio.Queue()
+    bus._sender = asyncio.ensure_future(bus._send_forever())
+
+
+@pytest.mark.unit
+class TestInvalidationBus:
+    """Test suite for local and cross-worker eviction."""
+
+    def test_publish_without_backend_evicts_locally(self):
+        """Test that a single-process bus evicts its own subscribers."""
+        bus = InvalidationBus()
+        evicted = []
+        bus.subscribe("user", evicted.append)
+
+        bus.publish("user", 1, None, 2)
+        bus.reset()
+
+        assert evicted == [[1, 2], None]
+
+    @pytest.mark.asyncio
+    async def test_other_workers_evict_once(self):
+        """Test that peers evict published ids and the publisher isn't evicted twice."""
+        broker = []
+        workers = [InvalidationBus(), InvalidationBus()]
+        evicted = {0: [], 1: []}
+        for index, bus in enumerate(workers):
+            bus.subscribe("profile", evicted[index].append)
+            start_worker(bus, broker)
+
+        workers[0].publish("profile", 7)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert evicted == {0: [[7]], 1: [[7]]}
+        for bus in workers:
+            await bus.stop()
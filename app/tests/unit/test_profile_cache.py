@@ -0,0 +1,51 @@
+"""
+Unit tests for the profile detail cache.
+"""
+from datetime import datetime, timezone
+
+import pytest
+
+from app.services.profile_cache import (
+    cache_profile,
+    get_cached_profile,
+    invalidate_profile,
+    profile_cache,
+)
+
+
+def profile_payload(profile_id: int, user_id: int) -> dict:
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return {
+        "id": profile_id,
+        "user_id": user_id,
+        "bio": "bio",
+        "total_campaigns_completed": 0,
+        "created_at": now,
+        "updated_at": now,
+        "full_name": "Influencer",
+    }
+
+
+@pytest.mark.unit
+class TestProfileCache:
+    """Test suite for cached profile responses."""
+
+    def setup_method(self):
+        profile_cache.clear()
+
+    def test_cached_by_profile_and_owner(self):
+        """Test that one entry serves both lookups with pre-serialized JSON."""
+        entry = cache_profile(profile_payload(3, 30))
+
+        assert get_cached_profile(profile_id=3) is entry
+        assert get_cached_profile(user_id=30) is entry
+        assert entry.body.startswith(b'{"id":3,"user_id":30')
+
+    def test_invalidation_by_owner_drops_both_keys(self):
+        """Test that invalidating by user id also drops the profile entry."""
+        cache_profile(profile_payload(3, 30))
+
+        invalidate_profile(user_id=30)
+
+        assert get_cached_profile(profile_id=3) is None
+        assert get_cached_profile(user_id=30) is None
@@ -0,0 +1,46 @@
+"""
+Unit tests for the profile view buffer.
+"""
+from datetime import datetime, timezone
+
+import pytest
+
+from app.models.user import UserRole
+from app.services.profile_views import ProfileViewBuffer
+
+
+class FailingSession:
+    async def __aenter__(self):
+        raise ConnectionError("database unavailable")
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+@pytest.mark.unit
+class TestProfileViewBuffer:
+    """Test suite for in-memory view aggregation."""
+
+    @pytest.mark.asyncio
+    async def test_views_aggregate_per_hour_and_survive_failed_flush(self):
+        """Test that views are counted per key and kept when a flush fails."""
+        buffer = ProfileViewBuffer(session_factory=FailingSession, flush_seconds=3600)
+        buffer.start()
+        try:
+            moment = datetime(2026, 5, 1, 10, 42, tzinfo=timezone.utc)
+            buffer.record(7, UserRole.EMPRESA, moment)
+            buffer.record(7, UserRole.EMPRESA, moment.replace(minute=5))
+            buffer.record(7, UserRole.ADMIN, moment)
+
+            hour = moment.replace(minute=0)
+            assert dict(buffer.pending(7)) == {
+                (7, UserRole.EMPRESA, hour): 2,
+                (7, UserRole.ADMIN, hour): 1,
+            }
+
+            with pytest.raises(ConnectionError):
+                await buffer.flush()
+            assert dict(buffer.pending(7))[(7, UserRole.EMPRESA, hour)] == 2
+        finally:
+            buffer._counts.clear()
+            await buffer.stop()
@@ -0,0 +1,87 @@
+"""
+Unit tests for incoming request rate limiting.
+"""
+import pytest
+from fastapi import HTTPException
+
+from app.core import rate_limit
+from app.core.rate_limit import MemoryRateLimitBackend, check_rate_limit
+
+
+@pytest.mark.unit
+class TestRateLimit:
+    """Test suite for token bucket request throttling."""
+
+    @pytest.mark.asyncio
+    async def test_memory_backend_allows_burst_then_rejects(self):
+        """Test that a bucket admits its burst and reports when to retry."""
+        backend = MemoryRateLimitBackend()
+
+        results = [await backend.take("login:a", rate=1.0, capacity=3) for _ in range(4)]
+
+        assert [allowed for allowed, _ in results] == [True, True, True, False]
+        assert 0 < results[-1][1] <= 1.0
+        assert (await backend.take("login:b", rate=1.0, capacity=3))[0] is True
+
+    @pytest.mark.asyncio
+    async def test_check_rate_limit_raises_429(self, monkeypatch):
+        """Test that an exhausted key is rejected with a Retry-After header."""
+        monkeypatch.setattr(rate_limit, "_backend", MemoryRateLimitBackend())
+
+        await check_rate_limit("auth", "10.0.0.1", per_minute=60, burst=1)
+        with pytest.raises(HTTPException) as exc_info:
+            await check_rate_limit("auth", "10.0.0.1", per_minute=60, burst=1)
+
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.headers["Retry-After"] == "1"
+
+    def test_client_ip_ignores_client_supplied_forwarded_entries(self, monkeypatch):
+        """Test that only the entry appended by the trusted proxy is used."""
+        from starlette.requests import Request
+
+        def request(forwarded: str) -> Request:
+            return Request({
+                "type": "http",
+                "headers": [(b"x-forwarded-for", forwarded.encode())],
+                "client": ("10.0.0.9", 1234),
+            })
+
+        monkeypatch.setattr(rate_limit.settings, "RATE_LIMIT_TRUSTED_PROXY_HOPS", 0)
+        assert rate_limit.client_ip(request("1.1.1.1")) == "10.0.0.9"
+
+        monkeypatch.setattr(rate_limit.settings, "RATE_LIMIT_TRUSTED_PROXY_HOPS", 1)
+        assert rate_limit.client_ip(request("6.6.6.6, 203.0.113.7")) == "203.0.113.7"
+        assert rate_limit.client_ip(request("203.0.113.7")) == "203.0.113.7"
+
+        monkeypatch.setattr(rate_limit.settings, "RATE_LIMIT_TRUSTED_PROXY_HOPS", 2)
+        assert rate_limit.client_ip(request("6.6.6.6, 203.0.113.7, 10.1.1.1")) == "203.0.113.7"
+        assert rate_limit.client_ip(request("203.0.113.7")) == "10.0.0.9"
+
+    @pytest.mark.asyncio
+    async def test_login_is_limited_per_account_across_ips(self, monkeypatch):
+        """Test that one account attacked from many IPs is eventually rejected."""
+        from starlette.requests import Request
+
+        from app.api import auth
+        from app.schemas.user_schemas import UserLogin
+
+        class RejectingAuthService:
+            def __init__(self, db):
+                pass
+
+            async def authenticate_user(self, login_data):
+                return None
+
+        monkeypatch.setattr(rate_limit, "_backend", MemoryRateLimitBackend())
+        monkeypatch.setattr(auth, "AuthService", RejectingAuthService)
+        monkeypatch.setattr(auth.settings, "RATE_LIMIT_LOGIN_EMAIL_BURST", 3)
+
+        statuses = []
+        for host in range(4):
+            request = Request({"type": "http", "headers": [], "client": (f"10.0.0.{host}", 1234)})
+            login_data = UserLogin(email="Victim@example.com", password="guess")
+            with pytest.raises(HTTPException) as exc_info:
+                await auth.login(login_data, request, None, db=None)
+            statuses.append(exc_info.value.status_code)
+
+        assert statuses == [401, 401, 401, 429]
@@ -0,0 +1,108 @@
+"""
+Unit tests for single-flight request coalescing.
+"""
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.cache import TTLCache
+from app.core.singleflight import SingleFlight
+from app.services.plan_cache import invalidate_plans, plan_cache
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+    """Test suite for sharing one in-flight call between callers."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        """Test that identical concurrent reads run the query once."""
+        flights = SingleFlight()
+        calls = []
+
+        async def load():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"id": 1}
+
+        results = await asyncio.gather(*[flights.do("plans", load) for _ in range(5)])
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert len(flights) == 0
+
+    @pytest.mark.asyncio
+    async def test_finished_call_is_not_reused(self):
+        """Test that a call after the previous one finished queries again."""
+        flights = SingleFlight()
+        calls = []
+
+        async def load():
+            calls.append(1)
+            return len(calls)
+
+        assert await flights.do("plans", load) == 1
+        assert await flights.do("plans", load) == 2
+
+    @pytest.mark.asyncio
+    async def test_error_reaches_every_waiter(self):
+        """Test that a failed query fails all waiters and is not remembered."""
+        flights = SingleFlight()
+
+        async def load():
+            await asyncio.sleep(0.01)
+            raise ValueError("db down")
+
+        results = await asyncio.gather(
+            *[flights.do("plans", load) for _ in range(3)],
+            return_exceptions=True
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert not flights.in_flight("plans")
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """Test that a disconnected client leaves the shared call running."""
+        flights = SingleFlight()
+
+        async def load():
+            await asyncio.sleep(0.02)
+            return "ok"
+
+        first = asyncio.ensure_future(flights.do("plans", load))
+        second = asyncio.ensure_future(flights.do("plans", load))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "ok"
+        assert first.cancelled()
+
+    def test_cache_generation_changes_on_eviction(self):
+        """Test that loaders can detect an eviction during their query."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        generation = cache.generation
+
+        cache.set("a", 1)
+        assert cache.generation == generation
+
+        cache.invalidate("a")
+        assert cache.generation != generation
+
+    @pytest.mark.asyncio
+    async def test_plan_invalidation_waits_for_commit(self):
+        """Test that cached plans are only dropped once the write commits."""
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        plan_cache.set(("plan", 1), b"{}")
+
+        async with AsyncSession(engine) as db:
+            await db.execute(text("SELECT 1"))
+            invalidate_plans(db, 1)
+            assert plan_cache.get(("plan", 1)) == b"{}"
+
+            await db.commit()
+            assert plan_cache.get(("plan", 1)) is None
+
+        await engine.dispose()
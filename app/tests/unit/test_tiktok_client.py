@@ -0,0 +1,72 @@
+"""
+Unit tests for the TikTok API client against a stubbed transport.
+"""
+import httpx
+import pytest
+
+from app.core.rate_limit import TokenBucket
+from app.services.tiktok_client import TikTokClient, TikTokAPIError
+
+
+def make_client(handler) -> TikTokClient:
+    return TikTokClient(
+        base_url="http://tiktok.test",
+        client_key="key",
+        client_secret="secret",
+        rate_limiter=TokenBucket(rate=1000, capacity=1000),
+        max_retries=2,
+        transport=httpx.MockTransport(handler)
+    )
+
+
+def token_response() -> httpx.Response:
+    return httpx.Response(200, json={"access_token": "token", "expires_in": 7200})
+
+
+@pytest.mark.unit
+class TestTikTokClient:
+    """Test suite for the rate-limited TikTok client."""
+    
+    @pytest.mark.asyncio
+    async def test_user_info_retries_throttled_requests(self):
+        """Test that 429 responses are retried and stats are mapped."""
+        calls = []
+        
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/v2/oauth/token/":
+                return token_response()
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            return httpx.Response(200, json={"data": {"follower_count": 1200, "video_count": 30}})
+        
+        async with make_client(handler) as client:
+            stats = await client.get_user_info("@creator")
+        
+        assert len(calls) == 2
+        assert calls[-1].headers["Authorization"] == "Bearer token"
+        assert stats["followers"] == 1200
+        assert stats["total_videos"] == 30
+    
+    @pytest.mark.asyncio
+    async def test_user_info_gives_up_after_max_retries(self):
+        """Test that persistent server errors raise TikTokAPIError."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/v2/oauth/token/":
+                return token_response()
+            return httpx.Response(503, headers={"Retry-After": "0"})
+        
+        async with make_client(handler) as client:
+            with pytest.raises(TikTokAPIError):
+                await client.get_user_info("creator")
+    
+    @pytest.mark.asyncio
+    async def test_unknown_user_returns_none(self):
+        """Test that missing accounts are reported as None."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/v2/oauth/token/":
+                return token_response()
+            return httpx.Response(404)
+        
+        async with make_client(handler) as client:
+            assert await client.get_user_info("ghost") is None